@@ -2,22 +2,47 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.const import Platform
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+    async_get_clientsession,
+)
+from homeassistant.helpers.storage import Store
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import EnergyUAApiClient
-from .const import CONF_GROUP, CONF_REGION, DOMAIN, LOGGER, UPDATE_INTERVAL
+from .batch import async_get_region_batch
+from .breaker import async_get_circuit_breaker
+from .cache import async_get_fetch_cache
+from .combine import EnergyUACombination
+from .const import (
+    CONF_ARCHIVE_RETENTION,
+    CONF_BATCH_MODE,
+    CONF_COMBINE_WITH,
+    CONF_GROUP,
+    CONF_OUTAGE_STATISTICS,
+    CONF_PERF_STATISTICS,
+    CONF_REGION,
+    CONF_REGION_SNAPSHOT,
+    DEFAULT_ARCHIVE_RETENTION,
+    DOMAIN,
+    LOGGER,
+    STORAGE_VERSION,
+    UPDATE_INTERVAL,
+)
 from .coordinator import EnergyUACoordinator
 from .data import EnergyUAData
+from .stats import EnergyUAStats
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .data import EnergyUAConfigEntry
 
-PLATFORMS: list[Platform] = [Platform.CALENDAR, Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.CALENDAR, Platform.SENSOR]
 
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
@@ -31,19 +56,50 @@ async def async_setup_entry(
         logger=LOGGER,
         name=DOMAIN,
         update_interval=UPDATE_INTERVAL,
+        always_update=False,
     )
+    stats = EnergyUAStats(enabled=entry.options.get(CONF_PERF_STATISTICS, False))
     entry.runtime_data = EnergyUAData(
         client=EnergyUAApiClient(
+            session=(
+                async_create_clientsession(hass, trace_configs=[stats.trace_config()])
+                if stats.enabled
+                else async_get_clientsession(hass)
+            ),
             region=entry.data[CONF_REGION],
             group=entry.data[CONF_GROUP],
+            fetch_cache=async_get_fetch_cache(hass),
+            archive_retention=timedelta(
+                days=entry.options.get(
+                    CONF_ARCHIVE_RETENTION, DEFAULT_ARCHIVE_RETENTION
+                )
+            ),
+            region_snapshot=entry.options.get(CONF_REGION_SNAPSHOT, False),
+            circuit_breaker=async_get_circuit_breaker(hass),
+            stats=stats,
         ),
         coordinator=coordinator,
         integration=async_get_loaded_integration(hass, entry.domain),
     )
 
+    if entry.options.get(CONF_BATCH_MODE, False):
+        batch = async_get_region_batch(hass, entry.data[CONF_REGION])
+        entry.async_on_unload(batch.async_add(coordinator))
+
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
     await coordinator.async_config_entry_first_refresh()
 
+    if combine_with := entry.options.get(CONF_COMBINE_WITH):
+        combination = EnergyUACombination(hass, entry.entry_id, combine_with)
+        entry.runtime_data.combination = combination
+        entry.async_on_unload(combination.async_start())
+
+    if entry.options.get(CONF_OUTAGE_STATISTICS, False):
+        if "recorder" in hass.config.components:
+            entry.async_on_unload(coordinator.async_track_outage_statistics())
+        else:
+            LOGGER.warning("Outage statistics need the recorder, which is not set up")
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -55,7 +111,17 @@ async def async_unload_entry(
     entry: EnergyUAConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        await entry.runtime_data.client.async_close()
+    return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: EnergyUAConfigEntry,
+) -> None:
+    """Remove data persisted for an entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
 
 
 async def async_reload_entry(
@@ -2,30 +2,66 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import hashlib
+import random
 import socket
-from datetime import datetime, time, timedelta
-from typing import Any, TypedDict
+from datetime import date, datetime, time, timedelta
+from http import HTTPStatus
+from operator import attrgetter
+from time import perf_counter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
 import aiohttp
-from bs4 import BeautifulSoup
 
-from .const import LOGGER
+from .const import LOGGER, REGION_SNAPSHOT_TTL
+from .parser import GROUP_PATH, SCHEDULE_DAYS, ScheduleEndFinder, get_parser
+from .periods import (
+    OutageArchive,
+    Period,
+    PeriodIndex,
+    PeriodsDiff,
+    diff_periods,
+)
+from .stats import (
+    COUNTER_BYTES,
+    COUNTER_NOT_MODIFIED,
+    COUNTER_PARSE_FAILURES,
+    COUNTER_REQUESTS,
+    COUNTER_RETRIES,
+    COUNTER_UNCHANGED,
+    PHASE_DOWNLOAD,
+    PHASE_MERGE,
+    PHASE_PARSE,
+    EnergyUAStats,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+    from .breaker import EnergyUACircuitBreaker
+    from .cache import EnergyUAFetchCache
+    from .parser import EnergyUAParser, Schedule
 
 UKRAINE_TZ = ZoneInfo("Europe/Kiev")
+SITE_HOST = "energy-ua.info"
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/131.0.0.0 Safari/537.36"
 )
-
-
-class PeriodDict(TypedDict):
-    """Represents a single period with start and end datetime."""
-
-    start: datetime
-    end: datetime
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+CONNECTION_LIMIT_PER_HOST = 4
+KEEPALIVE_TIMEOUT = 60
+FETCH_ATTEMPTS = 3
+RETRY_BACKOFF = 1.0
+RETRY_BACKOFF_MAX = 10.0
+MAX_BODY_SIZE = 2 * 1024 * 1024
+READ_CHUNK_SIZE = 16384
 
 
 class EnergyUAApiClientError(Exception):
@@ -38,36 +74,98 @@ class EnergyUAApiClientCommunicationError(
     """Exception to indicate a communication error."""
 
 
+class EnergyUAApiClientTransientError(
+    EnergyUAApiClientCommunicationError,
+):
+    """Exception to indicate a communication error worth retrying."""
+
+
+class EnergyUAApiClientCircuitOpenError(
+    EnergyUAApiClientCommunicationError,
+):
+    """Exception to indicate requests to the site are paused."""
+
+
+class LabelIndex:
+    """
+    Labels of regions or groups indexed by value and by label.
+
+    The index and its select options are shared by every caller until the
+    labels change, so they are read-only.
+    """
+
+    __slots__ = ("_positions", "labels", "options", "values")
+
+    def __init__(self, labels: Mapping[str, str] | None = None) -> None:
+        """Build the indexes and select options once."""
+        self.labels: Mapping[str, str] = MappingProxyType(dict(labels or {}))
+        self.values: Mapping[str, str] = MappingProxyType(
+            {label: value for value, label in reversed(self.labels.items())}
+        )
+        self.options: tuple[Mapping[str, str], ...] = tuple(
+            MappingProxyType({"value": value, "label": label})
+            for value, label in self.labels.items()
+        )
+        self._positions = {value: i for i, value in enumerate(self.labels)}
+
+    def option(self, value: str | None) -> Mapping[str, str] | None:
+        """Get the select option of a value."""
+        i = self._positions.get(value) if value is not None else None
+        return None if i is None else self.options[i]
+
+
 class EnergyUAApiClient:
     """EnergyUA API Client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
+        session: aiohttp.ClientSession | None = None,
         region: str | None = None,
         group: str | None = None,
+        fetch_cache: EnergyUAFetchCache | None = None,
+        parser: EnergyUAParser | None = None,
+        archive_retention: timedelta | None = None,
+        *,
+        region_snapshot: bool = False,
+        circuit_breaker: EnergyUACircuitBreaker | None = None,
+        stats: EnergyUAStats | None = None,
+        base_url: str | None = None,
+        max_body_size: int = MAX_BODY_SIZE,
     ) -> None:
-        """Initialize the EnergyUA API Client."""
+        """
+        Initialize the EnergyUA API Client.
+
+        With a base_url, pages are requested from a stand-in server as
+        {base_url}/{host}{path} instead of from the site itself. Pages larger
+        than max_body_size bytes are rejected.
+        """
         self.region = region
         self.group = group
-
-        self.regions: dict[str, str] = {}
-        self.groups: dict[str, str] = {}
-        self.periods: list[PeriodDict] = []
+        self.region_snapshot = region_snapshot
+        self.base_url = base_url and base_url.rstrip("/")
+        self.max_body_size = max_body_size
+
+        self._session = session
+        self._close_session = False
+        self._fetch_cache = fetch_cache
+        self._circuit_breaker = circuit_breaker
+        self.stats = stats or EnergyUAStats()
+        self._parser = parser or get_parser()
+        self._validators: dict[str, tuple[str | None, str | None, str]] = {}
+        self._periods_digest: str | None = None
+
+        self._regions = LabelIndex()
+        self._groups = LabelIndex()
+        self.periods = PeriodIndex()
+        self.last_diff = PeriodsDiff()
+        self.schedule_days = 0
+        self.fetched_at: datetime | None = None
+        self.archive = OutageArchive(UKRAINE_TZ, archive_retention)
 
     async def fetch_regions(self) -> None:
         """Fetch regions data."""
-        html = await self._fetch_html("https://energy-ua.info")
-        soup = BeautifulSoup(html, "html.parser")
-
-        self.regions = {"energy-ua.info": "Полтавська"}
-
-        for link in soup.select("ul.footer_regions_list a"):
-            href = link.get("href")
-            name = link.text.strip()
-            if isinstance(href, str) and "energy-ua.info" in href:
-                host = urlparse(href).netloc
-                if host and host not in self.regions:
-                    self.regions[host] = name
+        html = await self._fetch_html(self._url(SITE_HOST), shared=True)
+        self.regions = await self._async_parse(self._parse_regions, html)
 
         LOGGER.debug("Fetch regions data %s", self.regions)
 
@@ -79,175 +177,515 @@ class EnergyUAApiClient:
             )
             return
 
-        html = await self._fetch_html(f"https://{self.region}")
-        soup = BeautifulSoup(html, "html.parser")
-
-        self.groups = {}
-
-        for link in soup.select(".select_group_list a"):
-            href = link.get("href")
-            name = link.text.strip()
-            if isinstance(href, str):
-                group = href.split("/")[-1]
-                if group and group not in self.groups:
-                    self.groups[group] = name
+        html = await self._fetch_html(self._url(self.region), shared=True)
+        self.groups = await self._async_parse(self._parse_groups, html)
 
         LOGGER.debug("Fetch groups data %s", self.groups)
 
-    async def fetch_periods(self) -> None:
+    async def fetch_periods(self) -> bool:
         """Fetch periods for the configured region and group."""
         if not self.region or not self.group:
             LOGGER.warning(
                 "Region and Group must be set before fetching periods",
             )
-            return
+            return False
+
+        self.last_diff = PeriodsDiff()
+        today = datetime.now(UKRAINE_TZ).date()
+
+        if self.region_snapshot and (
+            snapshot := await self._fetch_region_snapshot(today)
+        ):
+            digest, schedule = snapshot
+            if digest == self._periods_digest:
+                LOGGER.debug("Region page is unchanged, skipping parse")
+                self.stats.count(COUNTER_UNCHANGED)
+                return False
+            return self._set_periods(schedule, digest, today)
+
+        html = await self._fetch_html(
+            self._url(self.region, f"{GROUP_PATH}{self.group}"), partial=True
+        )
+
+        digest = self._get_periods_digest(html, today)
+        if digest == self._periods_digest:
+            LOGGER.debug("Periods page is unchanged, skipping parse")
+            self.stats.count(COUNTER_UNCHANGED)
+            return False
+
+        schedule = await self._async_parse(self._parse_periods, html, today)
+        return self._set_periods(schedule, digest, today)
+
+    async def _fetch_region_snapshot(
+        self, today: date
+    ) -> tuple[str, tuple[PeriodIndex, int]] | None:
+        """
+        Get this group's periods from the schedule of the whole region.
+
+        The region page is parsed once for every group and shared with the
+        other clients through the fetch cache. Returns None when the page does
+        not carry a schedule for the configured group.
+        """
+        url = self._url(self.region or "")
+        html = await self._fetch_html(url, shared=True, ttl=REGION_SNAPSHOT_TTL)
+        digest = self._get_periods_digest(html, today)
+
+        snapshot: dict[str, tuple[PeriodIndex, int]] | None = None
+        if self._fetch_cache is not None:
+            snapshot = self._fetch_cache.get_parsed(url, digest)
+        if snapshot is None:
+            snapshot = await self._async_parse(self._parse_region_periods, html, today)
+            if self._fetch_cache is not None:
+                self._fetch_cache.set_parsed(url, digest, snapshot)
+
+        if (schedule := snapshot.get(self.group or "")) is None:
+            LOGGER.debug("No schedule for %s on the region page", self.group)
+            return None
+        return digest, schedule
+
+    def _set_periods(
+        self, schedule: tuple[PeriodIndex, int], digest: str, today: date
+    ) -> bool:
+        """
+        Replace the periods, returning whether they changed.
+
+        The old periods are archived first, so outages that already ended and
+        are no longer on the page, such as yesterday's last one, are kept.
+        """
+        self.archive.add(self.periods, datetime.now(UKRAINE_TZ))
+        periods, self.schedule_days = schedule
+        self.last_diff = diff_periods(
+            self.periods,
+            periods,
+            datetime.combine(today, time(), tzinfo=UKRAINE_TZ),
+        )
+        self.periods = periods
+        self._periods_digest = digest
+
+        LOGGER.debug("Fetch periods data %s, changes %s", self.periods, self.last_diff)
+        return bool(self.last_diff)
+
+    async def _async_parse[*Ts, T](
+        self,
+        func: Callable[[*Ts], T],
+        *args: *Ts,
+    ) -> T:
+        """Run a parse function in the executor, keeping the event loop free."""
+        started = perf_counter()
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(None, func, *args)
+        except Exception:
+            self.stats.count(COUNTER_PARSE_FAILURES)
+            raise
+
+        elapsed = perf_counter() - started
+        self.stats.record(PHASE_PARSE, elapsed)
+        LOGGER.debug("Parsed with %s in %.1f ms", func.__name__, elapsed * 1000)
+        return result
+
+    def _parse_regions(self, html: str) -> dict[str, str]:
+        """Parse regions from the main page."""
+        regions = {SITE_HOST: "Полтавська"}
+
+        for href, text in self._parser.parse_regions(html):
+            name = text.strip()
+            if href and SITE_HOST in href:
+                host = urlparse(href).netloc
+                if host and host not in regions:
+                    regions[host] = name
 
-        html = await self._fetch_html(f"https://{self.region}/cherga/{self.group}")
-        soup = BeautifulSoup(html, "html.parser")
+        return regions
 
-        self.periods = []
+    def _parse_groups(self, html: str) -> dict[str, str]:
+        """Parse groups from the region page."""
+        groups: dict[str, str] = {}
 
-        sections = soup.find_all("div", class_="scale_info")[:2]
-        for i, section in enumerate(sections):
-            day_date = datetime.now(UKRAINE_TZ).date() + timedelta(days=i)
+        for href, text in self._parser.parse_groups(html):
+            name = text.strip()
+            if href is not None:
+                group = href.split("/")[-1]
+                if group and group not in groups:
+                    groups[group] = name
 
-            for span in section.select("div.periods_items span"):
-                times = [b.get_text(strip=True) for b in span.find_all("b")[:2]]
+        return groups
 
-                if len(times) == 2:  # noqa: PLR2004
-                    start_str, end_str = times
+    def _parse_periods(self, html: str, today: date) -> tuple[PeriodIndex, int]:
+        """Parse merged periods and the number of published days."""
+        return self._build_periods(self._parser.parse_periods(html), today)
 
-                    start_time = time.fromisoformat(start_str)
-                    end_time = time.fromisoformat(end_str)
+    def _parse_region_periods(
+        self, html: str, today: date
+    ) -> dict[str, tuple[PeriodIndex, int]]:
+        """Parse merged periods of every group published on the region page."""
+        return {
+            group: self._build_periods(schedule, today)
+            for group, schedule in self._parser.parse_region_periods(html).items()
+        }
 
-                    start_dt = datetime.combine(day_date, start_time, tzinfo=UKRAINE_TZ)
-                    end_dt = datetime.combine(day_date, end_time, tzinfo=UKRAINE_TZ)
+    def _build_periods(
+        self, schedule: Schedule, today: date
+    ) -> tuple[PeriodIndex, int]:
+        """Turn day sections of time strings into merged periods."""
+        periods: list[Period] = []
 
-                    if end_dt <= start_dt:
-                        end_dt += timedelta(days=1)
+        for i, section in enumerate(schedule):
+            day_date = today + timedelta(days=i)
 
-                    self.periods.append({"start": start_dt, "end": end_dt})
+            for start_str, end_str in section:
+                start_time = time.fromisoformat(start_str)
+                end_time = time.fromisoformat(end_str)
 
-        self.periods = self._merge_periods(self.periods)
+                start_dt = datetime.combine(day_date, start_time, tzinfo=UKRAINE_TZ)
+                end_dt = datetime.combine(day_date, end_time, tzinfo=UKRAINE_TZ)
 
-        LOGGER.debug("Fetch periods data %s", self.periods)
+                if end_dt <= start_dt:
+                    end_dt += timedelta(days=1)
 
-    async def _fetch_html(self, url: str) -> str:
-        """Fetch HTML content from the given URL."""
+                periods.append(Period.from_datetimes(start_dt, end_dt))
+
+        with self.stats.measure(PHASE_MERGE):
+            index = self._merge_periods(periods)
+        return index, len(schedule)
+
+    def _url(self, host: str, path: str = "") -> str:
+        """Build the URL of a page on the site or on the stand-in server."""
+        if self.base_url:
+            return f"{self.base_url}/{host}{path}"
+        return f"https://{host}{path}"
+
+    async def _fetch_html(
+        self,
+        url: str,
+        *,
+        shared: bool = False,
+        ttl: timedelta | None = None,
+        partial: bool = False,
+    ) -> str:
+        """
+        Fetch HTML content, sharing it with other clients if requested.
+
+        With partial, the page is only kept up to the end of the schedule.
+        Shared pages are always read in full, other clients may need the rest.
+        """
+        if shared and self._fetch_cache is not None:
+            return await self._fetch_cache.async_get(url, self._fetch_url, ttl)
+        return await self._fetch_url(url, partial=partial)
+
+    async def _fetch_url(self, url: str, *, partial: bool = False) -> str:
+        """Fetch HTML content, retrying transient errors with backoff."""
+        host = urlparse(url).netloc
+        breaker = self._circuit_breaker
+
+        if breaker is not None and not breaker.allow(host):
+            msg = (
+                f"Requests to {host} are paused after repeated failures, "
+                f"retrying in {breaker.retry_after(host):.0f} s"
+            )
+            raise EnergyUAApiClientCircuitOpenError(msg)
+
+        attempt = 1
+        while True:
+            try:
+                html = await self._request_url(url, partial=partial)
+            except EnergyUAApiClientTransientError as exception:
+                if attempt == FETCH_ATTEMPTS:
+                    if breaker is not None:
+                        breaker.record_failure(host)
+                    raise
+
+                delay = random.uniform(  # noqa: S311
+                    0, min(RETRY_BACKOFF * 2 ** (attempt - 1), RETRY_BACKOFF_MAX)
+                )
+                LOGGER.debug(
+                    "Attempt %s for %s failed, retrying in %.1f s: %s",
+                    attempt,
+                    url,
+                    delay,
+                    exception,
+                )
+                self.stats.count(COUNTER_RETRIES)
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                if breaker is not None:
+                    breaker.record_success(host)
+                return html
+
+    async def _request_url(self, url: str, *, partial: bool = False) -> str:
+        """Fetch HTML content from the given URL, revalidating a cached copy."""
+        headers = {"User-Agent": USER_AGENT}
+
+        etag, last_modified, cached_html = self._validators.get(url, (None, None, ""))
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        self.stats.count(COUNTER_REQUESTS)
         try:
-            async with (
-                aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}) as session,
-                session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response,
-            ):
+            async with self._get_session().get(
+                url,
+                headers=headers,
+                timeout=REQUEST_TIMEOUT,
+            ) as response:
+                if (
+                    response.status == HTTPStatus.NOT_MODIFIED
+                    and url in self._validators
+                ):
+                    LOGGER.debug("Not modified %s", url)
+                    self.stats.count(COUNTER_NOT_MODIFIED)
+                    return cached_html
+
                 response.raise_for_status()
-                return await response.text()
-        except (aiohttp.ClientError, socket.gaierror) as exception:
+                with self.stats.measure(PHASE_DOWNLOAD):
+                    html = await self._read_body(response, partial=partial)
+                self.stats.count(COUNTER_BYTES, response.content.total_bytes)
+        except EnergyUAApiClientError:
+            raise
+        except aiohttp.ClientResponseError as exception:
             msg = f"Error fetching HTML - {exception}"
+            if (
+                exception.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+                or exception.status == HTTPStatus.TOO_MANY_REQUESTS
+            ):
+                raise EnergyUAApiClientTransientError(msg) from exception
             raise EnergyUAApiClientCommunicationError(msg) from exception
+        except (aiohttp.ClientError, socket.gaierror, TimeoutError) as exception:
+            msg = f"Error fetching HTML - {exception}"
+            raise EnergyUAApiClientTransientError(msg) from exception
         except Exception as exception:  # pylint: disable=broad-except
             msg = f"Something really wrong happened! - {exception}"
             raise EnergyUAApiClientError(msg) from exception
 
-    def get_regions(self) -> list[dict]:
-        """Get a list of regions."""
-        regions_list = []
-
-        for value, label in self.regions.items():
-            region = {"value": value, "label": label}
-            regions_list.append(region)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators[url] = (etag, last_modified, html)
+        else:
+            self._validators.pop(url, None)
+
+        return html
+
+    async def _read_body(
+        self, response: aiohttp.ClientResponse, *, partial: bool = False
+    ) -> str:
+        """
+        Read and decode the body in chunks, up to the maximum body size.
+
+        With partial, decoding stops once every day section has arrived and
+        the page is cut right after them. The rest of the body is still read
+        and discarded, so the connection can go back to the pool.
+        """
+        try:
+            decoder = codecs.getincrementaldecoder(response.charset or "utf-8")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")
+        decode = decoder(errors="replace").decode
+        finder = ScheduleEndFinder() if partial else None
+
+        parts: list[str] = []
+        size = 0
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.max_body_size:
+                msg = f"Page {response.url} is larger than {self.max_body_size} bytes"
+                raise EnergyUAApiClientCommunicationError(msg)
+
+            text = decode(chunk)
+            parts.append(text)
+            if finder is not None and (cut := finder.feed(text)) is not None:
+                LOGGER.debug(
+                    "Read %s bytes of %s up to the schedule", size, response.url
+                )
+                await self._discard_body(response, self.max_body_size - size)
+                return "".join(parts)[:cut]
+
+        parts.append(decode(b"", final=True))
+        return "".join(parts)
 
-        return regions_list
+    @staticmethod
+    async def _discard_body(response: aiohttp.ClientResponse, limit: int) -> None:
+        """
+        Read the rest of the body without keeping it.
+
+        Past limit bytes the connection is closed instead, as reading on
+        would cost more than opening a new one.
+        """
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            limit -= len(chunk)
+            if limit < 0:
+                response.close()
+                return
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session, creating a pooled one if none was provided."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ),
+            )
+            self._close_session = True
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the HTTP session if it is owned by this client."""
+        if self._session and self._close_session:
+            await self._session.close()
+        self._session = None
+        self._close_session = False
+
+    @property
+    def regions(self) -> Mapping[str, str]:
+        """Get region labels by value."""
+        return self._regions.labels
+
+    @regions.setter
+    def regions(self, regions: Mapping[str, str]) -> None:
+        if regions != self._regions.labels:
+            self._regions = LabelIndex(regions)
+
+    @property
+    def groups(self) -> Mapping[str, str]:
+        """Get group labels by value."""
+        return self._groups.labels
+
+    @groups.setter
+    def groups(self, groups: Mapping[str, str]) -> None:
+        if groups != self._groups.labels:
+            self._groups = LabelIndex(groups)
+
+    def get_regions(self) -> Sequence[Mapping[str, str]]:
+        """Get regions as select options."""
+        return self._regions.options
 
     def get_region_by_value(
         self, value: str, *, only_label: bool = False
-    ) -> dict[str, str] | str | None:
+    ) -> Mapping[str, str] | str | None:
         """Get region data by value."""
-        label = self.regions.get(value)
-
-        if label is None or only_label:
-            return label
+        if only_label:
+            return self._regions.labels.get(value)
+        return self._regions.option(value)
 
-        return {"value": value, "label": label}
-
-    def get_region_by_label(self, label: str) -> dict | None:
+    def get_region_by_label(self, label: str) -> Mapping[str, str] | None:
         """Get region data by label."""
-        for region in self.get_regions():
-            if region["label"] == label:
-                return region
-        return None
-
-    def get_groups(self) -> list[dict]:
-        """Get a list of groups."""
-        groups_list = []
+        return self._regions.option(self._regions.values.get(label))
 
-        for value, label in self.groups.items():
-            group = {"value": value, "label": label}
-            groups_list.append(group)
-
-        return groups_list
+    def get_groups(self) -> Sequence[Mapping[str, str]]:
+        """Get groups as select options."""
+        return self._groups.options
 
     def get_group_by_value(
         self, value: str, *, only_label: bool = False
-    ) -> dict | str | None:
+    ) -> Mapping[str, str] | str | None:
         """Get group data by value."""
-        label = self.groups.get(value)
-
-        if label is None or only_label:
-            return label
+        if only_label:
+            return self._groups.labels.get(value)
+        return self._groups.option(value)
 
-        return {"value": value, "label": label}
-
-    def get_group_by_label(self, label: str) -> dict | None:
+    def get_group_by_label(self, label: str) -> Mapping[str, str] | None:
         """Get group data by label."""
-        for group in self.get_groups():
-            if group["label"] == label:
-                return group
-        return None
+        return self._groups.option(self._groups.values.get(label))
 
-    def get_period_at(self, at: datetime) -> PeriodDict | None:
+    def get_period_at(self, at: datetime) -> Period | None:
         """Get period that includes the specified datetime."""
-        for period in self.periods:
-            if period["start"] <= at <= period["end"]:
-                return period
-        return None
+        return self.periods.period_at(at)
 
-    def get_periods_between(self, start: datetime, end: datetime) -> list[PeriodDict]:
+    def get_periods_between(self, start: datetime, end: datetime) -> Sequence[Period]:
         """Get all periods that overlap with the specified datetime range."""
-        return [
-            period
-            for period in self.periods
-            if period["start"] <= end and period["end"] >= start
-        ]
+        periods = self.periods.periods_between(start, end)
+
+        if periods and periods[0].start_ts <= start.timestamp():
+            return periods
+
+        if not (archived := self.archive.periods_between(start, end)):
+            return periods
+
+        return self._merge_periods([*archived, *periods])
+
+    def get_all_periods(self) -> PeriodIndex:
+        """Get archived and current periods merged into one index."""
+        if not len(self.archive):
+            return self.periods
+
+        return self._merge_periods([*self.archive, *self.periods])
+
+    @property
+    def has_tomorrow(self) -> bool:
+        """Return whether the schedule for tomorrow has been published."""
+        return self.schedule_days >= SCHEDULE_DAYS
 
     def get_region_label(self) -> str:
         """Get current region label."""
-        label = self.get_region_by_value(self.region or "", only_label=True)
-        return label if isinstance(label, str) else ""
+        return self.regions.get(self.region or "", "")
 
     def get_group_label(self) -> str:
         """Get current group label."""
-        label = self.get_group_by_value(self.group or "", only_label=True)
-        return label if isinstance(label, str) else ""
+        return self.groups.get(self.group or "", "")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize fetched data for storage."""
+        return {
+            "regions": dict(self.regions),
+            "groups": dict(self.groups),
+            "periods": [
+                [period.start.isoformat(), period.end.isoformat()]
+                for period in self.periods
+            ],
+            "archive": self.archive.as_packed(),
+            "fetched_at": self.fetched_at and self.fetched_at.isoformat(),
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore data previously serialized with as_dict."""
+        self.regions = dict(data.get("regions", {}))
+        self.groups = dict(data.get("groups", {}))
+        self.periods = self._merge_periods(
+            [
+                Period.from_datetimes(
+                    datetime.fromisoformat(start),
+                    datetime.fromisoformat(end),
+                    UKRAINE_TZ,
+                )
+                for start, end in data.get("periods", [])
+            ]
+        )
+
+        if archive := data.get("archive"):
+            self.archive.load_packed(archive)
+        self.archive.add(self.periods, datetime.now(UKRAINE_TZ))
+        if fetched_at := data.get("fetched_at"):
+            self.fetched_at = datetime.fromisoformat(fetched_at)
+
+        LOGGER.debug("Restored data %s", data)
 
     async def async_get_data(self) -> Any:
         """Get data from the API."""
         await self.fetch_periods()
-        return {}
+        self.fetched_at = datetime.now(UKRAINE_TZ)
+        self.archive.add(self.periods, self.fetched_at)
+        return {"periods": self.periods}
 
     @staticmethod
-    def _merge_periods(periods: list[PeriodDict]) -> list[PeriodDict]:
-        if not periods:
-            return []
+    def _get_periods_digest(html: str, day: date) -> str:
+        """Hash the part of the page that carries the schedule."""
+        start = html.find("scale_info")
+        end = html.find("footer_regions_list", start)
+        section = html[max(start, 0) : end if end > start else None]
 
-        periods.sort(key=lambda x: x["start"])
-        merged = [periods[0]]
+        digest = hashlib.sha256(day.isoformat().encode())
+        digest.update(section.encode())
+        return digest.hexdigest()
 
-        for current in periods[1:]:
-            last = merged[-1]
+    @staticmethod
+    def _merge_periods(periods: Iterable[Period]) -> PeriodIndex:
+        merged: list[Period] = []
 
-            if current["start"] <= last["end"]:
-                last["end"] = max(last["end"], current["end"])
-            else:
+        for current in sorted(periods, key=attrgetter("start_ts")):
+            if not merged or current.start_ts > merged[-1].end_ts:
                 merged.append(current)
+            elif current.end_ts > (last := merged[-1]).end_ts:
+                merged[-1] = Period(last.start_ts, current.end_ts, last.tz)
 
-        return merged
+        return PeriodIndex(merged)
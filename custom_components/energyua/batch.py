@@ -0,0 +1,117 @@
+"""Batched polling of EnergyUA config entries sharing a region."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    BATCH_PARALLEL_REQUESTS,
+    DOMAIN,
+    LOGGER,
+    MAX_UPDATE_INTERVAL,
+    UPDATE_INTERVAL,
+)
+from .coordinator import with_jitter
+
+if TYPE_CHECKING:
+    from datetime import datetime, timedelta
+
+    from .coordinator import EnergyUACoordinator
+
+DATA_REGION_BATCHES: HassKey[dict[str, EnergyUARegionBatch]] = HassKey(
+    f"{DOMAIN}_region_batches"
+)
+
+
+class EnergyUARegionBatch:
+    """Refresh the batched coordinators of a region on one shared schedule."""
+
+    def __init__(self, hass: HomeAssistant, region: str) -> None:
+        """Initialize the batch."""
+        self.hass = hass
+        self.region = region
+        self.coordinators: set[EnergyUACoordinator] = set()
+        self.interval: timedelta = UPDATE_INTERVAL
+
+        self._semaphore = asyncio.Semaphore(BATCH_PARALLEL_REQUESTS)
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, coordinator: EnergyUACoordinator) -> CALLBACK_TYPE:
+        """Add a coordinator to the batch and return a callback removing it."""
+        self.coordinators.add(coordinator)
+        coordinator.batch = self
+        coordinator.update_interval = None
+        self._schedule_refresh()
+
+        @callback
+        def remove() -> None:
+            self.coordinators.discard(coordinator)
+            coordinator.batch = None
+
+            if not self.coordinators:
+                self._cancel_refresh()
+                self.hass.data[DATA_REGION_BATCHES].pop(self.region, None)
+
+        return remove
+
+    async def async_refresh(self) -> None:
+        """Refresh all coordinators with bounded parallelism."""
+        LOGGER.debug(
+            "Refreshing %s batched groups of %s",
+            len(self.coordinators),
+            self.region,
+        )
+
+        await asyncio.gather(
+            *(self._async_refresh_one(coordinator) for coordinator in self.coordinators)
+        )
+
+        if self.coordinators:
+            self._schedule_refresh()
+
+    async def _async_refresh_one(self, coordinator: EnergyUACoordinator) -> None:
+        async with self._semaphore:
+            await coordinator.async_refresh()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh at the shortest interval of the members."""
+        self._cancel_refresh()
+
+        self.interval = with_jitter(
+            min(
+                (coordinator.poll_interval for coordinator in self.coordinators),
+                default=MAX_UPDATE_INTERVAL,
+            )
+        )
+
+        LOGGER.debug("Next batched update of %s in %s", self.region, self.interval)
+
+        self._unsub_refresh = async_call_later(
+            self.hass, self.interval, self._handle_refresh
+        )
+
+    @callback
+    def _cancel_refresh(self) -> None:
+        if self._unsub_refresh:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    async def _handle_refresh(self, _now: datetime) -> None:
+        self._unsub_refresh = None
+        await self.async_refresh()
+
+
+@callback
+def async_get_region_batch(hass: HomeAssistant, region: str) -> EnergyUARegionBatch:
+    """Get the batch polling all batched config entries of a region."""
+    batches = hass.data.setdefault(DATA_REGION_BATCHES, {})
+    if (batch := batches.get(region)) is None:
+        batch = batches[region] = EnergyUARegionBatch(hass, region)
+    return batch
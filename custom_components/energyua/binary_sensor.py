@@ -0,0 +1,93 @@
+"""Binary sensor platform for EnergyUA."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.const import EntityCategory
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .entity import EnergyUAEntity
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import EnergyUACoordinator
+    from .data import EnergyUAConfigEntry
+
+
+@dataclass(frozen=True, kw_only=True)
+class EnergyUABinarySensorDescription(BinarySensorEntityDescription):
+    """EnergyUA binary entity description."""
+
+    is_on_func: Callable[[EnergyUACoordinator], bool]
+
+
+ENTITY_DESCRIPTIONS = (
+    EnergyUABinarySensorDescription(
+        key="stale",
+        translation_key="stale",
+        icon="mdi:cloud-alert",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        is_on_func=lambda coordinator: coordinator.is_stale,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: EnergyUAConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the binary sensor platform."""
+    async_add_entities(
+        EnergyUABinarySensor(
+            coordinator=entry.runtime_data.coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in ENTITY_DESCRIPTIONS
+    )
+
+
+class EnergyUABinarySensor(EnergyUAEntity, BinarySensorEntity):
+    """EnergyUA binary sensor class."""
+
+    entity_description: EnergyUABinarySensorDescription
+
+    def __init__(
+        self,
+        coordinator: EnergyUACoordinator,
+        entity_description: EnergyUABinarySensorDescription,
+    ) -> None:
+        """Initialize the binary sensor class."""
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}-{self.entity_description.key}"
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to every refresh, as a stale schedule leaves data unchanged."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self.coordinator.diagnostics_signal,
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether the problem is present."""
+        return self.entity_description.is_on_func(self.coordinator)
@@ -0,0 +1,88 @@
+"""Per-host circuit breaker for EnergyUA requests."""
+
+from __future__ import annotations
+
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    DOMAIN,
+    LOGGER,
+)
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+DATA_CIRCUIT_BREAKER: HassKey[EnergyUACircuitBreaker] = HassKey(
+    f"{DOMAIN}_circuit_breaker"
+)
+
+
+class EnergyUACircuitBreaker:
+    """Stop requesting a host for a while after repeated failures."""
+
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+        cooldown: timedelta = CIRCUIT_BREAKER_COOLDOWN,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self._threshold = threshold
+        self._cooldown = cooldown.total_seconds()
+        self._failures: dict[str, int] = {}
+        self._opened: dict[str, float] = {}
+
+    def allow(self, host: str) -> bool:
+        """
+        Return whether a request to the host may be made.
+
+        Once the cooldown has passed a single trial request is let through,
+        and the breaker stays open for everyone else until it completes.
+        """
+        if (opened := self._opened.get(host)) is None:
+            return True
+        if monotonic() - opened < self._cooldown:
+            return False
+
+        LOGGER.debug("Trying %s again after cooldown", host)
+        self._opened[host] = monotonic()
+        return True
+
+    def retry_after(self, host: str) -> float:
+        """Get the seconds left until the host may be requested again."""
+        if (opened := self._opened.get(host)) is None:
+            return 0
+        return max(0, self._cooldown - (monotonic() - opened))
+
+    def record_success(self, host: str) -> None:
+        """Close the breaker after a successful request."""
+        self._failures.pop(host, None)
+        if self._opened.pop(host, None) is not None:
+            LOGGER.info("Requests to %s succeed again", host)
+
+    def record_failure(self, host: str) -> None:
+        """Count a failed request, opening the breaker at the threshold."""
+        failures = self._failures[host] = self._failures.get(host, 0) + 1
+
+        if host in self._opened or failures >= self._threshold:
+            if host not in self._opened:
+                LOGGER.warning(
+                    "Pausing requests to %s for %s s after %s failures",
+                    host,
+                    self._cooldown,
+                    failures,
+                )
+            self._opened[host] = monotonic()
+
+
+@callback
+def async_get_circuit_breaker(hass: HomeAssistant) -> EnergyUACircuitBreaker:
+    """Get the circuit breaker shared by all config entries."""
+    if (breaker := hass.data.get(DATA_CIRCUIT_BREAKER)) is None:
+        breaker = hass.data[DATA_CIRCUIT_BREAKER] = EnergyUACircuitBreaker()
+    return breaker
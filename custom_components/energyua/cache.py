@@ -0,0 +1,100 @@
+"""Shared fetch cache for EnergyUA."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, FETCH_CACHE_TTL, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from datetime import timedelta
+
+DATA_FETCH_CACHE: HassKey[EnergyUAFetchCache] = HassKey(f"{DOMAIN}_fetch_cache")
+
+
+class EnergyUAFetchCache:
+    """Cache of fetched pages shared by all EnergyUA clients."""
+
+    def __init__(self, ttl: timedelta = FETCH_CACHE_TTL) -> None:
+        """Initialize the fetch cache."""
+        self._ttl = ttl.total_seconds()
+        self._entries: dict[str, tuple[float, str]] = {}
+        self._inflight: dict[str, asyncio.Task[str]] = {}
+        self._parsed: dict[str, tuple[str, Any]] = {}
+        self.counters: Counter[str] = Counter()
+
+    async def async_get(
+        self,
+        url: str,
+        fetch: Callable[[str], Awaitable[str]],
+        ttl: timedelta | None = None,
+    ) -> str:
+        """
+        Get a page from the cache, fetching it once for all concurrent callers.
+
+        A shorter ttl lets callers that need fresher data than the default
+        reuse the same cached page.
+        """
+        max_age = self._ttl if ttl is None else ttl.total_seconds()
+        if (entry := self._entries.get(url)) is not None:
+            fetched, html = entry
+            if monotonic() - fetched < max_age:
+                LOGGER.debug("Fetch cache hit for %s", url)
+                self.counters["hits"] += 1
+                return html
+            del self._entries[url]
+
+        if (task := self._inflight.get(url)) is None:
+            task = asyncio.get_running_loop().create_task(self._async_fetch(url, fetch))
+            self._inflight[url] = task
+            self.counters["misses"] += 1
+        else:
+            LOGGER.debug("Joining in-flight fetch for %s", url)
+            self.counters["joined"] += 1
+
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self,
+        url: str,
+        fetch: Callable[[str], Awaitable[str]],
+    ) -> str:
+        """Fetch a page and remember when it was fetched."""
+        try:
+            html = await fetch(url)
+        finally:
+            del self._inflight[url]
+
+        self._entries[url] = (monotonic(), html)
+        return html
+
+    def get_parsed(self, url: str, digest: str) -> Any | None:
+        """Get data parsed from a page, if the page has not changed since."""
+        if (entry := self._parsed.get(url)) is not None and entry[0] == digest:
+            self.counters["parsed_hits"] += 1
+            return entry[1]
+        return None
+
+    def set_parsed(self, url: str, digest: str, data: Any) -> None:
+        """Store data parsed from a page for other clients."""
+        self._parsed[url] = (digest, data)
+
+    def invalidate(self, url: str) -> None:
+        """Drop a cached page."""
+        self._entries.pop(url, None)
+        self._parsed.pop(url, None)
+
+
+@callback
+def async_get_fetch_cache(hass: HomeAssistant) -> EnergyUAFetchCache:
+    """Get the fetch cache shared by all config entries."""
+    if (cache := hass.data.get(DATA_FETCH_CACHE)) is None:
+        cache = hass.data[DATA_FETCH_CACHE] = EnergyUAFetchCache()
+    return cache
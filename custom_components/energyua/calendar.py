@@ -11,7 +11,9 @@ from homeassistant.components.calendar import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
+from .const import DOMAIN
 from .entity import EnergyUAEntity
 
 if TYPE_CHECKING:
@@ -20,8 +22,10 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .combine import EnergyUACombination
     from .coordinator import EnergyUACoordinator
     from .data import EnergyUAConfigEntry
+    from .periods import Period
 
 ENTITY_DESCRIPTIONS = (
     CalendarEntityDescription(
@@ -29,6 +33,12 @@ ENTITY_DESCRIPTIONS = (
     ),
 )
 
+COMBINED_DESCRIPTION = CalendarEntityDescription(
+    key="combined_outages",
+    translation_key="combined_outages",
+    icon="mdi:calendar-multiple",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
@@ -36,13 +46,23 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the calendar platform."""
-    async_add_entities(
+    entities: list[CalendarEntity] = [
         EnergyUACalendar(
             coordinator=entry.runtime_data.coordinator,
             entity_description=entity_description,
         )
         for entity_description in ENTITY_DESCRIPTIONS
-    )
+    ]
+    if (combination := entry.runtime_data.combination) is not None:
+        entities.append(
+            EnergyUACombinedCalendar(
+                coordinator=entry.runtime_data.coordinator,
+                combination=combination,
+                entity_description=COMBINED_DESCRIPTION,
+            )
+        )
+
+    async_add_entities(entities)
 
 
 class EnergyUACalendar(EnergyUAEntity, CalendarEntity):
@@ -75,3 +95,61 @@ class EnergyUACalendar(EnergyUAEntity, CalendarEntity):
     ) -> list[CalendarEvent]:
         """Return calendar events within a datetime range."""
         return self.coordinator.get_events_between(start_date, end_date)
+
+
+class EnergyUACombinedCalendar(EnergyUAEntity, CalendarEntity):
+    """EnergyUA calendar of the times no combined group has power."""
+
+    entity_description: CalendarEntityDescription
+
+    def __init__(
+        self,
+        coordinator: EnergyUACoordinator,
+        combination: EnergyUACombination,
+        entity_description: CalendarEntityDescription,
+    ) -> None:
+        """Initialize the calendar class."""
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+        self._combination = combination
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}-{self.entity_description.key}"
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to changes of the combined state."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._combination.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current event or None."""
+        period = self._combination.all_outages.period_at(dt_util.now())
+        return None if period is None else self._event(period)
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,  # noqa: ARG002
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Return calendar events within a datetime range."""
+        return [
+            self._event(period)
+            for period in self._combination.all_outages.periods_between(
+                start_date, end_date
+            )
+        ]
+
+    def _event(self, period: Period) -> CalendarEvent:
+        """Create the event of a combined outage."""
+        return CalendarEvent(
+            start=period.start,
+            end=period.end,
+            summary=self.coordinator.translations.get(
+                f"component.{DOMAIN}.common.combined_outage", "No power at any group"
+            ),
+            description=", ".join(self._combination.group_labels),
+        )
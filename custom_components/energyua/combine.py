@@ -0,0 +1,207 @@
+"""Schedules combined from several EnergyUA groups."""
+
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+from functools import reduce
+from operator import and_, or_
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import dt as dt_util
+
+from .api import UKRAINE_TZ
+from .const import (
+    COMBINE_SLOTS_PER_DAY,
+    LOGGER,
+    STATE_NORMAL,
+    STATE_OUTAGE,
+    STATE_PARTIAL,
+    TIMEFRAME_TO_CHECK,
+)
+from .coordinator import refresh_signal
+from .parser import SCHEDULE_DAYS
+from .periods import PeriodIndex, PowerState, StateTimeline
+from .scheduler import async_get_transition_scheduler
+from .slots import SlotMap
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .data import EnergyUAConfigEntry
+
+SECONDS_PER_DAY = 86400
+
+
+class EnergyUACombination:
+    """
+    Outages of several groups combined with slot bitmaps.
+
+    The merged periods of every group are turned into slot maps over the
+    same window. Their union has an outage whenever at least one group is
+    without power, their intersection whenever all of them are. The maps
+    are only rebuilt when the schedule of one of the groups changes.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        member_ids: Iterable[str],
+        slots_per_day: int = COMBINE_SLOTS_PER_DAY,
+    ) -> None:
+        """Initialize the combination of an entry with other entries."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self.member_ids = (entry_id, *(i for i in member_ids if i != entry_id))
+        self.slot = SECONDS_PER_DAY // slots_per_day
+
+        self.any_outages = PeriodIndex()
+        self.all_outages = PeriodIndex()
+        self.partial_outages = PeriodIndex()
+        self.group_labels: tuple[str, ...] = ()
+        self.current_state = STATE_NORMAL
+        self.state = PowerState(outage=False, next_outage=None, next_restore=None)
+
+        self._sources: tuple[PeriodIndex, ...] = ()
+        self._timelines: tuple[StateTimeline, StateTimeline] | None = None
+        self._listeners: list[Callable[[], None]] = []
+        self._scheduler = async_get_transition_scheduler(hass)
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow the refreshes of the groups, returning a callback to stop."""
+        unsubs = [
+            async_dispatcher_connect(
+                self.hass, refresh_signal(entry_id), self.async_recompute
+            )
+            for entry_id in self.member_ids
+        ]
+        self.async_recompute()
+
+        @callback
+        def stop() -> None:
+            for unsub in unsubs:
+                unsub()
+            self._scheduler.async_cancel(self._state_update_key)
+
+        return stop
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for changes of the combined state."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _members(self) -> list[EnergyUAConfigEntry]:
+        """
+        Get the entries of the combined groups that have a schedule.
+
+        Entries still being set up are included once their first refresh
+        has finished, which is when they send their first refresh signal.
+        """
+        members = []
+        for entry_id in self.member_ids:
+            entry = self.hass.config_entries.async_get_entry(entry_id)
+            if (
+                entry is not None
+                and entry.state
+                in (ConfigEntryState.LOADED, ConfigEntryState.SETUP_IN_PROGRESS)
+                and (data := getattr(entry, "runtime_data", None)) is not None
+                and data.coordinator.data is not None
+            ):
+                members.append(entry)
+        return members
+
+    @callback
+    def async_recompute(self) -> None:
+        """Combine the schedules again if one of them changed."""
+        members = self._members()
+        sources = tuple(entry.runtime_data.client.periods for entry in members)
+        if len(sources) == len(self._sources) and all(
+            new is old for new, old in zip(sources, self._sources, strict=True)
+        ):
+            return
+
+        self._sources = sources
+        self.group_labels = tuple(
+            entry.runtime_data.coordinator.group_label for entry in members
+        )
+
+        start = int(
+            datetime.combine(
+                datetime.now(UKRAINE_TZ).date(), time(), tzinfo=UKRAINE_TZ
+            ).timestamp()
+        )
+        size = SECONDS_PER_DAY // self.slot * (SCHEDULE_DAYS + 1)
+        maps = [
+            SlotMap.from_periods(periods, start, self.slot, size) for periods in sources
+        ]
+
+        if maps:
+            any_outage = reduce(or_, maps)
+            all_outage = reduce(and_, maps)
+            self.any_outages = any_outage.to_periods(UKRAINE_TZ)
+            self.all_outages = all_outage.to_periods(UKRAINE_TZ)
+            self.partial_outages = (any_outage - all_outage).to_periods(UKRAINE_TZ)
+        else:
+            self.any_outages = self.all_outages = self.partial_outages = PeriodIndex()
+
+        LOGGER.debug(
+            "Combined %s groups: %s full and %s partial outages",
+            len(maps),
+            len(self.all_outages),
+            len(self.partial_outages),
+        )
+
+        now = dt_util.now()
+        self._timelines = (
+            StateTimeline(self.all_outages, now, TIMEFRAME_TO_CHECK),
+            StateTimeline(self.partial_outages, now, timedelta(0)),
+        )
+        self._update_state(now)
+
+    @callback
+    def _update_state(self, now: datetime) -> None:
+        """Update the combined state and schedule its next change."""
+        if self._timelines is None:
+            return
+
+        full, partial = self._timelines
+        self.state = full.state_at(now)
+        if self.state.outage:
+            self.current_state = STATE_OUTAGE
+        elif partial.state_at(now).outage:
+            self.current_state = STATE_PARTIAL
+        else:
+            self.current_state = STATE_NORMAL
+
+        changes = [
+            change
+            for change in (full.next_change(now), partial.next_change(now))
+            if change is not None
+        ]
+        if changes:
+            self._scheduler.async_schedule(
+                self._state_update_key, min(changes), self._handle_state_update
+            )
+        else:
+            self._scheduler.async_cancel(self._state_update_key)
+
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def _handle_state_update(self, _now: datetime) -> None:
+        self._update_state(dt_util.now())
+
+    @property
+    def _state_update_key(self) -> tuple[str, str]:
+        return (self.entry_id, "combined")
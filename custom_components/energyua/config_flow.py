@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers import selector
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from slugify import slugify
 
 from .api import (
@@ -14,7 +17,24 @@ from .api import (
     EnergyUAApiClientCommunicationError,
     EnergyUAApiClientError,
 )
-from .const import CONF_GROUP, CONF_REGION, DOMAIN, LOGGER
+from .breaker import async_get_circuit_breaker
+from .cache import async_get_fetch_cache
+from .const import (
+    CONF_ARCHIVE_RETENTION,
+    CONF_BATCH_MODE,
+    CONF_COMBINE_WITH,
+    CONF_GROUP,
+    CONF_OUTAGE_STATISTICS,
+    CONF_PERF_STATISTICS,
+    CONF_REGION,
+    CONF_REGION_SNAPSHOT,
+    DEFAULT_ARCHIVE_RETENTION,
+    DOMAIN,
+    LOGGER,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
 
 
 class EnergyUAFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -24,9 +44,25 @@ class EnergyUAFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         """Initialize config flow."""
-        self.client = EnergyUAApiClient()
         self.data: dict[str, Any] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> EnergyUAOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return EnergyUAOptionsFlowHandler()
+
+    @cached_property
+    def client(self) -> EnergyUAApiClient:
+        """Get the API client bound to the shared HTTP session."""
+        return EnergyUAApiClient(
+            session=async_get_clientsession(self.hass),
+            fetch_cache=async_get_fetch_cache(self.hass),
+            circuit_breaker=async_get_circuit_breaker(self.hass),
+        )
+
     async def async_step_user(
         self,
         user_input: dict[str, Any] | None = None,
@@ -97,27 +133,51 @@ class EnergyUAFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
-def _build_region_schema(
-    client: EnergyUAApiClient,
-) -> vol.Schema:
-    """Build the schema for the region selection step."""
-    regions = client.get_regions()
+class EnergyUAOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for EnergyUA."""
 
-    region_options: list[selector.SelectOptionDict] = [
-        selector.SelectOptionDict(
-            value=region["value"],
-            label=region["label"],
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            LOGGER.debug("Options updated: %s", user_input)
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=_build_options_schema(
+                options=self.config_entry.options,
+                entries=[
+                    selector.SelectOptionDict(value=entry.entry_id, label=entry.title)
+                    for entry in self.hass.config_entries.async_entries(DOMAIN)
+                    if entry.entry_id != self.config_entry.entry_id
+                ],
+            ),
         )
-        for region in regions
+
+
+def _select_options(
+    options: Iterable[Mapping[str, str]],
+) -> list[selector.SelectOptionDict]:
+    """Copy read-only label options into options for a select selector."""
+    return [
+        selector.SelectOptionDict(value=option["value"], label=option["label"])
+        for option in options
     ]
 
+
+def _build_region_schema(
+    client: EnergyUAApiClient,
+) -> vol.Schema:
+    """Build the schema for the region selection step."""
     return vol.Schema(
         {
             vol.Required(
                 CONF_REGION,
             ): selector.SelectSelector(
                 selector.SelectSelectorConfig(
-                    options=region_options,
+                    options=_select_options(client.get_regions()),
                     translation_key="region",
                 ),
             ),
@@ -129,25 +189,67 @@ def _build_group_schema(
     client: EnergyUAApiClient,
 ) -> vol.Schema:
     """Build the schema for the group selection step."""
-    groups = client.get_groups()
-
-    group_options: list[selector.SelectOptionDict] = [
-        selector.SelectOptionDict(
-            value=group["value"],
-            label=group["label"],
-        )
-        for group in groups
-    ]
-
     return vol.Schema(
         {
             vol.Required(
                 CONF_GROUP,
             ): selector.SelectSelector(
                 selector.SelectSelectorConfig(
-                    options=group_options,
+                    options=_select_options(client.get_groups()),
                     translation_key="group",
                 ),
             ),
         },
     )
+
+
+def _build_options_schema(
+    options: Mapping[str, Any],
+    entries: list[selector.SelectOptionDict],
+) -> vol.Schema:
+    """Build the schema for the options step."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_ARCHIVE_RETENTION,
+                default=options.get(CONF_ARCHIVE_RETENTION, DEFAULT_ARCHIVE_RETENTION),
+            ): vol.All(
+                selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=3650,
+                        step=1,
+                        unit_of_measurement="d",
+                        mode=selector.NumberSelectorMode.BOX,
+                    ),
+                ),
+                vol.Coerce(int),
+            ),
+            vol.Required(
+                CONF_BATCH_MODE,
+                default=options.get(CONF_BATCH_MODE, False),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_REGION_SNAPSHOT,
+                default=options.get(CONF_REGION_SNAPSHOT, False),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_PERF_STATISTICS,
+                default=options.get(CONF_PERF_STATISTICS, False),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_OUTAGE_STATISTICS,
+                default=options.get(CONF_OUTAGE_STATISTICS, False),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_COMBINE_WITH,
+                default=[
+                    entry_id
+                    for entry_id in options.get(CONF_COMBINE_WITH, [])
+                    if any(entry["value"] == entry_id for entry in entries)
+                ],
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(options=entries, multiple=True),
+            ),
+        },
+    )
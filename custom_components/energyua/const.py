@@ -10,11 +10,39 @@ DOMAIN: Final = "energyua"
 
 CONF_REGION: Final = "region"
 CONF_GROUP: Final = "group"
+CONF_ARCHIVE_RETENTION: Final = "archive_retention"
+CONF_BATCH_MODE: Final = "batch_mode"
+CONF_REGION_SNAPSHOT: Final = "region_snapshot"
+CONF_PERF_STATISTICS: Final = "performance_statistics"
+CONF_COMBINE_WITH: Final = "combine_with"
+CONF_OUTAGE_STATISTICS: Final = "outage_statistics"
+
+DEFAULT_ARCHIVE_RETENTION: Final = 90
+
+EVENT_SCHEDULE_CHANGED: Final = f"{DOMAIN}_schedule_changed"
 
 STATE_NORMAL: Final = "normal"
 STATE_OUTAGE: Final = "outage"
+STATE_PARTIAL: Final = "partial"
 
 UPDATE_INTERVAL: Final = timedelta(minutes=15)
+MIN_UPDATE_INTERVAL: Final = timedelta(minutes=5)
+MAX_UPDATE_INTERVAL: Final = timedelta(hours=1)
+MISSING_TOMORROW_INTERVAL: Final = timedelta(minutes=10)
+UPDATE_INTERVAL_JITTER: Final = 0.1
+BATCH_PARALLEL_REQUESTS: Final = 3
 TIMEFRAME_TO_CHECK: Final = timedelta(hours=24)
+FETCH_CACHE_TTL: Final = timedelta(hours=1)
+REGION_SNAPSHOT_TTL: Final = timedelta(minutes=2)
+CIRCUIT_BREAKER_THRESHOLD: Final = 5
+CIRCUIT_BREAKER_COOLDOWN: Final = timedelta(minutes=5)
+STALE_DATA_MAX_AGE: Final = timedelta(hours=12)
+COUNTDOWN_RESOLUTION: Final = timedelta(minutes=1)
+COMBINE_SLOTS_PER_DAY: Final = 96
+STATISTICS_PERIOD: Final = timedelta(hours=1)
+STATISTICS_IMPORT_DELAY: Final = timedelta(minutes=1)
+
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 10
 
 ATTRIBUTION: Final = "Data provided by https://energy-ua.info"
@@ -2,28 +2,82 @@
 
 from __future__ import annotations
 
+import math
+import random
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.calendar import CalendarEvent
-from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.translation import async_get_translations
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
 
-from .api import EnergyUAApiClientError, PeriodDict
+from .api import EnergyUAApiClientError
 from .const import (
+    CONF_GROUP,
+    CONF_REGION,
+    COUNTDOWN_RESOLUTION,
     DOMAIN,
+    EVENT_SCHEDULE_CHANGED,
     LOGGER,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    MISSING_TOMORROW_INTERVAL,
+    STALE_DATA_MAX_AGE,
     STATE_NORMAL,
     STATE_OUTAGE,
+    STATISTICS_IMPORT_DELAY,
+    STATISTICS_PERIOD,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
     TIMEFRAME_TO_CHECK,
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_JITTER,
+)
+from .periods import PowerState, StateTimeline
+from .scheduler import async_get_transition_scheduler
+from .slots import outage_seconds
+from .stats import (
+    COUNTER_REFRESH_FAILURES,
+    COUNTER_REFRESHES,
+    COUNTER_SCHEDULED_UPDATES,
+    COUNTER_STALE,
+    PHASE_LISTENERS,
+    PHASE_TIMELINE,
+    PHASE_UPDATE,
+    EnergyUAStats,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from datetime import datetime
+    from datetime import datetime, timedelta
 
+    from .batch import EnergyUARegionBatch
     from .data import EnergyUAConfigEntry
+    from .periods import PeriodIndex
+    from .scheduler import EnergyUATransitionScheduler
+
+
+def refresh_signal(entry_id: str) -> str:
+    """Get the dispatcher signal sent after every refresh of a config entry."""
+    return f"{DOMAIN}_{entry_id}_diagnostics"
+
+
+def with_jitter(interval: timedelta) -> timedelta:
+    """Spread an interval randomly so entries do not poll at the same moment."""
+    return interval * random.uniform(  # noqa: S311
+        1 - UPDATE_INTERVAL_JITTER, 1 + UPDATE_INTERVAL_JITTER
+    )
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -33,25 +87,204 @@ class EnergyUACoordinator(DataUpdateCoordinator):
     config_entry: EnergyUAConfigEntry
     translations: dict[str, str]
 
-    _unsub_next_state_update: Callable[[], None] | None
+    _scheduler: EnergyUATransitionScheduler
+    _store: Store[dict[str, Any]]
+    _serve_restored: bool
+    _timeline: StateTimeline | None
+    _state: PowerState
+    _poll_interval: timedelta = UPDATE_INTERVAL
+    _event_text: tuple[str, str] = ("", "")
+    _event_source: tuple[PeriodIndex, int] | None = None
+    _event_periods: PeriodIndex
+    _events: list[CalendarEvent | None]
+    _countdown_listeners: list[Callable[[], None]]
+    _time_to_outage: int | None = None
+    _time_to_restore: int | None = None
+    _outage_duration: int | None = None
+    _status: str | None = None
+    _statistics_until: int | None = None
+    _statistics_sum: float = 0.0
+
+    is_stale: bool = False
+    batch: EnergyUARegionBatch | None = None
 
     async def _async_setup(self) -> None:
-        self._unsub_next_state_update = None
+        self._scheduler = async_get_transition_scheduler(self.hass)
+        self._countdown_listeners = []
+        self._timeline = None
+        self._state = PowerState(outage=False, next_outage=None, next_restore=None)
+        self._store = Store(
+            self.hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.{self.config_entry.entry_id}",
+        )
 
         await self.async_fetch_translations()
+
+        self._serve_restored = await self._async_restore()
+        if self._serve_restored:
+            return
+
         await self.config_entry.runtime_data.client.fetch_regions()
         await self.config_entry.runtime_data.client.fetch_groups()
 
     async def _async_update_data(self) -> Any:
         """Update data via library."""
+        if self._serve_restored:
+            self._serve_restored = False
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_revalidate(),
+                name=f"{DOMAIN} - {self.config_entry.title} - revalidate",
+                eager_start=False,
+            )
+            self._build_timeline()
+            self._schedule_state_update()
+            return {"periods": self.config_entry.runtime_data.client.periods}
+
+        client = self.config_entry.runtime_data.client
+        archive_revision = client.archive.revision
+        self.stats.count(COUNTER_REFRESHES)
+
         try:
-            data = await self.config_entry.runtime_data.client.async_get_data()
+            with self.stats.measure(PHASE_UPDATE):
+                data = await client.async_get_data()
         except EnergyUAApiClientError as exception:
-            raise UpdateFailed(exception) from exception
+            self.stats.count(COUNTER_REFRESH_FAILURES)
+            self._adapt_update_interval(min(self._poll_interval, UPDATE_INTERVAL))
+            if not self._can_serve_stale():
+                raise UpdateFailed(exception) from exception
+
+            self.stats.count(COUNTER_STALE)
+            if not self.is_stale:
+                LOGGER.warning(
+                    "Unable to refresh the schedule, keeping the one fetched at %s: %s",
+                    client.fetched_at,
+                    exception,
+                )
+                self.is_stale = True
+            return self.data
         else:
+            if self.is_stale:
+                LOGGER.info("Schedule refresh succeeded again")
+                self.is_stale = False
+
+            if data != self.data or client.archive.revision != archive_revision:
+                self._schedule_save()
+
+            if self.data is not None and client.last_diff:
+                self._adapt_update_interval(MIN_UPDATE_INTERVAL)
+            elif client.has_tomorrow:
+                self._adapt_update_interval(self._poll_interval * 2)
+            else:
+                self._adapt_update_interval(MISSING_TOMORROW_INTERVAL)
+
+            if data == self.data:
+                return data
+
+            if self.data is not None and client.last_diff:
+                self._fire_schedule_changed()
+
+            self._build_timeline()
             self._schedule_state_update()
             return data
 
+    def _can_serve_stale(self) -> bool:
+        """Return whether the last good schedule is recent enough to keep."""
+        fetched_at = self.config_entry.runtime_data.client.fetched_at
+        return (
+            self.data is not None
+            and fetched_at is not None
+            and dt_util.now() - fetched_at < STALE_DATA_MAX_AGE
+        )
+
+    def _adapt_update_interval(self, interval: timedelta) -> None:
+        """Set the polling interval, clamped and spread with jitter."""
+        self._poll_interval = max(
+            MIN_UPDATE_INTERVAL, min(interval, MAX_UPDATE_INTERVAL)
+        )
+
+        if self.batch is not None:
+            return
+
+        self.update_interval = with_jitter(self._poll_interval)
+
+        LOGGER.debug("Next update in %s", self.update_interval)
+
+    @property
+    def poll_interval(self) -> timedelta:
+        """Get the polling interval wanted by the schedule, without jitter."""
+        return self._poll_interval
+
+    @property
+    def effective_update_interval(self) -> timedelta | None:
+        """Get the interval of the next refresh, including batched polling."""
+        if self.batch is not None:
+            return self.batch.interval
+        return self.update_interval
+
+    @property
+    def stats(self) -> EnergyUAStats:
+        """Get the timings and counters of the fetch and schedule paths."""
+        return self.config_entry.runtime_data.client.stats
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the fan-out."""
+        with self.stats.measure(PHASE_LISTENERS):
+            super().async_update_listeners()
+
+    @property
+    def diagnostics_signal(self) -> str:
+        """Get the dispatcher signal sent after every refresh."""
+        return refresh_signal(self.config_entry.entry_id)
+
+    def _async_refresh_finished(self) -> None:
+        """Let diagnostic entities update even when data is unchanged."""
+        self._resolve_event_text()
+        async_dispatcher_send(self.hass, self.diagnostics_signal)
+
+    def _fire_schedule_changed(self) -> None:
+        """Fire an event describing how the schedule changed."""
+        client = self.config_entry.runtime_data.client
+
+        self.hass.bus.async_fire(
+            EVENT_SCHEDULE_CHANGED,
+            {
+                "entry_id": self.config_entry.entry_id,
+                "region": client.region,
+                "group": client.group,
+                **client.last_diff.as_dict(),
+            },
+        )
+
+    async def _async_restore(self) -> bool:
+        """Restore regions, groups and periods saved by a previous run."""
+        if not (data := await self._store.async_load()):
+            return False
+
+        self.config_entry.runtime_data.client.restore(data)
+        return True
+
+    async def _async_revalidate(self) -> None:
+        """Refresh restored data from the site in the background."""
+        client = self.config_entry.runtime_data.client
+
+        try:
+            await client.fetch_regions()
+            await client.fetch_groups()
+        except EnergyUAApiClientError as exception:
+            LOGGER.warning("Unable to revalidate regions and groups: %s", exception)
+
+        await self.async_refresh()
+
+    def _schedule_save(self) -> None:
+        """Persist fetched data so the next start does not wait for the site."""
+        self._store.async_delay_save(
+            self.config_entry.runtime_data.client.as_dict,
+            STORAGE_SAVE_DELAY,
+        )
+
     async def async_fetch_translations(self) -> None:
         """Fetch translations."""
         self.translations = await async_get_translations(
@@ -71,26 +304,66 @@ class EnergyUACoordinator(DataUpdateCoordinator):
         """Get the configured group label."""
         return self.config_entry.runtime_data.client.get_group_label()
 
+    @property
+    def fetched_at(self) -> datetime | None:
+        """Get when the schedule was last fetched from the site."""
+        return self.config_entry.runtime_data.client.fetched_at
+
     @property
     def current_state(self) -> str:
         """Get the current state."""
-        period = self.config_entry.runtime_data.client.get_period_at(dt_util.now())
-        LOGGER.debug("Current state: %s", period)
-        return STATE_OUTAGE if period else STATE_NORMAL
+        return STATE_OUTAGE if self._state.outage else STATE_NORMAL
 
     @property
     def next_outage(self) -> datetime | None:
         """Get the next outage time."""
-        dt = self._get_next_power_change_dt(restore=False)
-        LOGGER.debug("Next outage: %s", dt)
-        return dt
+        return self._state.next_outage
 
     @property
     def next_restore(self) -> datetime | None:
         """Get the next restore time."""
-        dt = self._get_next_power_change_dt(restore=True)
-        LOGGER.debug("Next restore: %s", dt)
-        return dt
+        return self._state.next_restore
+
+    @property
+    def time_to_outage(self) -> int | None:
+        """Get the minutes left until the next outage."""
+        return self._time_to_outage
+
+    @property
+    def time_to_restore(self) -> int | None:
+        """Get the minutes left until power is restored."""
+        return self._time_to_restore
+
+    @property
+    def outage_duration(self) -> int | None:
+        """Get the length in minutes of the current outage, or else the next."""
+        return self._outage_duration
+
+    @property
+    def status(self) -> str | None:
+        """Get a short summary of the current state for widgets."""
+        return self._status
+
+    @callback
+    def async_add_countdown_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """
+        Listen for countdown changes between state updates.
+
+        The countdown timer only runs while somebody listens.
+        """
+        self._countdown_listeners.append(update_callback)
+        if len(self._countdown_listeners) == 1:
+            self._refresh_countdown()
+
+        @callback
+        def remove_listener() -> None:
+            self._countdown_listeners.remove(update_callback)
+            if not self._countdown_listeners:
+                self._cancel_countdown()
+
+        return remove_listener
 
     def get_current_event(self) -> CalendarEvent | None:
         """Get the event at the present time."""
@@ -98,8 +371,9 @@ class EnergyUACoordinator(DataUpdateCoordinator):
 
     def get_event_at(self, at: datetime) -> CalendarEvent | None:
         """Get the event at a given time."""
-        period = self.config_entry.runtime_data.client.get_period_at(at)
-        return period and self._get_calendar_event(period)
+        periods = self._get_event_periods()
+        i = periods.position_at(at)
+        return None if i is None else self._get_event(i)
 
     def get_events_between(
         self,
@@ -107,70 +381,338 @@ class EnergyUACoordinator(DataUpdateCoordinator):
         end_date: datetime,
     ) -> list[CalendarEvent]:
         """Get all events."""
-        periods = self.config_entry.runtime_data.client.get_periods_between(
-            start_date, end_date
+        positions = self._get_event_periods().slice_between(start_date, end_date)
+        return [
+            self._get_event(i) for i in range(*positions.indices(len(self._events)))
+        ]
+
+    def _get_event_periods(self) -> PeriodIndex:
+        """
+        Get archived and current periods for calendar events.
+
+        The periods are merged on first use after the periods, the archive
+        or the labels change. Their events are created when first asked for
+        and shared by every query until then.
+        """
+        client = self.config_entry.runtime_data.client
+        source = (client.periods, client.archive.revision)
+
+        if (
+            self._event_source is None
+            or self._event_source[0] is not source[0]
+            or self._event_source[1] != source[1]
+        ):
+            self._event_periods = client.get_all_periods()
+            self._events = [None] * len(self._event_periods)
+            self._event_source = source
+
+        return self._event_periods
+
+    def _get_event(self, i: int) -> CalendarEvent:
+        """Get the calendar event of an event period."""
+        if (event := self._events[i]) is None:
+            period = self._event_periods[i]
+            summary, description = self._event_text
+            event = self._events[i] = CalendarEvent(
+                start=period.start,
+                end=period.end,
+                summary=summary,
+                description=description,
+            )
+        return event
+
+    def _resolve_event_text(self) -> None:
+        """Resolve the event summary and description once per refresh."""
+        text = (
+            self.translations.get(
+                f"component.{DOMAIN}.common.electricity_outage", "Power outage"
+            ),
+            f"{self.region_label} {self.group_label}",
         )
-        return [self._get_calendar_event(period) for period in periods]
 
-    def _get_calendar_event(self, period: PeriodDict) -> CalendarEvent:
-        summary = self.translations.get(
-            f"component.{DOMAIN}.common.electricity_outage", "Power outage"
-        )
-        description = f"{self.region_label} {self.group_label}"
+        if text != self._event_text:
+            self._event_text = text
+            self._event_source = None
 
-        return CalendarEvent(
-            start=period["start"],
-            end=period["end"],
-            summary=summary,
-            description=description,
+    def _build_timeline(self) -> None:
+        """Precompute state transitions for the current periods."""
+        now = dt_util.now()
+        with self.stats.measure(PHASE_TIMELINE):
+            self._timeline = StateTimeline(
+                self.config_entry.runtime_data.client.periods,
+                now,
+                TIMEFRAME_TO_CHECK,
+            )
+        self._state = self._timeline.state_at(now)
+        self._render_state(now)
+
+        LOGGER.debug(
+            "Built timeline with %s transitions, current state: %s",
+            len(self._timeline),
+            self._state,
         )
 
-    def _get_next_power_change_dt(self, *, restore: bool) -> datetime | None:
-        now = dt_util.now()
-        periods = self.config_entry.runtime_data.client.get_periods_between(
-            now, now + TIMEFRAME_TO_CHECK
+    def _render_state(self, now: datetime) -> None:
+        """Prepare the widget values derived from the current state."""
+        state = self._state
+        outage_start = state.next_outage
+        if state.outage:
+            period = self.config_entry.runtime_data.client.periods.period_at(now)
+            outage_start = period.start if period else None
+
+        self._outage_duration = None
+        if (
+            outage_start is not None
+            and state.next_restore is not None
+            and outage_start < state.next_restore
+        ):
+            self._outage_duration = round(
+                (state.next_restore - outage_start) / COUNTDOWN_RESOLUTION
+            )
+
+        if state.outage and state.next_restore:
+            self._status = self._status_text("status_restore_at", state.next_restore)
+        elif state.outage:
+            self._status = self._status_text("electricity_outage")
+        elif state.next_outage:
+            self._status = self._status_text("status_outage_at", state.next_outage)
+        else:
+            self._status = self._status_text("status_no_outages")
+
+        self._refresh_countdown(now)
+
+    def _status_text(self, key: str, at: datetime | None = None) -> str:
+        """Render a status from its translation."""
+        text = self.translations.get(f"component.{DOMAIN}.common.{key}", key)
+        if at is None:
+            return text
+        return text.format(time=dt_util.as_local(at).strftime("%H:%M"))
+
+    def _refresh_countdown(self, now: datetime | None = None) -> None:
+        """
+        Recompute the countdowns and schedule the tick where one changes next.
+
+        Countdowns are rounded up to whole minutes, so they only change on
+        minute boundaries counted back from their target. The last minute
+        ends with a state transition, which refreshes them anyway.
+        """
+        self._cancel_countdown()
+        now = now or dt_util.now()
+        targets = (self._state.next_outage, self._state.next_restore)
+        self._time_to_outage, self._time_to_restore = (
+            _minutes_until(target, now) for target in targets
         )
 
-        key = "end" if restore else "start"
-        return min((p[key] for p in periods if p[key] > now), default=None)
+        if not self._countdown_listeners:
+            return
+
+        ticks = [
+            target - COUNTDOWN_RESOLUTION * (minutes - 1)
+            for target, minutes in zip(
+                targets, (self._time_to_outage, self._time_to_restore), strict=True
+            )
+            if target is not None and minutes is not None and minutes > 1
+        ]
+        if ticks:
+            self._scheduler.async_schedule(
+                self._countdown_key, min(ticks), self._handle_countdown_tick
+            )
+
+    def _cancel_countdown(self) -> None:
+        """Cancel the next countdown tick."""
+        self._scheduler.async_cancel(self._countdown_key)
+
+    @property
+    def _countdown_key(self) -> tuple[str, str]:
+        return (self.config_entry.entry_id, "countdown")
+
+    @callback
+    def _handle_countdown_tick(self, now: datetime) -> None:
+        """Update countdown listeners when a countdown changes."""
+        self._refresh_countdown(now)
+        for update_callback in list(self._countdown_listeners):
+            update_callback()
 
     def _schedule_state_update(self) -> None:
-        """Schedule state update at the next outage or restore time."""
+        """Schedule state update at the next transition of the timeline."""
         self._cancel_state_update()
 
-        now = dt_util.now()
+        if not self._timeline:
+            return
 
-        candidates = (self.next_outage, self.next_restore)
-        next_change = min(
-            (dt for dt in candidates if dt and dt > now),
-            default=None,
-        )
+        next_change = self._timeline.next_change(dt_util.now())
 
         if not next_change:
             return
 
         LOGGER.debug("Scheduling state update at %s", next_change)
 
-        self._unsub_next_state_update = async_track_point_in_time(
-            self.hass,
-            self._handle_scheduled_state_update,
+        self._scheduler.async_schedule(
+            self._state_update_key,
             next_change,
+            self._handle_scheduled_state_update,
         )
 
     def _cancel_state_update(self) -> None:
         """Cancel any scheduled state update."""
-        if self._unsub_next_state_update:
-            self._unsub_next_state_update()
-            self._unsub_next_state_update = None
+        self._scheduler.async_cancel(self._state_update_key)
 
-    async def _handle_scheduled_state_update(self, _now: datetime) -> None:
+    @property
+    def _state_update_key(self) -> tuple[str, str]:
+        return (self.config_entry.entry_id, "state")
+
+    @callback
+    def _handle_scheduled_state_update(self, _now: datetime) -> None:
         """Handle state change based on outage schedule."""
-        LOGGER.debug("Current state changed, updating listeners")
+        self.stats.count(COUNTER_SCHEDULED_UPDATES)
+        if self._timeline:
+            now = dt_util.now()
+            self._state = self._timeline.state_at(now)
+            self._render_state(now)
+
+        LOGGER.debug("Current state changed to %s, updating listeners", self._state)
 
         self.async_update_listeners()
         self._schedule_state_update()
 
+    @property
+    def statistic_id(self) -> str:
+        """Get the id of the long-term statistic of outage minutes."""
+        region = self.config_entry.data[CONF_REGION].partition(".")[0]
+        group = self.config_entry.data[CONF_GROUP]
+        return f"{DOMAIN}:{slugify(f'{region} {group} outages')}"
+
+    @callback
+    def async_track_outage_statistics(self) -> CALLBACK_TYPE:
+        """Import outage minutes every hour, returning a callback to stop."""
+        self._scheduler.async_schedule(
+            self._statistics_key, dt_util.utcnow(), self._handle_statistics_import
+        )
+
+        @callback
+        def stop() -> None:
+            self._scheduler.async_cancel(self._statistics_key)
+
+        return stop
+
+    @property
+    def _statistics_key(self) -> tuple[str, str]:
+        return (self.config_entry.entry_id, "statistics")
+
+    @callback
+    def _handle_statistics_import(self, _now: datetime) -> None:
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_import_statistics(),
+            name=f"{DOMAIN} - {self.config_entry.title} - import statistics",
+        )
+
+    async def _async_import_statistics(self) -> None:
+        """
+        Import outage minutes of the hours completed since the last import.
+
+        The next import is scheduled after this one completes or fails, but
+        not when it is cancelled because the entry is unloaded.
+        """
+        hour = int(STATISTICS_PERIOD.total_seconds())
+        end = int(dt_util.utcnow().timestamp()) // hour * hour
+
+        try:
+            await self._async_add_statistics(hour, end)
+        except Exception:  # noqa: BLE001
+            LOGGER.exception("Error importing outage statistics")
+
+        self._scheduler.async_schedule(
+            self._statistics_key,
+            dt_util.utc_from_timestamp(end + hour) + STATISTICS_IMPORT_DELAY,
+            self._handle_statistics_import,
+        )
+
+    async def _async_add_statistics(self, hour: int, end: int) -> None:
+        """
+        Add the outage minutes of every hour not imported yet before end.
+
+        The end of the last imported hour and the running sum are read from
+        the recorder once and then kept, so later imports only compute and
+        add the hours that passed since.
+        """
+        start = await self._async_statistics_start(hour, end)
+        if start >= end:
+            return
+
+        client = self.config_entry.runtime_data.client
+        periods = client.get_periods_between(
+            dt_util.utc_from_timestamp(start), dt_util.utc_from_timestamp(end)
+        )
+        total = self._statistics_sum
+        statistics = []
+        for i, seconds in enumerate(
+            outage_seconds(periods, start, hour, (end - start) // hour)
+        ):
+            minutes = seconds / 60
+            total += minutes
+            statistics.append(
+                StatisticData(
+                    start=dt_util.utc_from_timestamp(start + i * hour),
+                    state=minutes,
+                    sum=total,
+                )
+            )
+
+        LOGGER.debug(
+            "Importing %s hours of outage statistics into %s",
+            len(statistics),
+            self.statistic_id,
+        )
+        async_add_external_statistics(
+            self.hass,
+            StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{self.region_label} {self.group_label} "
+                f"{self._status_text('outage_statistic')}",
+                source=DOMAIN,
+                statistic_id=self.statistic_id,
+                unit_of_measurement=UnitOfTime.MINUTES,
+            ),
+            statistics,
+        )
+        self._statistics_until = end
+        self._statistics_sum = total
+
+    async def _async_statistics_start(self, hour: int, end: int) -> int:
+        """Get the start of the first hour that is not imported yet."""
+        if self._statistics_until is not None:
+            return self._statistics_until
+
+        statistic_id = self.statistic_id
+        last = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics,
+            self.hass,
+            1,
+            statistic_id,
+            True,  # noqa: FBT003
+            {"sum"},
+        )
+        if rows := last.get(statistic_id):
+            self._statistics_sum = rows[0].get("sum") or 0.0
+            return int(rows[0]["start"]) + hour
+
+        periods = self.config_entry.runtime_data.client.get_all_periods()
+        if not periods:
+            return end
+        return min(periods[0].start_ts // hour * hour, end)
+
     async def async_shutdown(self) -> None:
         """Cancel any scheduled updates on shutdown."""
         self._cancel_state_update()
+        self._cancel_countdown()
+        self._scheduler.async_cancel(self._statistics_key)
         await super().async_shutdown()
+
+
+def _minutes_until(target: datetime | None, now: datetime) -> int | None:
+    """Count the minutes until a time, rounded up."""
+    if target is None:
+        return None
+    return max(0, math.ceil((target - now) / COUNTDOWN_RESOLUTION))
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from homeassistant.loader import Integration
 
     from .api import EnergyUAApiClient
+    from .combine import EnergyUACombination
     from .coordinator import EnergyUACoordinator
 
 
@@ -23,3 +24,4 @@ class EnergyUAData:
     client: EnergyUAApiClient
     coordinator: EnergyUACoordinator
     integration: Integration
+    combination: EnergyUACombination | None = None
@@ -0,0 +1,55 @@
+"""Diagnostics support for EnergyUA."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .cache import async_get_fetch_cache
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import EnergyUAConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    entry: EnergyUAConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+
+    return {
+        "entry": {
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "client": {
+            "region": client.region,
+            "group": client.group,
+            "regions": len(client.regions),
+            "groups": len(client.groups),
+            "periods": len(client.periods),
+            "schedule_days": client.schedule_days,
+            "archived_periods": len(client.archive),
+            "fetched_at": client.fetched_at,
+            "region_snapshot": client.region_snapshot,
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "is_stale": coordinator.is_stale,
+            "poll_interval": coordinator.poll_interval.total_seconds(),
+            "update_interval": (
+                interval.total_seconds()
+                if (interval := coordinator.effective_update_interval)
+                else None
+            ),
+            "batched": coordinator.batch is not None,
+            "state": coordinator.current_state,
+            "next_outage": coordinator.next_outage,
+            "next_restore": coordinator.next_restore,
+        },
+        "statistics": client.stats.as_dict(),
+        "fetch_cache": dict(async_get_fetch_cache(hass).counters),
+    }
@@ -0,0 +1,480 @@
+"""HTML parser backends for EnergyUA pages."""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+from importlib.util import find_spec
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+PARSER_STREAM = "stream"
+PARSER_SOUP = "soup"
+PARSER_LXML = "lxml"
+PARSER_AUTO = "auto"
+
+GROUP_PATH = "/cherga/"
+FEED_CHUNK_SIZE = 16384
+SCHEDULE_DAYS = 2
+MAX_TAG_LENGTH = 1024
+
+VOID_ELEMENTS = frozenset(
+    (
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    )
+)
+
+type Link = tuple[str | None, str]
+type Schedule = list[list[tuple[str, str]]]
+
+
+class EnergyUAParser(ABC):
+    """Extract the data EnergyUA needs from the site pages."""
+
+    name: str
+
+    @abstractmethod
+    def parse_regions(self, html: str) -> list[Link]:
+        """Return (href, text) of every link in the footer regions list."""
+
+    @abstractmethod
+    def parse_groups(self, html: str) -> list[Link]:
+        """Return (href, text) of every link in the group selector."""
+
+    @abstractmethod
+    def parse_periods(self, html: str) -> Schedule:
+        """Return (start, end) time strings for each day section."""
+
+    @abstractmethod
+    def parse_region_periods(self, html: str) -> dict[str, Schedule]:
+        """Return the schedule of every group published on a region page."""
+
+
+class SoupParser(EnergyUAParser):
+    """Parser building BeautifulSoup trees only for the needed subtrees."""
+
+    def __init__(self, features: str = "html.parser") -> None:
+        """Initialize the parser."""
+        self.name = PARSER_LXML if features == PARSER_LXML else PARSER_SOUP
+        self._features = features
+
+    def parse_regions(self, html: str) -> list[Link]:
+        """Return (href, text) of every link in the footer regions list."""
+        soup = self._soup(
+            html, SoupStrainer("ul", class_=_class_pattern("footer_regions_list"))
+        )
+        return [
+            (_as_str(link.get("href")), link.text)
+            for link in soup.select("ul.footer_regions_list a")
+        ]
+
+    def parse_groups(self, html: str) -> list[Link]:
+        """Return (href, text) of every link in the group selector."""
+        soup = self._soup(
+            html, SoupStrainer(class_=_class_pattern("select_group_list"))
+        )
+        return [
+            (_as_str(link.get("href")), link.text)
+            for link in soup.select(".select_group_list a")
+        ]
+
+    def parse_periods(self, html: str) -> Schedule:
+        """Return (start, end) time strings for each day section."""
+        soup = self._soup(
+            html, SoupStrainer("div", class_=_class_pattern("scale_info"))
+        )
+
+        return [
+            _soup_section_periods(section)
+            for section in soup.find_all("div", class_="scale_info")[:SCHEDULE_DAYS]
+        ]
+
+    def parse_region_periods(self, html: str) -> dict[str, Schedule]:
+        """Return the schedule of every group published on a region page."""
+        soup = BeautifulSoup(html, self._features)
+
+        schedules: dict[str, Schedule] = {}
+        group: str | None = None
+
+        for element in soup.select(f'a[href*="{GROUP_PATH}"], div.scale_info'):
+            if element.find_parent(class_="select_group_list") or element.find_parent(
+                "div", class_="scale_info"
+            ):
+                continue
+
+            if element.name == "a":
+                if href := _as_str(element.get("href")):
+                    group = href.split("/")[-1]
+            elif group:
+                schedule = schedules.setdefault(group, [])
+                if len(schedule) < SCHEDULE_DAYS:
+                    schedule.append(_soup_section_periods(element))
+
+        return {group: schedule for group, schedule in schedules.items() if group}
+
+    def _soup(self, html: str, parse_only: SoupStrainer) -> BeautifulSoup:
+        return BeautifulSoup(html, self._features, parse_only=parse_only)
+
+
+class StreamParser(EnergyUAParser):
+    """Parser extracting the needed elements from html.parser events."""
+
+    name = PARSER_STREAM
+
+    def parse_regions(self, html: str) -> list[Link]:
+        """Return (href, text) of every link in the footer regions list."""
+        return _feed(_LinkExtractor("ul", "footer_regions_list"), html).links
+
+    def parse_groups(self, html: str) -> list[Link]:
+        """Return (href, text) of every link in the group selector."""
+        return _feed(_LinkExtractor(None, "select_group_list"), html).links
+
+    def parse_periods(self, html: str) -> Schedule:
+        """Return (start, end) time strings for each day section."""
+        return _feed(_PeriodsExtractor(), html).schedule
+
+    def parse_region_periods(self, html: str) -> dict[str, Schedule]:
+        """Return the schedule of every group published on a region page."""
+        return _feed(_RegionPeriodsExtractor(), html).schedules
+
+
+class PageTypeParser(EnergyUAParser):
+    """
+    Parser using the backend measured fastest for each page type.
+
+    With lxml installed, scripts/benchmark reads the group selector and a
+    group schedule faster through lxml than through the streaming parser,
+    while a region page with the schedules of every group takes lxml about
+    twice as long. Without lxml, the streaming parser reads every page type.
+    """
+
+    name = PARSER_AUTO
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._region_pages = StreamParser()
+        self._pages = (
+            SoupParser(PARSER_LXML)
+            if find_spec("lxml") is not None
+            else self._region_pages
+        )
+
+    def parse_regions(self, html: str) -> list[Link]:
+        """Return (href, text) of every link in the footer regions list."""
+        return self._pages.parse_regions(html)
+
+    def parse_groups(self, html: str) -> list[Link]:
+        """Return (href, text) of every link in the group selector."""
+        return self._pages.parse_groups(html)
+
+    def parse_periods(self, html: str) -> Schedule:
+        """Return (start, end) time strings for each day section."""
+        return self._pages.parse_periods(html)
+
+    def parse_region_periods(self, html: str) -> dict[str, Schedule]:
+        """Return the schedule of every group published on a region page."""
+        return self._region_pages.parse_region_periods(html)
+
+
+class _Extractor(HTMLParser):
+    """HTML event handler that can tell when it has seen enough."""
+
+    done = False
+
+
+class _ContainerExtractor(_Extractor):
+    """Track elements with a given class and report events inside them."""
+
+    def __init__(
+        self,
+        tag: str | None,
+        class_name: str,
+        limit: int | None = None,
+    ) -> None:
+        super().__init__(convert_charrefs=True)
+        self._container_tag = tag
+        self._container_class = class_name
+        self._limit = limit
+        self._open_tag: str | None = None
+        self._depth = 0
+        self._count = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self.done:
+            return
+
+        if self._open_tag is None:
+            if (
+                tag not in VOID_ELEMENTS
+                and self._container_tag in (None, tag)
+                and _has_class(attrs, self._container_class)
+            ):
+                self._open_tag = tag
+                self._depth = 1
+                self.container_start()
+            return
+
+        if tag == self._open_tag:
+            self._depth += 1
+        if tag not in VOID_ELEMENTS:
+            self.inner_start(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.done or self._open_tag is None:
+            return
+
+        if tag == self._open_tag:
+            self._depth -= 1
+            if not self._depth:
+                self._open_tag = None
+                self._count += 1
+                self.done = self._limit is not None and self._count >= self._limit
+                return
+
+        self.inner_end(tag)
+
+    def handle_data(self, data: str) -> None:
+        if not self.done and self._open_tag is not None:
+            self.inner_data(data)
+
+    @property
+    def in_container(self) -> bool:
+        """Return whether a matching container is open."""
+        return self._open_tag is not None
+
+    def container_start(self) -> None:
+        """Handle the start of a matching container."""
+
+    def inner_start(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Handle a start tag inside a container."""
+
+    def inner_end(self, tag: str) -> None:
+        """Handle an end tag inside a container."""
+
+    def inner_data(self, data: str) -> None:
+        """Handle text inside a container."""
+
+
+class _LinkExtractor(_ContainerExtractor):
+    """Collect links inside matching containers."""
+
+    def __init__(self, tag: str | None, class_name: str) -> None:
+        super().__init__(tag, class_name)
+        self.links: list[Link] = []
+        self._href: str | None = None
+        self._text: list[str] | None = None
+
+    def inner_start(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "a" and self._text is None:
+            self._href = dict(attrs).get("href")
+            self._text = []
+
+    def inner_end(self, tag: str) -> None:
+        if tag == "a" and self._text is not None:
+            self.links.append((self._href, "".join(self._text)))
+            self._href = None
+            self._text = None
+
+    def inner_data(self, data: str) -> None:
+        if self._text is not None:
+            self._text.append(data)
+
+
+class _PeriodsExtractor(_ContainerExtractor):
+    """Collect period times inside the day sections."""
+
+    def __init__(self) -> None:
+        super().__init__("div", "scale_info", limit=SCHEDULE_DAYS)
+        self.schedule: Schedule = []
+        self._items_depth = 0
+        self._span_depth = 0
+        self._times: list[str] = []
+        self._text: list[str] | None = None
+
+    def container_start(self) -> None:
+        self.schedule.append([])
+        self._items_depth = 0
+        self._span_depth = 0
+
+    def inner_start(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "div" and (self._items_depth or _has_class(attrs, "periods_items")):
+            self._items_depth += 1
+        elif tag == "span" and self._items_depth:
+            self._span_depth += 1
+            if self._span_depth == 1:
+                self._times = []
+        elif tag == "b" and self._span_depth and self._text is None:
+            self._text = []
+
+    def inner_end(self, tag: str) -> None:
+        if tag == "div" and self._items_depth:
+            self._items_depth -= 1
+        elif tag == "span" and self._span_depth:
+            self._span_depth -= 1
+            if not self._span_depth and len(self._times) >= 2:  # noqa: PLR2004
+                self.schedule[-1].append((self._times[0], self._times[1]))
+        elif tag == "b" and self._text is not None:
+            self._times.append("".join(self._text))
+            self._text = None
+
+    def inner_data(self, data: str) -> None:
+        if self._text is not None and (text := data.strip()):
+            self._text.append(text)
+
+
+class _RegionPeriodsExtractor(_Extractor):
+    """Collect day sections following each group link on a region page."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._groups: dict[str, _PeriodsExtractor] = {}
+        self._group: _PeriodsExtractor | None = None
+        self._menu_tag: str | None = None
+        self._menu_depth = 0
+
+    @property
+    def schedules(self) -> dict[str, Schedule]:
+        """Return the collected schedules by group."""
+        return {
+            group: extractor.schedule
+            for group, extractor in self._groups.items()
+            if group and extractor.schedule
+        }
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._menu_tag is not None:
+            if tag == self._menu_tag:
+                self._menu_depth += 1
+            return
+
+        if self._group is not None and self._group.in_container:
+            self._group.handle_starttag(tag, attrs)
+            return
+
+        if tag not in VOID_ELEMENTS and _has_class(attrs, "select_group_list"):
+            self._menu_tag = tag
+            self._menu_depth = 1
+        elif tag == "a" and GROUP_PATH in (href := dict(attrs).get("href") or ""):
+            group = href.split("/")[-1]
+            self._group = self._groups.setdefault(group, _PeriodsExtractor())
+        elif self._group is not None:
+            self._group.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._menu_tag is not None:
+            if tag == self._menu_tag:
+                self._menu_depth -= 1
+                if not self._menu_depth:
+                    self._menu_tag = None
+            return
+
+        if self._group is not None:
+            self._group.handle_endtag(tag)
+
+    def handle_data(self, data: str) -> None:
+        if self._menu_tag is None and self._group is not None:
+            self._group.handle_data(data)
+
+
+class ScheduleEndFinder:
+    """
+    Find where a group page can be cut once every day section has arrived.
+
+    Fed the page as it is read, returns the position of the tag opening the
+    section after the last day, or of the regions footer, so everything
+    from there on can be left unread. The cut only depends on the markup,
+    not on how the page was split into chunks.
+    """
+
+    _pattern = re.compile(
+        r"<[a-z]+\s[^>]*?class=[\"']?(?:[^\"'>]*\s)?"
+        r"(?P<name>scale_info|footer_regions_list)(?=[\s\"'>])"
+    )
+
+    def __init__(self) -> None:
+        """Initialize the finder."""
+        self._tail = ""
+        self._offset = 0
+        self._sections = 0
+
+    def feed(self, text: str) -> int | None:
+        """Scan the next piece of the page, returning the cut once found."""
+        window = self._tail + text
+        position = 0
+        while (match := self._pattern.search(window, position)) is not None:
+            if match["name"] == "scale_info" and self._sections < SCHEDULE_DAYS:
+                self._sections += 1
+                position = match.end()
+                continue
+            return self._offset + match.start()
+
+        # Keep an unfinished tag for the next piece, it may hold a marker.
+        keep = window.rfind("<", position)
+        if keep < 0 or len(window) - keep > MAX_TAG_LENGTH:
+            keep = len(window)
+        self._offset += keep
+        self._tail = window[keep:]
+        return None
+
+
+def _feed[T: _Extractor](extractor: T, html: str) -> T:
+    """Feed the page in chunks, stopping once the extractor has what it needs."""
+    for offset in range(0, len(html), FEED_CHUNK_SIZE):
+        extractor.feed(html[offset : offset + FEED_CHUNK_SIZE])
+        if extractor.done:
+            break
+    extractor.close()
+    return extractor
+
+
+def _soup_section_periods(section: Tag) -> list[tuple[str, str]]:
+    periods = []
+    for span in section.select("div.periods_items span"):
+        times = [b.get_text(strip=True) for b in span.find_all("b")[:2]]
+        if len(times) == 2:  # noqa: PLR2004
+            periods.append((times[0], times[1]))
+    return periods
+
+
+def _has_class(attrs: list[tuple[str, str | None]], class_name: str) -> bool:
+    return any(
+        name == "class" and value and class_name in value.split()
+        for name, value in attrs
+    )
+
+
+def _class_pattern(class_name: str) -> re.Pattern[str]:
+    """Match a class in the raw attribute value seen by SoupStrainer."""
+    return re.compile(rf"(?:^|\s){re.escape(class_name)}(?:\s|$)")
+
+
+def _as_str(value: object) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def get_parser(name: str | None = None) -> EnergyUAParser:
+    """Get a parser backend by name, defaulting to one per page type."""
+    if name in (None, PARSER_AUTO):
+        return PageTypeParser()
+    if name == PARSER_STREAM:
+        return StreamParser()
+    if name == PARSER_SOUP:
+        return SoupParser()
+    if name == PARSER_LXML and find_spec("lxml") is not None:
+        return SoupParser(PARSER_LXML)
+
+    msg = f"Unknown or unavailable parser backend: {name}"
+    raise ValueError(msg)
@@ -0,0 +1,385 @@
+"""Outage periods for EnergyUA."""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from base64 import b64decode, b64encode
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from itertools import chain
+from typing import TYPE_CHECKING, Any, NamedTuple, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import timedelta, tzinfo
+
+
+class Period(NamedTuple):
+    """
+    Immutable period stored as epoch seconds.
+
+    Start and end are only turned into datetimes in the time zone of the
+    period when asked for.
+    """
+
+    start_ts: int
+    end_ts: int
+    tz: tzinfo = UTC
+
+    @classmethod
+    def from_datetimes(
+        cls, start: datetime, end: datetime, tz: tzinfo | None = None
+    ) -> Period:
+        """Create a period from aware datetimes, in their time zone by default."""
+        return cls(
+            int(start.timestamp()), int(end.timestamp()), tz or start.tzinfo or UTC
+        )
+
+    @property
+    def start(self) -> datetime:
+        """Get the start as a datetime."""
+        return datetime.fromtimestamp(self.start_ts, self.tz)
+
+    @property
+    def end(self) -> datetime:
+        """Get the end as a datetime."""
+        return datetime.fromtimestamp(self.end_ts, self.tz)
+
+    def as_dict(self) -> dict[str, str]:
+        """Serialize the period with ISO formatted times."""
+        return {"start": self.start.isoformat(), "end": self.end.isoformat()}
+
+
+class PeriodIndex(Sequence[Period]):
+    """Immutable, sorted index of non-overlapping periods in epoch seconds."""
+
+    __slots__ = ("_ends", "_starts", "_tz")
+
+    def __init__(self, periods: Iterable[Period] = ()) -> None:
+        """Initialize the index from sorted, merged periods."""
+        periods = list(periods)
+        self._starts = array("q", [period.start_ts for period in periods])
+        self._ends = array("q", [period.end_ts for period in periods])
+        self._tz: tzinfo = periods[-1].tz if periods else UTC
+
+    @overload
+    def __getitem__(self, i: int) -> Period: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[Period]: ...
+
+    def __getitem__(self, i: int | slice) -> Period | list[Period]:
+        """Get a period, or a list of periods for a slice."""
+        if isinstance(i, slice):
+            return [
+                Period(start, end, self._tz)
+                for start, end in zip(self._starts[i], self._ends[i], strict=True)
+            ]
+        return Period(self._starts[i], self._ends[i], self._tz)
+
+    def __iter__(self) -> Iterator[Period]:
+        """Iterate over periods in chronological order."""
+        tz = self._tz
+        for start, end in zip(self._starts, self._ends, strict=True):
+            yield Period(start, end, tz)
+
+    def __len__(self) -> int:
+        """Return the number of periods."""
+        return len(self._starts)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare indexes by their periods."""
+        if not isinstance(other, PeriodIndex):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return the representation of the index."""
+        return f"PeriodIndex({list(self)!r})"
+
+    @property
+    def tz(self) -> tzinfo:
+        """Get the time zone periods are converted to."""
+        return self._tz
+
+    def period_at(self, at: datetime) -> Period | None:
+        """Get period that includes the specified datetime."""
+        i = self.position_at(at)
+        return None if i is None else self[i]
+
+    def periods_between(self, start: datetime, end: datetime) -> list[Period]:
+        """Get all periods that overlap with the specified datetime range."""
+        return self[self.slice_between(start, end)]
+
+    def position_at(self, at: datetime) -> int | None:
+        """Get the position of the period that includes the specified datetime."""
+        timestamp = at.timestamp()
+        i = bisect_right(self._starts, timestamp) - 1
+        if i >= 0 and timestamp <= self._ends[i]:
+            return i
+        return None
+
+    def slice_between(self, start: datetime, end: datetime) -> slice:
+        """Get the positions of periods that overlap with the datetime range."""
+        return slice(
+            bisect_left(self._ends, start.timestamp()),
+            bisect_right(self._starts, end.timestamp()),
+        )
+
+    def state_at(self, at: datetime, horizon: timedelta) -> PowerState:
+        """Get the power state at a time, looking ahead within the horizon."""
+        return self._to_state(self._state_at(at.timestamp(), horizon.total_seconds()))
+
+    def _state_at(
+        self, timestamp: float, horizon: float
+    ) -> tuple[bool, int | None, int | None]:
+        """Get the power state at a timestamp as epoch seconds."""
+        current = bisect_right(self._ends, timestamp)
+        upcoming = bisect_right(self._starts, timestamp)
+        limit = timestamp + horizon
+
+        outage = current < len(self._starts) and self._starts[current] <= timestamp
+
+        next_restore = None
+        if current < len(self._starts) and self._starts[current] <= limit:
+            next_restore = self._ends[current]
+
+        next_outage = None
+        if upcoming < len(self._starts) and self._starts[upcoming] <= limit:
+            next_outage = self._starts[upcoming]
+
+        return outage, next_outage, next_restore
+
+    def _to_state(self, state: tuple[bool, int | None, int | None]) -> PowerState:
+        """Turn a power state in epoch seconds into one with datetimes."""
+        outage, next_outage, next_restore = state
+        return PowerState(
+            outage,
+            None
+            if next_outage is None
+            else datetime.fromtimestamp(next_outage, self._tz),
+            None
+            if next_restore is None
+            else datetime.fromtimestamp(next_restore, self._tz),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PeriodsDiff:
+    """Difference between two schedules."""
+
+    added: tuple[Period, ...] = ()
+    removed: tuple[Period, ...] = ()
+    shifted: tuple[tuple[Period, Period], ...] = ()
+
+    def __bool__(self) -> bool:
+        """Return whether anything changed."""
+        return bool(self.added or self.removed or self.shifted)
+
+    def as_dict(self) -> dict[str, list[Any]]:
+        """Serialize the diff for event data."""
+        return {
+            "added": [period.as_dict() for period in self.added],
+            "removed": [period.as_dict() for period in self.removed],
+            "shifted": [
+                {"old": old.as_dict(), "new": new.as_dict()}
+                for old, new in self.shifted
+            ],
+        }
+
+
+def diff_periods(old: PeriodIndex, new: PeriodIndex, since: datetime) -> PeriodsDiff:
+    """Compare two schedules, ignoring periods that ended before a time."""
+    cutoff = since.timestamp()
+    old_periods = [period for period in old if period.end_ts > cutoff]
+    new_periods = [period for period in new if period.end_ts > cutoff]
+
+    added: list[Period] = []
+    removed: list[Period] = []
+    shifted: list[tuple[Period, Period]] = []
+
+    i = j = 0
+    while i < len(old_periods) and j < len(new_periods):
+        old_period, new_period = old_periods[i], new_periods[j]
+
+        if old_period == new_period:
+            i += 1
+            j += 1
+        elif old_period.end_ts < new_period.start_ts:
+            removed.append(old_period)
+            i += 1
+        elif new_period.end_ts < old_period.start_ts:
+            added.append(new_period)
+            j += 1
+        else:
+            shifted.append((old_period, new_period))
+            i += 1
+            j += 1
+
+    removed.extend(old_periods[i:])
+    added.extend(new_periods[j:])
+
+    return PeriodsDiff(tuple(added), tuple(removed), tuple(shifted))
+
+
+@dataclass(frozen=True, slots=True)
+class PowerState:
+    """Power state at a point in time."""
+
+    outage: bool
+    next_outage: datetime | None
+    next_restore: datetime | None
+
+
+class StateTimeline:
+    """Power state transitions precomputed from a period index."""
+
+    __slots__ = ("_states", "_times", "_tz")
+
+    def __init__(
+        self,
+        periods: PeriodIndex,
+        start: datetime,
+        horizon: timedelta,
+    ) -> None:
+        """Build the timeline of state changes after the start time."""
+        begin = start.timestamp()
+        window = horizon.total_seconds()
+        ahead = int(window)
+
+        points: set[float] = {begin}
+        for start_ts, end_ts in zip(periods._starts, periods._ends, strict=True):  # noqa: SLF001
+            points.update(
+                point for point in (start_ts - ahead, start_ts, end_ts) if point > begin
+            )
+
+        times: list[float] = []
+        states: list[tuple[bool, int | None, int | None]] = []
+        for point in sorted(points):
+            state = periods._state_at(point, window)  # noqa: SLF001
+            if not states or state != states[-1]:
+                times.append(point)
+                states.append(state)
+
+        self._tz = periods.tz
+        self._times = array("d", times)
+        self._states = tuple(periods._to_state(state) for state in states)  # noqa: SLF001
+
+    def __len__(self) -> int:
+        """Return the number of transitions."""
+        return len(self._times)
+
+    def state_at(self, at: datetime) -> PowerState:
+        """Get the power state at the specified datetime."""
+        return self._states[max(bisect_right(self._times, at.timestamp()) - 1, 0)]
+
+    def next_change(self, after: datetime) -> datetime | None:
+        """Get the time of the first transition after the specified datetime."""
+        i = bisect_right(self._times, after.timestamp())
+        if i == len(self._times):
+            return None
+        return datetime.fromtimestamp(self._times[i], self._tz)
+
+
+class OutageArchive:
+    """Append-only archive of past outages stored as epoch-second pairs."""
+
+    __slots__ = ("_ends", "_starts", "_tz", "retention", "revision")
+
+    def __init__(self, tz: tzinfo, retention: timedelta | None = None) -> None:
+        """Initialize an empty archive."""
+        self._tz = tz
+        self._starts = array("q")
+        self._ends = array("q")
+        self.retention = retention
+        self.revision = 0
+
+    def __len__(self) -> int:
+        """Return the number of archived periods."""
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Period]:
+        """Iterate over archived periods in chronological order."""
+        tz = self._tz
+        for start, end in zip(self._starts, self._ends, strict=True):
+            yield Period(start, end, tz)
+
+    def add(self, periods: Iterable[Period], now: datetime) -> None:
+        """Archive periods that have already ended and evict expired ones."""
+        cutoff = now.timestamp()
+        changed = False
+
+        for period in periods:
+            if period.end_ts > cutoff:
+                break
+            changed |= self._insert(period.start_ts, period.end_ts)
+
+        if self.retention is not None:
+            changed |= self._evict(int((now - self.retention).timestamp()))
+
+        if changed:
+            self.revision += 1
+
+    def periods_between(self, start: datetime, end: datetime) -> list[Period]:
+        """Get archived periods that overlap with the specified datetime range."""
+        lo = bisect_left(self._ends, start.timestamp())
+        hi = bisect_right(self._starts, end.timestamp())
+        return [Period(self._starts[i], self._ends[i], self._tz) for i in range(lo, hi)]
+
+    def as_packed(self) -> str:
+        """Serialize the archive as base64 encoded little-endian pairs."""
+        packed = array(
+            "q", chain.from_iterable(zip(self._starts, self._ends, strict=True))
+        )
+        if sys.byteorder == "big":
+            packed.byteswap()
+        return b64encode(packed.tobytes()).decode()
+
+    def load_packed(self, data: str) -> None:
+        """Restore the archive serialized with as_packed."""
+        packed = array("q")
+        packed.frombytes(b64decode(data))
+        if sys.byteorder == "big":
+            packed.byteswap()
+        self._starts = packed[0::2]
+        self._ends = packed[1::2]
+        self.revision += 1
+
+    def _insert(self, start: int, end: int) -> bool:
+        """Insert a period, merging it with the archived ones it touches."""
+        starts, ends = self._starts, self._ends
+
+        if not ends or start > ends[-1]:
+            starts.append(start)
+            ends.append(end)
+            return True
+
+        lo = bisect_left(ends, start)
+        hi = bisect_right(starts, end)
+
+        if hi - lo == 1 and starts[lo] <= start and end <= ends[lo]:
+            return False
+
+        if hi > lo:
+            start = min(start, starts[lo])
+            end = max(end, ends[hi - 1])
+            del starts[lo:hi]
+            del ends[lo:hi]
+
+        starts.insert(lo, start)
+        ends.insert(lo, end)
+        return True
+
+    def _evict(self, before: int) -> bool:
+        """Drop periods that ended before the given timestamp."""
+        if not (count := bisect_right(self._ends, before)):
+            return False
+
+        del self._starts[:count]
+        del self._ends[:count]
+        return True
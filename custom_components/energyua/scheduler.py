@@ -0,0 +1,126 @@
+"""Shared timer for scheduled EnergyUA state updates."""
+
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+    from datetime import datetime
+
+DATA_TRANSITION_SCHEDULER: HassKey[EnergyUATransitionScheduler] = HassKey(
+    f"{DOMAIN}_transition_scheduler"
+)
+
+
+class EnergyUATransitionScheduler:
+    """
+    Run the scheduled updates of all config entries from one timer.
+
+    Upcoming updates are kept in a heap keyed by time, with one pending
+    update per key. Rescheduling pushes a new heap entry and leaves the old
+    one to be skipped when it comes up. Updates due at the same instant run
+    together on a single wake-up.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._due: dict[Hashable, tuple[float, Callable[[datetime], None]]] = {}
+        self._sequence = count()
+        self._wakeup_at: float | None = None
+        self._unsub_wakeup: CALLBACK_TYPE | None = None
+
+    def __len__(self) -> int:
+        """Return the number of pending updates."""
+        return len(self._due)
+
+    @callback
+    def async_schedule(
+        self, key: Hashable, at: datetime, action: Callable[[datetime], None]
+    ) -> None:
+        """Run an action at a time, replacing the update pending for the key."""
+        when = at.timestamp()
+        self._due[key] = (when, action)
+        heapq.heappush(self._heap, (when, next(self._sequence), key))
+        self._arm()
+
+    @callback
+    def async_cancel(self, key: Hashable) -> None:
+        """Cancel the update pending for the key."""
+        if self._due.pop(key, None) is not None:
+            self._arm()
+
+    def _is_current(self, when: float, key: Hashable) -> bool:
+        """Return whether a heap entry is still the pending update of its key."""
+        return (due := self._due.get(key)) is not None and due[0] == when
+
+    @callback
+    def _arm(self) -> None:
+        """Point the timer at the earliest pending update."""
+        heap = self._heap
+        while heap and not self._is_current(heap[0][0], heap[0][2]):
+            heapq.heappop(heap)
+
+        # Drop skipped entries once they outnumber the pending ones.
+        if len(heap) > 2 * len(self._due) + 16:
+            heap[:] = [entry for entry in heap if self._is_current(entry[0], entry[2])]
+            heapq.heapify(heap)
+
+        when = heap[0][0] if heap else None
+        if when == self._wakeup_at:
+            return
+
+        if self._unsub_wakeup:
+            self._unsub_wakeup()
+            self._unsub_wakeup = None
+        self._wakeup_at = when
+        if when is not None:
+            self._unsub_wakeup = async_track_point_in_utc_time(
+                self.hass, self._handle_wakeup, dt_util.utc_from_timestamp(when)
+            )
+
+    @callback
+    def _handle_wakeup(self, _point_in_time: datetime) -> None:
+        """Run every update that is due, including any the timer overslept."""
+        self._unsub_wakeup = None
+        self._wakeup_at = None
+
+        now = dt_util.utcnow()
+        timestamp = now.timestamp()
+        actions = []
+        while self._heap and self._heap[0][0] <= timestamp:
+            when, _, key = heapq.heappop(self._heap)
+            if self._is_current(when, key):
+                actions.append(self._due.pop(key)[1])
+
+        LOGGER.debug("Running %s scheduled updates", len(actions))
+
+        try:
+            for action in actions:
+                try:
+                    action(now)
+                except Exception:  # noqa: BLE001
+                    LOGGER.exception("Error running scheduled update %s", action)
+        finally:
+            self._arm()
+
+
+@callback
+def async_get_transition_scheduler(hass: HomeAssistant) -> EnergyUATransitionScheduler:
+    """Get the transition scheduler shared by all config entries."""
+    if (scheduler := hass.data.get(DATA_TRANSITION_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_TRANSITION_SCHEDULER] = EnergyUATransitionScheduler(
+            hass
+        )
+    return scheduler
@@ -9,10 +9,14 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import STATE_NORMAL, STATE_OUTAGE
+from .const import STATE_NORMAL, STATE_OUTAGE, STATE_PARTIAL
 from .entity import EnergyUAEntity
+from .stats import COUNTER_BYTES, PHASE_PARSE, PHASE_REQUEST
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -20,6 +24,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .combine import EnergyUACombination
     from .coordinator import EnergyUACoordinator
     from .data import EnergyUAConfigEntry
 
@@ -29,6 +34,7 @@ class EnergyUASensorDescription(SensorEntityDescription):
     """EnergyUA entity description."""
 
     val_func: Callable[[EnergyUACoordinator], Any]
+    countdown: bool = False
 
 
 ENTITY_DESCRIPTIONS = (
@@ -54,22 +60,164 @@ ENTITY_DESCRIPTIONS = (
         device_class=SensorDeviceClass.TIMESTAMP,
         val_func=lambda coordinator: coordinator.next_restore,
     ),
+    EnergyUASensorDescription(
+        key="time_to_outage",
+        translation_key="time_to_outage",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        countdown=True,
+        val_func=lambda coordinator: coordinator.time_to_outage,
+    ),
+    EnergyUASensorDescription(
+        key="time_to_restore",
+        translation_key="time_to_restore",
+        icon="mdi:timer-sand-complete",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        countdown=True,
+        val_func=lambda coordinator: coordinator.time_to_restore,
+    ),
+    EnergyUASensorDescription(
+        key="outage_duration",
+        translation_key="outage_duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        val_func=lambda coordinator: coordinator.outage_duration,
+    ),
+    EnergyUASensorDescription(
+        key="status",
+        translation_key="status",
+        icon="mdi:message-flash-outline",
+        val_func=lambda coordinator: coordinator.status,
+    ),
+    EnergyUASensorDescription(
+        key="update_interval",
+        translation_key="update_interval",
+        icon="mdi:update",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        val_func=lambda coordinator: (
+            coordinator.effective_update_interval
+            and round(coordinator.effective_update_interval.total_seconds())
+        ),
+    ),
+    EnergyUASensorDescription(
+        key="fetched_at",
+        translation_key="fetched_at",
+        icon="mdi:cloud-check",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        val_func=lambda coordinator: coordinator.fetched_at,
+    ),
+)
+
+STATISTICS_DESCRIPTIONS = (
+    EnergyUASensorDescription(
+        key="request_duration",
+        translation_key="request_duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        val_func=lambda coordinator: _last_ms(coordinator, PHASE_REQUEST),
+    ),
+    EnergyUASensorDescription(
+        key="parse_duration",
+        translation_key="parse_duration",
+        icon="mdi:timer-cog-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        val_func=lambda coordinator: _last_ms(coordinator, PHASE_PARSE),
+    ),
+    EnergyUASensorDescription(
+        key="downloaded",
+        translation_key="downloaded",
+        icon="mdi:download-network",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.KIBIBYTES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        val_func=lambda coordinator: coordinator.stats.counters[COUNTER_BYTES],
+    ),
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class EnergyUACombinedSensorDescription(SensorEntityDescription):
+    """EnergyUA combined groups entity description."""
+
+    val_func: Callable[[EnergyUACombination], Any]
+
+
+COMBINED_DESCRIPTIONS = (
+    EnergyUACombinedSensorDescription(
+        key="combined_electricity",
+        translation_key="combined_electricity",
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.ENUM,
+        options=[STATE_NORMAL, STATE_PARTIAL, STATE_OUTAGE],
+        val_func=lambda combination: combination.current_state,
+    ),
+    EnergyUACombinedSensorDescription(
+        key="combined_next_outage",
+        translation_key="combined_next_outage",
+        icon="mdi:calendar-remove",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        val_func=lambda combination: combination.state.next_outage,
+    ),
+    EnergyUACombinedSensorDescription(
+        key="combined_next_restore",
+        translation_key="combined_next_restore",
+        icon="mdi:calendar-check",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        val_func=lambda combination: combination.state.next_restore,
+    ),
+)
+
+
+def _last_ms(coordinator: EnergyUACoordinator, phase: str) -> float | None:
+    """Get the last duration of a phase in milliseconds."""
+    seconds = coordinator.stats.last(phase)
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
     entry: EnergyUAConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
-    async_add_entities(
+    descriptions = ENTITY_DESCRIPTIONS
+    if entry.runtime_data.client.stats.enabled:
+        descriptions += STATISTICS_DESCRIPTIONS
+
+    entities: list[SensorEntity] = [
         EnergyUASensor(
             coordinator=entry.runtime_data.coordinator,
             entity_description=entity_description,
         )
-        for entity_description in ENTITY_DESCRIPTIONS
-    )
+        for entity_description in descriptions
+    ]
+    if (combination := entry.runtime_data.combination) is not None:
+        entities.extend(
+            EnergyUACombinedSensor(
+                coordinator=entry.runtime_data.coordinator,
+                combination=combination,
+                entity_description=entity_description,
+            )
+            for entity_description in COMBINED_DESCRIPTIONS
+        )
+
+    async_add_entities(entities)
 
 
 class EnergyUASensor(EnergyUAEntity, SensorEntity):
@@ -89,7 +237,57 @@ class EnergyUASensor(EnergyUAEntity, SensorEntity):
             f"{coordinator.config_entry.entry_id}-{self.entity_description.key}"
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe diagnostic sensors to every refresh and countdowns to ticks."""
+        await super().async_added_to_hass()
+
+        if self.entity_description.countdown:
+            self.async_on_remove(
+                self.coordinator.async_add_countdown_listener(self.async_write_ha_state)
+            )
+
+        if self.entity_category == EntityCategory.DIAGNOSTIC:
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass,
+                    self.coordinator.diagnostics_signal,
+                    self.async_write_ha_state,
+                )
+            )
+
     @property
     def native_value(self) -> str | None:
         """Return the native value of the sensor."""
         return self.entity_description.val_func(self.coordinator)
+
+
+class EnergyUACombinedSensor(EnergyUAEntity, SensorEntity):
+    """EnergyUA sensor of several groups combined."""
+
+    entity_description: EnergyUACombinedSensorDescription
+
+    def __init__(
+        self,
+        coordinator: EnergyUACoordinator,
+        combination: EnergyUACombination,
+        entity_description: EnergyUACombinedSensorDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+        self._combination = combination
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}-{self.entity_description.key}"
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to changes of the combined state."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._combination.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        return self.entity_description.val_func(self._combination)
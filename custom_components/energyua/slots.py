@@ -0,0 +1,136 @@
+"""Fixed-resolution outage bitmaps for combining EnergyUA schedules."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .periods import Period, PeriodIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import tzinfo
+
+
+class SlotMap:
+    """
+    Outage slots of a time window as one bitset.
+
+    Bit i is set when there is an outage during slot i counted from the
+    start of the window. Python integers hold the whole window, so union,
+    intersection and difference of two maps are single bitwise operations.
+    """
+
+    __slots__ = ("bits", "size", "slot", "start")
+
+    def __init__(self, start: int, slot: int, size: int, bits: int = 0) -> None:
+        """Initialize a map of size slots of slot seconds from start."""
+        self.start = start
+        self.slot = slot
+        self.size = size
+        self.bits = bits & ((1 << size) - 1)
+
+    @classmethod
+    def from_periods(
+        cls, periods: Iterable[Period], start: int, slot: int, size: int
+    ) -> SlotMap:
+        """Mark every slot that overlaps one of the periods."""
+        end = start + slot * size
+        bits = 0
+
+        for period in periods:
+            if period.end_ts <= start or period.start_ts >= end:
+                continue
+            first = max(0, (period.start_ts - start) // slot)
+            last = min(size, -(-(period.end_ts - start) // slot))
+            bits |= ((1 << (last - first)) - 1) << first
+
+        return cls(start, slot, size, bits)
+
+    def __or__(self, other: SlotMap) -> SlotMap:
+        """Return slots with an outage in either map."""
+        return self._with(self.bits | self._bits_of(other))
+
+    def __and__(self, other: SlotMap) -> SlotMap:
+        """Return slots with an outage in both maps."""
+        return self._with(self.bits & self._bits_of(other))
+
+    def __sub__(self, other: SlotMap) -> SlotMap:
+        """Return slots with an outage in this map but not in the other."""
+        return self._with(self.bits & ~self._bits_of(other))
+
+    def __invert__(self) -> SlotMap:
+        """Return slots without an outage."""
+        return self._with(~self.bits)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare maps of the same window by their slots."""
+        if not isinstance(other, SlotMap):
+            return NotImplemented
+        return self._window == other._window and self.bits == other.bits
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __bool__(self) -> bool:
+        """Return whether any slot is set."""
+        return bool(self.bits)
+
+    def __repr__(self) -> str:
+        """Return the representation of the map."""
+        return f"SlotMap(start={self.start}, slot={self.slot}, bits={self.bits:#x})"
+
+    def count(self) -> int:
+        """Return the number of slots set."""
+        return self.bits.bit_count()
+
+    def to_periods(self, tz: tzinfo) -> PeriodIndex:
+        """Turn runs of set slots into merged periods."""
+        periods: list[Period] = []
+        bits = self.bits
+
+        while bits:
+            first = (bits & -bits).bit_length() - 1
+            run = bits >> first
+            length = (run ^ (run + 1)).bit_length() - 1
+            periods.append(
+                Period(
+                    self.start + first * self.slot,
+                    self.start + (first + length) * self.slot,
+                    tz,
+                )
+            )
+            bits &= ~(((1 << length) - 1) << first)
+
+        return PeriodIndex(periods)
+
+    @property
+    def _window(self) -> tuple[int, int, int]:
+        return (self.start, self.slot, self.size)
+
+    def _bits_of(self, other: SlotMap) -> int:
+        """Get the bits of a map covering the same window."""
+        if self._window != other._window:
+            msg = "Slot maps cover different windows"
+            raise ValueError(msg)
+        return other.bits
+
+    def _with(self, bits: int) -> SlotMap:
+        return SlotMap(self.start, self.slot, self.size, bits)
+
+
+def outage_seconds(
+    periods: Iterable[Period], start: int, slot: int, size: int
+) -> list[int]:
+    """Sum the seconds of outage within each of size slots from start."""
+    end = start + slot * size
+    seconds = [0] * size
+
+    for period in periods:
+        begin = max(period.start_ts, start)
+        finish = min(period.end_ts, end)
+        while begin < finish:
+            i = (begin - start) // slot
+            boundary = min(finish, start + (i + 1) * slot)
+            seconds[i] += boundary - begin
+            begin = boundary
+
+    return seconds
@@ -0,0 +1,167 @@
+"""Timing and counters for the EnergyUA fetch and schedule paths."""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import SimpleNamespace
+
+PHASE_DNS = "dns"
+PHASE_CONNECT = "connect"
+PHASE_REQUEST = "request"
+PHASE_DOWNLOAD = "download"
+PHASE_PARSE = "parse"
+PHASE_MERGE = "merge"
+PHASE_UPDATE = "update"
+PHASE_TIMELINE = "timeline"
+PHASE_LISTENERS = "listeners"
+
+COUNTER_BYTES = "bytes_downloaded"
+COUNTER_REQUESTS = "requests"
+COUNTER_NOT_MODIFIED = "not_modified"
+COUNTER_RETRIES = "retries"
+COUNTER_UNCHANGED = "unchanged_pages"
+COUNTER_PARSE_FAILURES = "parse_failures"
+COUNTER_REFRESHES = "refreshes"
+COUNTER_REFRESH_FAILURES = "refresh_failures"
+COUNTER_STALE = "stale_refreshes"
+COUNTER_SCHEDULED_UPDATES = "scheduled_updates"
+
+
+@dataclass(slots=True)
+class PhaseTiming:
+    """Accumulated durations of one phase, in seconds."""
+
+    count: int = 0
+    total: float = 0
+    last: float = 0
+    max: float = 0
+
+    def add(self, seconds: float) -> None:
+        """Add a measured duration."""
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timing in milliseconds."""
+        return {
+            "count": self.count,
+            "last_ms": round(self.last * 1000, 3),
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class EnergyUAStats:
+    """
+    Per-phase timings and counters.
+
+    Every method returns right away while disabled, so instrumented code
+    paths cost a single attribute check.
+    """
+
+    __slots__ = ("counters", "enabled", "timings")
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        """Initialize the statistics."""
+        self.enabled = enabled
+        self.counters: Counter[str] = Counter()
+        self.timings: dict[str, PhaseTiming] = {}
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increase a counter."""
+        if self.enabled:
+            self.counters[name] += value
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Record the duration of a phase."""
+        if not self.enabled:
+            return
+        if (timing := self.timings.get(phase)) is None:
+            timing = self.timings[phase] = PhaseTiming()
+        timing.add(seconds)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Record the duration of the enclosed block."""
+        if not self.enabled:
+            yield
+            return
+
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, perf_counter() - started)
+
+    def last(self, phase: str) -> float | None:
+        """Get the last duration of a phase, in seconds."""
+        timing = self.timings.get(phase)
+        return timing.last if timing else None
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Build an aiohttp trace config timing DNS, connect and request."""
+        trace_config = aiohttp.TraceConfig()
+
+        for phase, on_start, on_end in (
+            (
+                PHASE_DNS,
+                trace_config.on_dns_resolvehost_start,
+                trace_config.on_dns_resolvehost_end,
+            ),
+            (
+                PHASE_CONNECT,
+                trace_config.on_connection_create_start,
+                trace_config.on_connection_create_end,
+            ),
+            (
+                PHASE_REQUEST,
+                trace_config.on_request_start,
+                trace_config.on_request_end,
+            ),
+        ):
+            on_start.append(self._trace_start(phase))
+            on_end.append(self._trace_end(phase))
+
+        return trace_config
+
+    def _trace_start(self, phase: str) -> Any:
+        async def on_start(
+            _session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            _params: object,
+        ) -> None:
+            setattr(context, phase, perf_counter())
+
+        return on_start
+
+    def _trace_end(self, phase: str) -> Any:
+        async def on_end(
+            _session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            _params: object,
+        ) -> None:
+            if (started := getattr(context, phase, None)) is not None:
+                self.record(phase, perf_counter() - started)
+
+        return on_end
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "enabled": self.enabled,
+            "counters": dict(self.counters),
+            "timings": {
+                phase: timing.as_dict() for phase, timing in self.timings.items()
+            },
+        }
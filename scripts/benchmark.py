@@ -0,0 +1,396 @@
+# ruff: noqa: INP001
+"""
+Offline benchmarks for the EnergyUA hot paths.
+
+Measures parsing, period merging, lookups and state timeline building on
+pages generated with the markup of the site and on synthetic period sets,
+and the memory kept by each period representation.
+Pages saved from the site can be added with --page. Nothing is fetched
+from the network.
+
+Run with scripts/benchmark, see --help for the options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from itertools import cycle
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from custom_components.energyua.api import UKRAINE_TZ, EnergyUAApiClient
+from custom_components.energyua.const import TIMEFRAME_TO_CHECK
+from custom_components.energyua.parser import (
+    PARSER_AUTO,
+    PARSER_LXML,
+    PARSER_SOUP,
+    PARSER_STREAM,
+    get_parser,
+)
+from custom_components.energyua.periods import Period, PeriodIndex, StateTimeline
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+GROUPS = tuple(f"{queue}-{sub}" for queue in range(1, 7) for sub in (1, 2))
+START = datetime(2025, 1, 1, tzinfo=UKRAINE_TZ)
+PAGE_PADDING = 150_000
+MIN_TIME = 0.2
+REGRESSION_TOLERANCE = 0.25
+
+
+type Case = tuple[str, int, Callable[[], Any]]
+
+
+@dataclass
+class Result:
+    """Latency and allocations of one benchmarked operation."""
+
+    name: str
+    size: int
+    best_us: float
+    median_us: float
+    peak_kib: float
+    retained_kib: float
+
+    @property
+    def key(self) -> str:
+        """Identify the result when comparing runs."""
+        return f"{self.name}[{self.size}]"
+
+
+def measure(name: str, size: int, func: Callable[[], Any], repeat: int) -> Result:
+    """Time a call and trace the memory it allocates."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    number = max(1, round(number * MIN_TIME / max(elapsed, 1e-9)))
+    timings = [t / number * 1e6 for t in timer.repeat(repeat, number)]
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return Result(
+        name=name,
+        size=size,
+        best_us=min(timings),
+        median_us=statistics.median(timings),
+        peak_kib=(peak - before) / 1024,
+        retained_kib=(current - before) / 1024,
+    )
+
+
+def make_periods(count: int) -> list[Period]:
+    """Build periods every three hours, with every fourth overlapping."""
+    periods: list[Period] = []
+    for i in range(count):
+        start = START + timedelta(hours=3 * i, minutes=(i * 37) % 60)
+        length = timedelta(hours=4 if i % 4 == 0 else 1 + (i % 2))
+        periods.append(Period.from_datetimes(start, start + length))
+
+    # Interleave the halves so sorting does real work.
+    return periods[::2] + periods[1::2]
+
+
+def make_section(day: int, group: int) -> str:
+    """Build a day section with the markup of the site."""
+    spans = "".join(
+        f"<span><b>{hour:02d}:00</b> - <b>{hour + 2:02d}:30</b></span>"
+        for hour in range((day + group) % 3, 21, 6)
+    )
+    return (
+        '<div class="scale_info"><div class="periods_title">'
+        f"Графік на день {day + 1}</div>"
+        f'<div class="periods_items">{spans}</div></div>'
+    )
+
+
+def make_chrome() -> tuple[str, str]:
+    """Build the header and footer around the schedule, padded to site size."""
+    groups = "".join(f'<a href="/cherga/{group}">Черга {group}</a>' for group in GROUPS)
+    filler = '<div class="news"><p>Новини енергетики регіону.</p></div>'
+    padding = filler * (PAGE_PADDING // len(filler))
+    header = (
+        '<html><head><meta charset="utf-8"><title>Графік</title></head><body>'
+        f'<div class="select_group_list">{groups}</div>{padding}'
+    )
+    footer = (
+        '<ul class="footer_regions_list">'
+        + "".join(
+            f'<li><a href="https://region{i}.energy-ua.info/">Область {i}</a></li>'
+            for i in range(24)
+        )
+        + "</ul></body></html>"
+    )
+    return header, footer
+
+
+def make_group_page() -> str:
+    """Build a group page with the schedule for today and tomorrow."""
+    header, footer = make_chrome()
+    return header + make_section(0, 0) + make_section(1, 0) + footer
+
+
+def make_region_page() -> str:
+    """Build a region page carrying the schedule of every group."""
+    header, footer = make_chrome()
+    body = "".join(
+        f'<h2><a href="/cherga/{group}">Черга {group}</a></h2>'
+        + make_section(0, i)
+        + make_section(1, i)
+        for i, group in enumerate(GROUPS)
+    )
+    return header + body + footer
+
+
+def available_parsers() -> Iterator[str]:
+    """Yield the parser backends installed here."""
+    for name in (PARSER_STREAM, PARSER_SOUP, PARSER_LXML, PARSER_AUTO):
+        try:
+            get_parser(name)
+        except ValueError:
+            continue
+        yield name
+
+
+def bench_parsing(pages: dict[str, str]) -> Iterator[Case]:
+    """Benchmark the parser backends and the client parse on each page."""
+    today = START.date()
+    region = make_region_page()
+
+    for backend in available_parsers():
+        parser = get_parser(backend)
+        client = EnergyUAApiClient(parser=parser)
+
+        for page_name, html in pages.items():
+            yield (
+                f"parse_periods/{backend}/{page_name}",
+                len(html),
+                lambda parser=parser, html=html: parser.parse_periods(html),
+            )
+            yield (
+                f"parse_groups/{backend}/{page_name}",
+                len(html),
+                lambda parser=parser, html=html: parser.parse_groups(html),
+            )
+            yield (
+                f"client_parse_periods/{backend}/{page_name}",
+                len(html),
+                lambda client=client, html=html: client._parse_periods(html, today),  # noqa: SLF001
+            )
+
+        yield (
+            f"parse_region_periods/{backend}",
+            len(region),
+            lambda parser=parser: parser.parse_region_periods(region),
+        )
+
+    for page_name, html in pages.items():
+        yield (
+            f"periods_digest/{page_name}",
+            len(html),
+            lambda html=html: EnergyUAApiClient._get_periods_digest(html, today),  # noqa: SLF001
+        )
+
+
+def bench_periods(size: int) -> Iterator[Case]:
+    """Benchmark merging, lookups and timelines over a period set."""
+    periods = make_periods(size)
+    index = EnergyUAApiClient._merge_periods(periods)  # noqa: SLF001
+    middle = START + (periods[-1].start - START) / 2
+    probes = cycle([middle + timedelta(minutes=17 * i) for i in range(97)])
+
+    client = EnergyUAApiClient()
+    client.periods = PeriodIndex(period for period in index if period.start >= middle)
+    client.archive.add(index, middle)
+
+    yield (
+        "merge_periods",
+        size,
+        lambda: EnergyUAApiClient._merge_periods(periods),  # noqa: SLF001
+    )
+    yield ("period_index", size, lambda: PeriodIndex(index))
+    yield (
+        "get_period_at",
+        size,
+        lambda: index.period_at(next(probes)),
+    )
+    yield (
+        "periods_between",
+        size,
+        lambda: index.periods_between(middle, middle + timedelta(days=1)),
+    )
+    yield (
+        "client_periods_between",
+        size,
+        lambda: client.get_periods_between(
+            middle - timedelta(days=3), middle + timedelta(days=1)
+        ),
+    )
+    yield (
+        "state_at",
+        size,
+        lambda: index.state_at(next(probes), TIMEFRAME_TO_CHECK),
+    )
+
+    timeline = StateTimeline(index, middle, TIMEFRAME_TO_CHECK)
+    yield (
+        "timeline_build",
+        size,
+        lambda: StateTimeline(index, middle, TIMEFRAME_TO_CHECK),
+    )
+    yield (
+        "timeline_state_at",
+        size,
+        lambda: timeline.state_at(next(probes)),
+    )
+
+
+def bench_memory(size: int) -> Iterator[Case]:
+    """Compare the memory kept by period dicts, Period objects and an index."""
+    bounds = [(period.start_ts, period.end_ts) for period in make_periods(size)]
+
+    yield (
+        "memory/dicts",
+        size,
+        lambda: [
+            {
+                "start": datetime.fromtimestamp(start, UKRAINE_TZ),
+                "end": datetime.fromtimestamp(end, UKRAINE_TZ),
+            }
+            for start, end in bounds
+        ],
+    )
+    yield (
+        "memory/periods",
+        size,
+        lambda: [Period(start, end, UKRAINE_TZ) for start, end in bounds],
+    )
+    yield (
+        "memory/period_index",
+        size,
+        lambda: PeriodIndex(Period(start, end, UKRAINE_TZ) for start, end in bounds),
+    )
+
+
+def format_results(results: list[Result]) -> str:
+    """Format results as an aligned table."""
+    header = ("operation", "size", "best µs", "median µs", "peak KiB", "kept KiB")
+    rows = [
+        (
+            result.name,
+            str(result.size),
+            f"{result.best_us:.2f}",
+            f"{result.median_us:.2f}",
+            f"{result.peak_kib:.1f}",
+            f"{result.retained_kib:.1f}",
+        )
+        for result in results
+    ]
+    widths = [max(len(row[i]) for row in (header, *rows)) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+        )
+        for row in (header, *rows)
+    )
+
+
+def find_regressions(
+    results: list[Result], baseline: dict[str, dict[str, Any]], tolerance: float
+) -> list[str]:
+    """List operations slower than the baseline by more than the tolerance."""
+    regressions = []
+    for result in results:
+        if (previous := baseline.get(result.key)) is None:
+            continue
+        if result.median_us > previous["median_us"] * (1 + tolerance):
+            regressions.append(
+                f"{result.key}: {previous['median_us']:.2f} µs -> "
+                f"{result.median_us:.2f} µs"
+            )
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=SIZES,
+        help="number of periods in the synthetic sets",
+    )
+    parser.add_argument(
+        "--page",
+        type=Path,
+        action="append",
+        default=[],
+        help="add a group page saved from the site",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats")
+    parser.add_argument("--only", help="run operations containing this text")
+    parser.add_argument("--save", type=Path, help="write results to a JSON file")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="fail when slower than the results in this JSON file",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=REGRESSION_TOLERANCE,
+        help="allowed slowdown against --compare, as a fraction",
+    )
+    args = parser.parse_args()
+
+    pages = {"generated": make_group_page()}
+    pages.update({path.stem: path.read_text(encoding="utf-8") for path in args.page})
+
+    results: list[Result] = []
+    suites = [
+        bench_parsing(pages),
+        *(bench_periods(size) for size in args.sizes),
+        *(bench_memory(size) for size in args.sizes),
+    ]
+    for suite in suites:
+        for name, size, func in suite:
+            if args.only and args.only not in name:
+                continue
+            result = measure(name, size, func, args.repeat)
+            results.append(result)
+            sys.stdout.write(f"{result.key}: {result.median_us:.2f} µs\n")
+
+    sys.stdout.write(f"\n{format_results(results)}\n")
+
+    if args.save:
+        args.save.write_text(
+            json.dumps({result.key: asdict(result) for result in results}, indent=2),
+            encoding="utf-8",
+        )
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if regressions := find_regressions(results, baseline, args.tolerance):
+            sys.stdout.write("\nRegressions:\n" + "\n".join(regressions) + "\n")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
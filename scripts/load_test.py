@@ -0,0 +1,233 @@
+# ruff: noqa: INP001
+"""
+Load test EnergyUA clients against the stand-in server.
+
+Simulates config entries spread over the regions and groups of the
+stand-in server. Each entry sets up like a config entry does, then
+refreshes once per round at a random point inside the round. The clients
+share a session, fetch cache and circuit breaker, as they do in Home
+Assistant. Reports request counts, refresh latency and how long the
+event loop was blocked.
+
+Starts the stand-in server in process unless --base-url points at one
+already running. Run with scripts/load_test, see --help for the options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+
+import aiohttp
+from aiohttp import web
+from mock_server import (
+    SITE_HOST,
+    STATS_KEY,
+    add_arguments,
+    create_app,
+    parse_settings,
+)
+
+from custom_components.energyua.api import EnergyUAApiClient, EnergyUAApiClientError
+from custom_components.energyua.breaker import EnergyUACircuitBreaker
+from custom_components.energyua.cache import EnergyUAFetchCache
+from custom_components.energyua.stats import EnergyUAStats
+
+LAG_PROBE_INTERVAL = 0.005
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes up a sleeping task."""
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        self.lags: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start probing the event loop."""
+        self._task = asyncio.get_running_loop().create_task(self._probe())
+
+    async def stop(self) -> None:
+        """Stop probing the event loop."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _probe(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            self.lags.append(time.perf_counter() - started - LAG_PROBE_INTERVAL)
+
+
+class SimulatedEntry:
+    """A client polling like the coordinator of one config entry."""
+
+    def __init__(self, client: EnergyUAApiClient) -> None:
+        """Initialize the entry."""
+        self.client = client
+        self.durations: list[float] = []
+        self.failures = 0
+
+    async def async_setup(self) -> None:
+        """Fetch regions and groups like the coordinator setup."""
+        await self.client.fetch_regions()
+        await self.client.fetch_groups()
+
+    async def async_refresh(self, delay: float) -> None:
+        """Refresh the schedule after a delay."""
+        await asyncio.sleep(delay)
+        started = time.perf_counter()
+        try:
+            await self.client.async_get_data()
+        except EnergyUAApiClientError:
+            self.failures += 1
+        self.durations.append(time.perf_counter() - started)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Get a percentile of the values, 0 when there are none."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def fetch_server_stats(
+    session: aiohttp.ClientSession, base_url: str
+) -> dict[str, int]:
+    """Get request counts from a stand-in server."""
+    async with session.get(f"{base_url}/_stats") as response:
+        return await response.json()
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Run the load test."""
+    runner: web.AppRunner | None = None
+    server_counters: Counter[str] | None = None
+    base_url = args.base_url
+
+    if base_url is None:
+        app = create_app(parse_settings(args))
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        base_url = f"http://127.0.0.1:{port}"
+        server_counters = app[STATS_KEY]
+
+    session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=100))
+    fetch_cache = EnergyUAFetchCache()
+    breaker = EnergyUACircuitBreaker()
+
+    probe = EnergyUAApiClient(session=session, base_url=base_url)
+    await probe.fetch_regions()
+    regions = [region for region in probe.regions if region != SITE_HOST]
+    probe.region = regions[0]
+    await probe.fetch_groups()
+    groups = list(probe.groups)
+    sys.stdout.write(
+        f"{len(regions)} regions, {len(groups)} groups at {base_url}, "
+        f"simulating {args.entries} entries\n"
+    )
+
+    entries = [
+        SimulatedEntry(
+            EnergyUAApiClient(
+                session=session,
+                region=regions[i // len(groups) % len(regions)],
+                group=groups[i % len(groups)],
+                fetch_cache=fetch_cache,
+                circuit_breaker=breaker,
+                region_snapshot=args.region_snapshot,
+                stats=EnergyUAStats(enabled=True),
+                base_url=base_url,
+            )
+        )
+        for i in range(args.entries)
+    ]
+
+    monitor = LoopLagMonitor()
+    monitor.start()
+    started = time.perf_counter()
+
+    await asyncio.gather(*(entry.async_setup() for entry in entries))
+    for round_number in range(1, args.rounds + 1):
+        round_started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                entry.async_refresh(random.uniform(0, args.interval))  # noqa: S311
+                for entry in entries
+            )
+        )
+        sys.stdout.write(
+            f"round {round_number}: {time.perf_counter() - round_started:.2f} s\n"
+        )
+
+    elapsed = time.perf_counter() - started
+    await monitor.stop()
+
+    counters: Counter[str] = Counter()
+    for entry in entries:
+        counters.update(entry.client.stats.counters)
+    durations = [d for entry in entries for d in entry.durations]
+    failures = sum(entry.failures for entry in entries)
+    served = (
+        dict(server_counters)
+        if server_counters is not None
+        else await fetch_server_stats(session, base_url)
+    )
+
+    await session.close()
+    if runner is not None:
+        await runner.cleanup()
+
+    lags = monitor.lags
+    lines = [
+        f"elapsed: {elapsed:.2f} s",
+        f"server requests: {served.get('requests', 0)}, "
+        f"304: {served.get('not_modified', 0)}, errors: {served.get('errors', 0)}",
+        f"client requests: {counters['requests']}, "
+        f"retries: {counters['retries']}, "
+        f"downloaded: {counters['bytes_downloaded'] / 1024:.0f} KiB",
+        f"fetch cache: {dict(fetch_cache.counters)}",
+        f"refreshes: {len(durations)}, failed: {failures}",
+        "refresh latency: "
+        f"median {statistics.median(durations or [0]) * 1000:.1f} ms, "
+        f"p99 {percentile(durations, 0.99) * 1000:.1f} ms",
+        "loop lag: "
+        f"median {statistics.median(lags or [0]) * 1000:.2f} ms, "
+        f"p99 {percentile(lags, 0.99) * 1000:.2f} ms, "
+        f"max {max(lags, default=0) * 1000:.2f} ms",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 0
+
+
+def main() -> int:
+    """Parse arguments and run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--interval", type=float, default=5, help="seconds each round is spread over"
+    )
+    parser.add_argument(
+        "--region-snapshot",
+        action="store_true",
+        help="read schedules from the region page",
+    )
+    parser.add_argument("--base-url", help="use a stand-in server already running")
+    add_arguments(parser)
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+# ruff: noqa: INP001
+"""
+Stand-in for energy-ua.info serving generated or recorded pages.
+
+Pages are served as /{host}{path}, which is how EnergyUAApiClient requests
+them when created with base_url, for example:
+
+    EnergyUAApiClient(base_url="http://127.0.0.1:8080", region=..., group=...)
+
+Schedules change every --mutate-every seconds, requests can be slowed down
+with --latency and failed with --error-rate, and /_stats reports how many
+requests each page received. Pages saved from the site are served instead
+of generated ones when found under --pages as {host}.html or
+{host}/cherga/{group}.html.
+
+Run with scripts/mock_server, see --help for the options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from aiohttp import web
+
+SITE_HOST = "energy-ua.info"
+GROUP_PATH = "/cherga/"
+DEFAULT_REGIONS = ("lviv", "kyiv", "odesa", "kharkiv")
+DEFAULT_GROUPS = tuple(f"{queue}-{sub}" for queue in range(1, 7) for sub in (1, 2))
+PAGE_PADDING = 150_000
+
+STATS_KEY = web.AppKey("stats", Counter)
+
+
+@dataclass(frozen=True, kw_only=True)
+class MockSettings:
+    """Behavior of the stand-in server."""
+
+    regions: tuple[str, ...] = DEFAULT_REGIONS
+    groups: tuple[str, ...] = DEFAULT_GROUPS
+    latency: float = 0
+    jitter: float = 0
+    error_rate: float = 0
+    mutate_every: float = 0
+    region_schedules: bool = False
+    pages: Path | None = None
+    seed: int | None = None
+
+
+class MockSite:
+    """Generate the pages of the site from a schedule that changes over time."""
+
+    def __init__(self, settings: MockSettings) -> None:
+        """Initialize the site."""
+        self.settings = settings
+        self.hosts = [SITE_HOST, *(f"{r}.{SITE_HOST}" for r in settings.regions)]
+        self.started = time.monotonic()
+        self.random = random.Random(settings.seed)  # noqa: S311
+        filler = '<div class="news"><p>Новини енергетики.</p></div>'
+        self.padding = filler * (PAGE_PADDING // len(filler))
+
+    @property
+    def version(self) -> int:
+        """Get the schedule version, increasing every mutation interval."""
+        if not self.settings.mutate_every:
+            return 0
+        return int((time.monotonic() - self.started) // self.settings.mutate_every)
+
+    def schedule(self, host: str, group: str) -> list[list[tuple[str, str]]]:
+        """Build today's and tomorrow's outages for a group."""
+        digest = hashlib.sha256(f"{host}/{group}/{self.version}".encode()).digest()
+        days = []
+        for day in range(2):
+            offset = digest[day] % 4
+            length = 1 + digest[day + 2] % 3
+            days.append(
+                [
+                    (f"{hour:02d}:00", f"{(hour + length) % 24:02d}:30")
+                    for hour in range(offset, 24, 8)
+                ]
+            )
+        return days
+
+    def section(self, periods: list[tuple[str, str]]) -> str:
+        """Render a day section with the markup of the site."""
+        spans = "".join(
+            f"<span><b>{start}</b> - <b>{end}</b></span>" for start, end in periods
+        )
+        return f'<div class="scale_info"><div class="periods_items">{spans}</div></div>'
+
+    def page(self, host: str, body: str) -> str:
+        """Wrap content with the group menu, filler and regions footer."""
+        groups = "".join(
+            f'<a href="https://{host}{GROUP_PATH}{group}">Черга {group}</a>'
+            for group in self.settings.groups
+        )
+        regions = "".join(
+            f'<li><a href="https://{region}/">{region.split(".")[0]}</a></li>'
+            for region in self.hosts[1:]
+        )
+        return (
+            '<html><head><meta charset="utf-8"></head><body>'
+            f'<div class="select_group_list">{groups}</div>{self.padding}{body}'
+            f'<ul class="footer_regions_list">{regions}</ul></body></html>'
+        )
+
+    def region_page(self, host: str) -> str:
+        """Render a region page, optionally carrying every group's schedule."""
+        if not self.settings.region_schedules:
+            return self.page(host, "")
+        return self.page(
+            host,
+            "".join(
+                f'<h2><a href="{GROUP_PATH}{group}">Черга {group}</a></h2>'
+                + "".join(self.section(day) for day in self.schedule(host, group))
+                for group in self.settings.groups
+            ),
+        )
+
+    def group_page(self, host: str, group: str) -> str:
+        """Render a group page."""
+        return self.page(
+            host, "".join(self.section(day) for day in self.schedule(host, group))
+        )
+
+    def recorded(self, host: str, path: str) -> str | None:
+        """Get a page saved from the site, if there is one."""
+        if self.settings.pages is None:
+            return None
+        file = self.settings.pages / f"{host}{path.rstrip('/')}.html"
+        return file.read_text(encoding="utf-8") if file.is_file() else None
+
+
+def create_app(settings: MockSettings) -> web.Application:
+    """Create the stand-in server application."""
+    site = MockSite(settings)
+    app = web.Application()
+    app[STATS_KEY] = Counter()
+
+    async def handle_page(request: web.Request) -> web.StreamResponse:
+        host = request.match_info["host"]
+        path = request.match_info.get("path", "")
+        stats = app[STATS_KEY]
+        stats["requests"] += 1
+        stats[f"/{host}{path}"] += 1
+
+        if host not in site.hosts:
+            raise web.HTTPNotFound
+
+        if delay := settings.latency + site.random.uniform(0, settings.jitter):
+            await asyncio.sleep(delay)
+
+        if site.random.random() < settings.error_rate:
+            stats["errors"] += 1
+            raise web.HTTPServiceUnavailable
+
+        if (html := site.recorded(host, path)) is None:
+            if not path:
+                html = site.region_page(host)
+            elif path.startswith(GROUP_PATH):
+                html = site.group_page(host, path.removeprefix(GROUP_PATH))
+            else:
+                raise web.HTTPNotFound
+
+        etag = f'"{hashlib.sha256(html.encode()).hexdigest()[:16]}"'
+        if request.headers.get("If-None-Match") == etag:
+            stats["not_modified"] += 1
+            return web.Response(status=304, headers={"ETag": etag})
+
+        return web.Response(text=html, content_type="text/html", headers={"ETag": etag})
+
+    async def handle_stats(_request: web.Request) -> web.Response:
+        return web.json_response({"version": site.version, **app[STATS_KEY]})
+
+    app.router.add_get("/_stats", handle_stats)
+    app.router.add_get("/{host}", handle_page)
+    app.router.add_get("/{host}{path:/.*}", handle_page)
+    return app
+
+
+def parse_settings(args: argparse.Namespace) -> MockSettings:
+    """Build server settings from command line arguments."""
+    return MockSettings(
+        regions=tuple(args.regions),
+        groups=tuple(args.groups),
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        mutate_every=args.mutate_every,
+        region_schedules=args.region_schedules,
+        pages=args.pages,
+        seed=args.seed,
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the server options to a command line parser."""
+    parser.add_argument("--regions", nargs="+", default=DEFAULT_REGIONS)
+    parser.add_argument("--groups", nargs="+", default=DEFAULT_GROUPS)
+    parser.add_argument(
+        "--latency", type=float, default=0, help="seconds added to every response"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0, help="up to this many more seconds"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0, help="fraction of 503 responses"
+    )
+    parser.add_argument(
+        "--mutate-every",
+        type=float,
+        default=0,
+        help="seconds between schedule changes, 0 to never change",
+    )
+    parser.add_argument(
+        "--region-schedules",
+        action="store_true",
+        help="publish every group's schedule on the region page",
+    )
+    parser.add_argument("--pages", type=Path, help="directory of recorded pages")
+    parser.add_argument("--seed", type=int, help="seed for latency and errors")
+
+
+def main() -> None:
+    """Run the stand-in server."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    web.run_app(create_app(parse_settings(args)), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
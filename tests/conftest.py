@@ -0,0 +1,164 @@
+"""Shared fixtures for EnergyUA tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from aiohttp import web
+from homeassistant.util import slugify
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.energyua.api import EnergyUAApiClient
+from custom_components.energyua.const import CONF_GROUP, CONF_REGION, DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+    from aiohttp.test_utils import TestServer
+    from homeassistant.core import HomeAssistant
+    from pytest_aiohttp import AiohttpServer
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+    type Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+FIXTURES = Path(__file__).parent / "fixtures"
+REGION = "lviv.energy-ua.info"
+GROUP = "1-1"
+GROUP_PAGE = f"/{REGION}/cherga/{GROUP}"
+SITE_URL = "https://energy-ua.info"
+REGION_URL = f"https://{REGION}"
+
+
+def load_fixture(name: str) -> str:
+    """Read a page saved under tests/fixtures."""
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def group_page(*days: list[tuple[str, str]]) -> str:
+    """Render a group page with one section of (start, end) outages per day."""
+    sections = "".join(
+        '<div class="scale_info"><div class="periods_items">'
+        + "".join(f"<span><b>{start}</b> - <b>{end}</b></span>" for start, end in day)
+        + "</div></div>"
+        for day in days
+    )
+    return f'<html><body>{sections}<ul class="footer_regions_list"></ul></body></html>'
+
+
+class FakeSite:
+    """Stand-in for the site, serving pages as {host}{path}."""
+
+    server: TestServer
+
+    def __init__(self) -> None:
+        """Initialize a site without pages."""
+        self.handlers: dict[str, Handler] = {}
+        self.requests: list[web.Request] = []
+        self.peers: list[tuple[str, int]] = []
+
+    def page(self, path: str, html: str, etag: str | None = None) -> None:
+        """Serve a page, answering 304 when the client already has its ETag."""
+
+        async def handler(request: web.Request) -> web.StreamResponse:
+            if etag is not None and request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers={"ETag": etag})
+            headers = {"ETag": etag} if etag is not None else None
+            return web.Response(text=html, content_type="text/html", headers=headers)
+
+        self.handlers[path] = handler
+
+    def route(self, path: str, handler: Handler) -> None:
+        """Answer requests for a path with a custom handler."""
+        self.handlers[path] = handler
+
+    def count(self, path: str) -> int:
+        """Count the requests made for a path."""
+        return sum(request.path == path for request in self.requests)
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        """Dispatch a request to the handler of its path."""
+        self.requests.append(request)
+        if request.transport is not None:
+            self.peers.append(request.transport.get_extra_info("peername"))
+        if (handler := self.handlers.get(request.path)) is None:
+            raise web.HTTPNotFound
+        return await handler(request)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(request: pytest.FixtureRequest) -> None:
+    """
+    Enable loading the integration in every test.
+
+    The recorder has to be set up before Home Assistant starts, so tests
+    using it get it first.
+    """
+    if "recorder_mock" in request.fixturenames:
+        request.getfixturevalue("recorder_mock")
+    request.getfixturevalue("enable_custom_integrations")
+
+
+@pytest.fixture
+async def site(
+    aiohttp_server: AiohttpServer,
+    socket_enabled: None,  # noqa: ARG001
+) -> FakeSite:
+    """Start a fake site on a local port."""
+    fake = FakeSite()
+    app = web.Application()
+    app.router.add_route("GET", "/{path:.*}", fake.handle)
+    fake.server = await aiohttp_server(app)
+    return fake
+
+
+def make_client(site: FakeSite, **kwargs: Any) -> EnergyUAApiClient:
+    """Create a client of the fake site for one group."""
+    return EnergyUAApiClient(
+        region=REGION,
+        group=GROUP,
+        base_url=str(site.server.make_url("")),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+async def client(site: FakeSite) -> AsyncIterator[EnergyUAApiClient]:
+    """Create a client of the fake site for one group."""
+    api = make_client(site)
+    yield api
+    await api.async_close()
+
+
+def mock_site(
+    aioclient_mock: AiohttpClientMocker,
+    *days: list[tuple[str, str]],
+    groups: Iterable[str] = (GROUP,),
+) -> None:
+    """Mock the site pages, with (start, end) outages per day for the groups."""
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(SITE_URL, text=load_fixture("main.html"))
+    aioclient_mock.get(REGION_URL, text=load_fixture("region.html"))
+    for group in groups:
+        aioclient_mock.get(f"{REGION_URL}/cherga/{group}", text=group_page(*days))
+
+
+async def setup_entry(
+    hass: HomeAssistant, group: str = GROUP, **options: Any
+) -> MockConfigEntry:
+    """Add and set up a config entry for a group of the region."""
+    await hass.config.async_set_time_zone("Europe/Kyiv")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=f"{REGION} {group}",
+        unique_id=slugify(f"{REGION}_{group}"),
+        data={CONF_REGION: REGION, CONF_GROUP: group},
+        options=options,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
@@ -0,0 +1,111 @@
+"""Tests of the EnergyUA API client against a fake site."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from freezegun import freeze_time
+
+from custom_components.energyua.api import UKRAINE_TZ, EnergyUAApiClient, LabelIndex
+
+from .conftest import GROUP_PAGE, FakeSite, group_page
+
+if TYPE_CHECKING:
+    from custom_components.energyua.periods import Period
+
+
+def _local(period: Period) -> tuple[str, str]:
+    return (period.start.isoformat(), period.end.isoformat())
+
+
+async def test_archive_keeps_outage_dropped_at_rollover(
+    site: FakeSite, client: EnergyUAApiClient
+) -> None:
+    """An outage ending at midnight stays archived after the page rolls over."""
+    with freeze_time("2026-10-18 23:50:00+03:00", real_asyncio=True) as frozen:
+        site.page(GROUP_PAGE, group_page([("22:00", "00:00")]))
+        await client.async_get_data()
+        assert list(client.archive) == []
+
+        frozen.move_to("2026-10-19 00:10:00+03:00")
+        site.page(GROUP_PAGE, group_page([("08:00", "10:00")]))
+        await client.async_get_data()
+
+    assert [_local(period) for period in client.archive] == [
+        ("2026-10-18T22:00:00+03:00", "2026-10-19T00:00:00+03:00")
+    ]
+    assert [_local(period) for period in client.get_all_periods()] == [
+        ("2026-10-18T22:00:00+03:00", "2026-10-19T00:00:00+03:00"),
+        ("2026-10-19T08:00:00+03:00", "2026-10-19T10:00:00+03:00"),
+    ]
+
+
+async def test_restore_archives_periods_that_ended() -> None:
+    """Restored periods that ended while stopped are archived."""
+    client = EnergyUAApiClient(region="lviv.energy-ua.info", group="1-1")
+    start = datetime(2026, 10, 18, 8, tzinfo=UKRAINE_TZ)
+    end = datetime(2026, 10, 18, 10, tzinfo=UKRAINE_TZ)
+
+    with freeze_time("2026-10-19 09:00:00+03:00"):
+        client.restore({"periods": [[start.isoformat(), end.isoformat()]]})
+
+    assert [_local(period) for period in client.archive] == [
+        ("2026-10-18T08:00:00+03:00", "2026-10-18T10:00:00+03:00")
+    ]
+
+
+async def test_partial_read_reuses_connection(
+    site: FakeSite, client: EnergyUAApiClient
+) -> None:
+    """Polls cut after the schedule still return the connection to the pool."""
+    page = group_page([("08:00", "10:00")])
+    site.page(GROUP_PAGE, page.replace("</body>", "<p>news</p>" * 20000 + "</body>"))
+
+    for _ in range(4):
+        await client.fetch_periods()
+
+    assert len(client.periods) == 1
+    assert site.count(GROUP_PAGE) == 4
+    assert len(set(site.peers)) == 1
+
+
+def test_label_index_looks_up_both_ways() -> None:
+    """Options are found by value and by label, the first value of a label wins."""
+    index = LabelIndex({"1-1": "Черга 1.1", "1-2": "Черга 1.2", "old-1-2": "Черга 1.2"})
+
+    assert index.option("1-2") == {"value": "1-2", "label": "Черга 1.2"}
+    assert index.option(index.values["Черга 1.2"]) == index.option("1-2")
+    assert index.option("2-1") is None
+    assert index.option(None) is None
+    assert [option["value"] for option in index.options] == ["1-1", "1-2", "old-1-2"]
+
+
+def test_label_index_is_read_only() -> None:
+    """The shared labels, lookups and options cannot be changed by callers."""
+    index = LabelIndex({"1-1": "Черга 1.1"})
+    option = index.option("1-1")
+    assert option is not None
+
+    with pytest.raises(TypeError):
+        option["label"] = "Черга 2.1"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        index.labels["2-1"] = "Черга 2.1"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        index.values["Черга 2.1"] = "2-1"  # type: ignore[index]
+
+
+def test_label_index_is_rebuilt_only_when_labels_change() -> None:
+    """Setting equal labels keeps the options, different labels rebuild them."""
+    client = EnergyUAApiClient()
+    client.groups = {"1-1": "Черга 1.1", "1-2": "Черга 1.2"}
+    options = client.get_groups()
+
+    client.groups = {"1-1": "Черга 1.1", "1-2": "Черга 1.2"}
+    assert client.get_groups() is options
+
+    client.groups = {"1-1": "Черга 1.1"}
+    assert client.get_groups() is not options
+    assert client.get_group_by_label("Черга 1.2") is None
+    assert client.get_group_by_value("1-1", only_label=True) == "Черга 1.1"
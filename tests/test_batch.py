@@ -0,0 +1,137 @@
+"""Tests of batched polling of the groups of a region."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.energyua.batch import DATA_REGION_BATCHES
+from custom_components.energyua.const import (
+    BATCH_PARALLEL_REQUESTS,
+    CONF_BATCH_MODE,
+    MAX_UPDATE_INTERVAL,
+    UPDATE_INTERVAL_JITTER,
+)
+
+from .conftest import REGION, mock_site, setup_entry
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+GROUPS = ("1-1", "1-2", "2-1", "2-2", "3-1")
+DAYS = ([("10:00", "12:00")], [("08:00", "09:00")])
+AFTER_ANY_INTERVAL = MAX_UPDATE_INTERVAL * (1 + UPDATE_INTERVAL_JITTER) + timedelta(
+    seconds=1
+)
+
+
+async def setup_batch(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> list[MockConfigEntry]:
+    """Set up a batched entry for every group of the region."""
+    freezer.move_to("2026-10-18 09:00:00+03:00")
+    mock_site(aioclient_mock, *DAYS, groups=GROUPS)
+    return [
+        await setup_entry(hass, group, **{CONF_BATCH_MODE: True}) for group in GROUPS
+    ]
+
+
+def group_requests(aioclient_mock: AiohttpClientMocker) -> int:
+    """Count the requests made for group pages."""
+    return sum("/cherga/" in str(url) for _, url, _, _ in aioclient_mock.mock_calls)
+
+
+async def test_batched_coordinators_do_not_poll_themselves(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Batched coordinators have no timer and are refreshed by the batch."""
+    entries = await setup_batch(hass, aioclient_mock, freezer)
+    batch = hass.data[DATA_REGION_BATCHES][REGION]
+
+    for entry in entries:
+        coordinator = entry.runtime_data.coordinator
+        assert coordinator.update_interval is None
+        assert coordinator.batch is batch
+        assert coordinator.effective_update_interval == batch.interval
+
+    aioclient_mock.mock_calls.clear()
+    freezer.tick(AFTER_ANY_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert group_requests(aioclient_mock) == len(GROUPS)
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_batch_limits_refreshes_in_flight(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A batch refresh runs at most the parallel request limit at once."""
+    entries = await setup_batch(hass, aioclient_mock, freezer)
+    batch = hass.data[DATA_REGION_BATCHES][REGION]
+    release = asyncio.Event()
+    in_flight: list[int] = []
+    refreshed = 0
+
+    async def refresh() -> None:
+        nonlocal refreshed
+        in_flight.append(in_flight[-1] + 1 if in_flight else 1)
+        await release.wait()
+        in_flight.append(in_flight[-1] - 1)
+        refreshed += 1
+
+    for entry in entries:
+        entry.runtime_data.coordinator.async_refresh = refresh
+
+    task = hass.async_create_task(batch.async_refresh())
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert in_flight == list(range(1, BATCH_PARALLEL_REQUESTS + 1))
+
+    release.set()
+    await task
+    assert refreshed == len(GROUPS)
+    assert max(in_flight) == BATCH_PARALLEL_REQUESTS
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_unloading_last_member_cancels_timer(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """The batch keeps polling until its last member is unloaded."""
+    entries = await setup_batch(hass, aioclient_mock, freezer)
+    batch = hass.data[DATA_REGION_BATCHES][REGION]
+
+    for entry in entries[:-1]:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    assert batch.coordinators == {entries[-1].runtime_data.coordinator}
+    assert batch._unsub_refresh is not None
+
+    assert await hass.config_entries.async_unload(entries[-1].entry_id)
+    assert batch._unsub_refresh is None
+    assert REGION not in hass.data[DATA_REGION_BATCHES]
+
+    aioclient_mock.mock_calls.clear()
+    freezer.tick(AFTER_ANY_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert aioclient_mock.mock_calls == []
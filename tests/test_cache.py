@@ -0,0 +1,109 @@
+"""Tests of the fetch cache shared by all clients."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from custom_components.energyua import cache
+from custom_components.energyua.cache import EnergyUAFetchCache
+
+URL = "https://lviv.energy-ua.info"
+
+
+class Fetcher:
+    """Fetch function counting its calls, optionally held until released."""
+
+    def __init__(self, *, hold: bool = False) -> None:
+        """Initialize the fetcher."""
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.failures = 0
+        if not hold:
+            self.release.set()
+
+    async def __call__(self, url: str) -> str:
+        """Fetch a page."""
+        self.calls += 1
+        await self.release.wait()
+        if self.failures:
+            self.failures -= 1
+            msg = "site is down"
+            raise ConnectionError(msg)
+        return f"<html>{url} #{self.calls}</html>"
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Control the time the cache sees."""
+    now = [0.0]
+    monkeypatch.setattr(cache, "monotonic", lambda: now[0])
+    return now
+
+
+async def test_concurrent_callers_share_one_fetch() -> None:
+    """Callers arriving while a page is fetched wait for the same request."""
+    fetch_cache = EnergyUAFetchCache()
+    fetch = Fetcher(hold=True)
+
+    pending = asyncio.gather(*(fetch_cache.async_get(URL, fetch) for _ in range(3)))
+    await asyncio.sleep(0)
+    fetch.release.set()
+
+    assert await pending == [f"<html>{URL} #1</html>"] * 3
+    assert fetch.calls == 1
+    assert fetch_cache.counters["misses"] == 1
+    assert fetch_cache.counters["joined"] == 2
+
+
+async def test_cancelled_caller_does_not_cancel_fetch() -> None:
+    """Cancelling one caller leaves the shared fetch running for the others."""
+    fetch_cache = EnergyUAFetchCache()
+    fetch = Fetcher(hold=True)
+
+    first = asyncio.create_task(fetch_cache.async_get(URL, fetch))
+    second = asyncio.create_task(fetch_cache.async_get(URL, fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    fetch.release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert await second == f"<html>{URL} #1</html>"
+    assert await fetch_cache.async_get(URL, fetch) == f"<html>{URL} #1</html>"
+    assert fetch.calls == 1
+
+
+async def test_failed_fetch_is_not_cached() -> None:
+    """An error reaches every waiting caller and the next call fetches again."""
+    fetch_cache = EnergyUAFetchCache()
+    fetch = Fetcher()
+    fetch.failures = 1
+
+    with pytest.raises(ConnectionError):
+        await fetch_cache.async_get(URL, fetch)
+
+    assert await fetch_cache.async_get(URL, fetch) == f"<html>{URL} #2</html>"
+    assert fetch.calls == 2
+
+
+async def test_entries_expire_after_ttl(clock: list[float]) -> None:
+    """Pages are served from the cache until they are older than the ttl."""
+    fetch_cache = EnergyUAFetchCache(ttl=timedelta(minutes=10))
+    fetch = Fetcher()
+
+    assert await fetch_cache.async_get(URL, fetch) == f"<html>{URL} #1</html>"
+
+    clock[0] += 599
+    assert await fetch_cache.async_get(URL, fetch) == f"<html>{URL} #1</html>"
+    assert (
+        await fetch_cache.async_get(URL, fetch, ttl=timedelta(minutes=5))
+        == f"<html>{URL} #2</html>"
+    )
+
+    clock[0] += 600
+    assert await fetch_cache.async_get(URL, fetch) == f"<html>{URL} #3</html>"
+    assert fetch.calls == 3
+    assert fetch_cache.counters["hits"] == 1
@@ -0,0 +1,176 @@
+"""Tests of schedules combined from several groups."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.energyua.api import UKRAINE_TZ
+from custom_components.energyua.const import (
+    CONF_COMBINE_WITH,
+    STATE_NORMAL,
+    STATE_OUTAGE,
+    STATE_PARTIAL,
+)
+from custom_components.energyua.periods import Period, PeriodIndex
+
+from .conftest import REGION_URL, group_page, mock_site, setup_entry
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+    from custom_components.energyua.combine import EnergyUACombination
+
+
+def mock_groups(
+    aioclient_mock: AiohttpClientMocker, pages: dict[str, list[tuple[str, str]]]
+) -> None:
+    """Mock the site with today's (start, end) outages of each group."""
+    mock_site(aioclient_mock, groups=())
+    for group, today in pages.items():
+        aioclient_mock.get(f"{REGION_URL}/cherga/{group}", text=group_page(today))
+
+
+def periods(*bounds: tuple[str, str], day: int = 18) -> PeriodIndex:
+    """Build periods of (start, end) local times on a day of October 2026."""
+    return PeriodIndex(
+        Period.from_datetimes(
+            datetime.fromisoformat(f"2026-10-{day}T{start}").replace(tzinfo=UKRAINE_TZ),
+            datetime.fromisoformat(f"2026-10-{day}T{end}").replace(tzinfo=UKRAINE_TZ),
+        )
+        for start, end in bounds
+    )
+
+
+async def setup_pair(
+    hass: HomeAssistant, *other_ids: str
+) -> tuple[MockConfigEntry, MockConfigEntry, EnergyUACombination]:
+    """Set up group 1-2, then group 1-1 combined with it and other entries."""
+    other = await setup_entry(hass, "1-2")
+    entry = await setup_entry(
+        hass, "1-1", **{CONF_COMBINE_WITH: [other.entry_id, *other_ids]}
+    )
+    combination = entry.runtime_data.combination
+    assert combination is not None
+    return entry, other, combination
+
+
+async def test_combined_outages(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Any, all and partial outages follow the union and intersection."""
+    freezer.move_to("2026-10-18 09:00:00+03:00")
+    mock_groups(
+        aioclient_mock, {"1-1": [("10:00", "12:00")], "1-2": [("11:00", "13:00")]}
+    )
+    entry, other, combination = await setup_pair(hass)
+
+    assert combination.any_outages == periods(("10:00", "13:00"))
+    assert combination.all_outages == periods(("11:00", "12:00"))
+    assert combination.partial_outages == periods(
+        ("10:00", "11:00"), ("12:00", "13:00")
+    )
+    assert combination.current_state == STATE_NORMAL
+    assert combination.state.next_outage == periods(("11:00", "12:00"))[0].start
+
+    for at, state in (
+        ("2026-10-18 10:00:00+03:00", STATE_PARTIAL),
+        ("2026-10-18 11:00:00+03:00", STATE_OUTAGE),
+        ("2026-10-18 12:00:00+03:00", STATE_PARTIAL),
+        ("2026-10-18 13:00:00+03:00", STATE_NORMAL),
+    ):
+        freezer.move_to(at)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert combination.current_state == state, at
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert await hass.config_entries.async_unload(other.entry_id)
+
+
+async def test_combination_skips_missing_and_unloaded_members(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Members that do not exist or are unloaded do not take part."""
+    freezer.move_to("2026-10-18 09:00:00+03:00")
+    mock_groups(
+        aioclient_mock, {"1-1": [("10:00", "12:00")], "1-2": [("11:00", "13:00")]}
+    )
+    entry, other, combination = await setup_pair(hass, "missing")
+    assert combination.group_labels == ("Черга 1.1", "Черга 1.2")
+
+    assert await hass.config_entries.async_unload(other.entry_id)
+    await entry.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert combination.group_labels == ("Черга 1.1",)
+    assert combination.any_outages == periods(("10:00", "12:00"))
+    assert combination.all_outages == periods(("10:00", "12:00"))
+    assert combination.partial_outages == PeriodIndex()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_combination_recomputes_only_on_changes(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Refreshes without schedule changes keep the combined periods."""
+    freezer.move_to("2026-10-18 09:00:00+03:00")
+    mock_groups(
+        aioclient_mock, {"1-1": [("10:00", "12:00")], "1-2": [("11:00", "13:00")]}
+    )
+    entry, other, combination = await setup_pair(hass)
+    any_outages = combination.any_outages
+
+    await other.runtime_data.coordinator.async_refresh()
+    await entry.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert combination.any_outages is any_outages
+
+    mock_groups(
+        aioclient_mock, {"1-1": [("10:00", "12:00")], "1-2": [("14:00", "15:00")]}
+    )
+    await other.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert combination.any_outages == periods(("10:00", "12:00"), ("14:00", "15:00"))
+    assert combination.all_outages == PeriodIndex()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert await hass.config_entries.async_unload(other.entry_id)
+
+
+async def test_combination_on_daylight_saving_day(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """The window starts at Kyiv midnight and keeps the 25th hour of the day."""
+    freezer.move_to("2026-10-25 01:00:00+03:00")
+    mock_groups(
+        aioclient_mock, {"1-1": [("02:00", "03:00"), ("22:00", "23:30")], "1-2": []}
+    )
+    entry, other, combination = await setup_pair(hass)
+
+    assert combination.any_outages == periods(
+        ("02:00", "03:00"), ("22:00", "23:30"), day=25
+    )
+    assert [period.start.isoformat() for period in combination.any_outages] == [
+        "2026-10-25T02:00:00+03:00",
+        "2026-10-25T22:00:00+02:00",
+    ]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert await hass.config_entries.async_unload(other.entry_id)
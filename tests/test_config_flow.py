@@ -0,0 +1,53 @@
+"""Tests of the EnergyUA config flow."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant import config_entries
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.energyua.const import CONF_GROUP, CONF_REGION, DOMAIN
+
+from .conftest import GROUP, REGION, mock_site
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+
+def select_options(result: config_entries.ConfigFlowResult, key: str) -> list[dict]:
+    """Get the options of a select field of a form."""
+    assert result["type"] is FlowResultType.FORM
+    schema = result["data_schema"]
+    assert schema is not None
+    return schema.schema[key].config["options"]
+
+
+async def test_user_flow_selects_region_and_group(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """The region and group forms list the labels read from the site."""
+    mock_site(aioclient_mock)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    regions = select_options(result, CONF_REGION)
+    assert {"value": REGION, "label": "Львівська"} in regions
+    assert all(type(option) is dict for option in regions)
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_REGION: REGION}
+    )
+    groups = select_options(result, CONF_GROUP)
+    assert groups[0] == {"value": GROUP, "label": "Черга 1.1"}
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_GROUP: GROUP}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["title"] == "Львівська Черга 1.1"
+    assert result["data"] == {CONF_REGION: REGION, CONF_GROUP: GROUP}
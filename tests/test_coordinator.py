@@ -0,0 +1,257 @@
+"""Tests of the EnergyUA coordinator."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.energyua import api
+from custom_components.energyua.const import (
+    DOMAIN,
+    EVENT_SCHEDULE_CHANGED,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    MISSING_TOMORROW_INTERVAL,
+    STALE_DATA_MAX_AGE,
+    STATE_OUTAGE,
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_JITTER,
+)
+
+from .conftest import GROUP, REGION, REGION_URL, mock_site, setup_entry
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+    from custom_components.energyua.coordinator import EnergyUACoordinator
+
+TODAY = [("10:00", "12:00")]
+TOMORROW = [("08:00", "09:00")]
+
+
+@pytest.fixture
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry immediately instead of waiting."""
+    monkeypatch.setattr(api, "RETRY_BACKOFF", 0)
+
+
+def entity_state(
+    hass: HomeAssistant, entry: MockConfigEntry, platform: str, key: str
+) -> str:
+    """Get the state of an entity of the entry by its description key."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        platform, DOMAIN, f"{entry.entry_id}-{key}"
+    )
+    assert entity_id is not None
+    state = hass.states.get(entity_id)
+    assert state is not None
+    return state.state
+
+
+def fail_group_page(aioclient_mock: AiohttpClientMocker) -> None:
+    """Make the group page answer with a server error."""
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(f"{REGION_URL}/cherga/{GROUP}", status=503)
+
+
+def assert_polls_every(coordinator: EnergyUACoordinator, interval: timedelta) -> None:
+    """Check the polling interval and the jittered interval of the next poll."""
+    assert coordinator.poll_interval == interval
+    assert coordinator.update_interval is not None
+    assert (
+        interval * (1 - UPDATE_INTERVAL_JITTER)
+        <= coordinator.update_interval
+        <= interval * (1 + UPDATE_INTERVAL_JITTER)
+    )
+
+
+async def test_schedule_changed_event(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A changed schedule fires an event with the added, removed and shifted."""
+    freezer.move_to("2026-10-18 09:00:00+03:00")
+    mock_site(aioclient_mock, [("10:00", "12:00"), ("20:00", "22:00")])
+    entry = await setup_entry(hass)
+    coordinator = entry.runtime_data.coordinator
+    events = async_capture_events(hass, EVENT_SCHEDULE_CHANGED)
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert events == []
+
+    mock_site(aioclient_mock, [("10:30", "12:00")], [("01:00", "02:00")])
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert [event.data for event in events] == [
+        {
+            "entry_id": entry.entry_id,
+            "region": REGION,
+            "group": GROUP,
+            "added": [
+                {
+                    "start": "2026-10-19T01:00:00+03:00",
+                    "end": "2026-10-19T02:00:00+03:00",
+                }
+            ],
+            "removed": [
+                {
+                    "start": "2026-10-18T20:00:00+03:00",
+                    "end": "2026-10-18T22:00:00+03:00",
+                }
+            ],
+            "shifted": [
+                {
+                    "old": {
+                        "start": "2026-10-18T10:00:00+03:00",
+                        "end": "2026-10-18T12:00:00+03:00",
+                    },
+                    "new": {
+                        "start": "2026-10-18T10:30:00+03:00",
+                        "end": "2026-10-18T12:00:00+03:00",
+                    },
+                }
+            ],
+        }
+    ]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_poll_backs_off_while_tomorrow_is_published(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Polling doubles up to the maximum once tomorrow's schedule is known."""
+    freezer.move_to("2026-10-18 09:00:00+03:00")
+    mock_site(aioclient_mock, TODAY, TOMORROW)
+    entry = await setup_entry(hass)
+    coordinator = entry.runtime_data.coordinator
+    assert_polls_every(coordinator, UPDATE_INTERVAL * 2)
+
+    await coordinator.async_refresh()
+    assert_polls_every(coordinator, UPDATE_INTERVAL * 4)
+
+    await coordinator.async_refresh()
+    assert_polls_every(coordinator, MAX_UPDATE_INTERVAL)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_poll_often_while_tomorrow_is_missing(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Polling stays short until tomorrow's schedule is published."""
+    freezer.move_to("2026-10-18 09:00:00+03:00")
+    mock_site(aioclient_mock, TODAY)
+    entry = await setup_entry(hass)
+    coordinator = entry.runtime_data.coordinator
+    assert_polls_every(coordinator, MISSING_TOMORROW_INTERVAL)
+
+    await coordinator.async_refresh()
+    assert_polls_every(coordinator, MISSING_TOMORROW_INTERVAL)
+    assert MISSING_TOMORROW_INTERVAL < UPDATE_INTERVAL
+
+    mock_site(aioclient_mock, TODAY, TOMORROW)
+    await coordinator.async_refresh()
+    assert_polls_every(coordinator, MIN_UPDATE_INTERVAL)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_poll_soon_after_schedule_changes(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A changed schedule is followed closely, then polling backs off again."""
+    freezer.move_to("2026-10-18 09:00:00+03:00")
+    mock_site(aioclient_mock, TODAY, TOMORROW)
+    entry = await setup_entry(hass)
+    coordinator = entry.runtime_data.coordinator
+    await coordinator.async_refresh()
+    assert_polls_every(coordinator, UPDATE_INTERVAL * 4)
+
+    mock_site(aioclient_mock, [("10:30", "12:00")], TOMORROW)
+    await coordinator.async_refresh()
+    assert_polls_every(coordinator, MIN_UPDATE_INTERVAL)
+
+    await coordinator.async_refresh()
+    assert_polls_every(coordinator, MIN_UPDATE_INTERVAL * 2)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.usefixtures("no_backoff")
+async def test_stale_schedule_is_served_after_error(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """The last schedule is kept through an error, until a refresh succeeds."""
+    freezer.move_to("2026-10-18 10:30:00+03:00")
+    mock_site(aioclient_mock, TODAY, TOMORROW)
+    entry = await setup_entry(hass)
+    coordinator = entry.runtime_data.coordinator
+    assert entity_state(hass, entry, "binary_sensor", "stale") == STATE_OFF
+
+    freezer.tick(STALE_DATA_MAX_AGE / 2)
+    fail_group_page(aioclient_mock)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert coordinator.is_stale
+    assert entity_state(hass, entry, "binary_sensor", "stale") == STATE_ON
+    assert entity_state(hass, entry, "sensor", "electricity") != STATE_UNAVAILABLE
+
+    mock_site(aioclient_mock, TODAY, TOMORROW)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert not coordinator.is_stale
+    assert entity_state(hass, entry, "binary_sensor", "stale") == STATE_OFF
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.usefixtures("no_backoff")
+async def test_stale_schedule_expires(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """The refresh fails once the last schedule is older than the maximum age."""
+    freezer.move_to("2026-10-18 10:30:00+03:00")
+    mock_site(aioclient_mock, TODAY, TOMORROW)
+    entry = await setup_entry(hass)
+    coordinator = entry.runtime_data.coordinator
+    assert entity_state(hass, entry, "sensor", "electricity") == STATE_OUTAGE
+
+    freezer.tick(STALE_DATA_MAX_AGE)
+    fail_group_page(aioclient_mock)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert not coordinator.last_update_success
+    assert entity_state(hass, entry, "sensor", "electricity") == STATE_UNAVAILABLE
+    assert entity_state(hass, entry, "binary_sensor", "stale") == STATE_UNAVAILABLE
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,76 @@
+"""Parity tests of the HTML parser backends."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.energyua.parser import (
+    PARSER_AUTO,
+    PARSER_SOUP,
+    PARSER_STREAM,
+    EnergyUAParser,
+    get_parser,
+)
+
+from .conftest import load_fixture
+
+PAGES = (
+    "main.html",
+    "region.html",
+    "region_schedules.html",
+    "group.html",
+    "group_without_outages.html",
+)
+METHODS = ("parse_regions", "parse_groups", "parse_periods", "parse_region_periods")
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("page", PAGES)
+def test_stream_parser_matches_soup_parser(page: str, method: str) -> None:
+    """The streaming parser extracts the same data as BeautifulSoup."""
+    html = load_fixture(page)
+
+    expected = getattr(get_parser(PARSER_SOUP), method)(html)
+
+    assert getattr(get_parser(PARSER_STREAM), method)(html) == expected
+
+
+@pytest.mark.parametrize("name", [PARSER_AUTO, PARSER_SOUP, PARSER_STREAM])
+def test_parsers_read_fixture_pages(name: str) -> None:
+    """Every backend finds the data on the fixture pages."""
+    parser = get_parser(name)
+
+    assert [text for _, text in parser.parse_regions(load_fixture("main.html"))] == [
+        "Київська",
+        "Львівська",
+        "Одеська",
+        "Харківська & місто",
+    ]
+    assert [href for href, _ in parser.parse_groups(load_fixture("region.html"))] == [
+        "/cherga/1-1",
+        "/cherga/1-2",
+        "/cherga/2-1",
+        "/cherga/2-2",
+        "/cherga/3-1",
+    ]
+    assert parser.parse_periods(load_fixture("group.html")) == [
+        [("00:00", "02:30"), ("08:00", "11:30"), ("20:00", "00:00")],
+        [("04:00", "07:30"), ("16:00", "19:30")],
+    ]
+    assert parser.parse_periods(load_fixture("group_without_outages.html")) == [[]]
+    assert parser.parse_region_periods(load_fixture("region_schedules.html")) == {
+        "1-1": [[("00:00", "02:30"), ("08:00", "11:30")], [("04:00", "07:30")]],
+        "1-2": [[]],
+        "2-1": [[("12:00", "15:30"), ("20:00", "00:00")], [("16:00", "19:30")]],
+    }
+
+
+def test_incomplete_backend_fails_on_construction() -> None:
+    """A backend missing one of the parse methods cannot be created."""
+
+    class IncompleteParser(EnergyUAParser):
+        def parse_regions(self, html: str) -> list:
+            return [(None, html)]
+
+    with pytest.raises(TypeError):
+        IncompleteParser()  # type: ignore[abstract]
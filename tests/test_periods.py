@@ -0,0 +1,239 @@
+"""Tests of the outage period structures."""
+
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from custom_components.energyua.api import UKRAINE_TZ, EnergyUAApiClient
+from custom_components.energyua.periods import (
+    Period,
+    PeriodIndex,
+    PeriodsDiff,
+    PowerState,
+    StateTimeline,
+    diff_periods,
+)
+
+DAY = datetime(2026, 10, 18, tzinfo=UKRAINE_TZ)
+HORIZON = timedelta(hours=3)
+
+
+def _at(clock: str) -> datetime:
+    return datetime.combine(DAY.date(), time.fromisoformat(clock), UKRAINE_TZ)
+
+
+def _index(*bounds: tuple[str, str]) -> PeriodIndex:
+    return PeriodIndex(
+        Period.from_datetimes(_at(start), _at(end)) for start, end in bounds
+    )
+
+
+# Two outages half an hour apart, and a third just inside the horizon.
+PERIODS_BOUNDS = (
+    ("08:00:00", "10:00:00"),
+    ("10:30:00", "11:00:00"),
+    ("14:00:00", "15:00:00"),
+)
+PERIODS = _index(*PERIODS_BOUNDS)
+
+
+def _state(
+    next_outage: str | None, next_restore: str | None, *, outage: bool
+) -> PowerState:
+    return PowerState(
+        outage,
+        None if next_outage is None else _at(next_outage),
+        None if next_restore is None else _at(next_restore),
+    )
+
+
+@pytest.mark.parametrize(
+    ("at", "expected"),
+    [
+        ("04:00:00", _state(None, None, outage=False)),
+        ("04:59:59", _state(None, None, outage=False)),
+        ("05:00:00", _state("08:00:00", "10:00:00", outage=False)),
+        ("07:59:59", _state("08:00:00", "10:00:00", outage=False)),
+        ("08:00:00", _state("10:30:00", "10:00:00", outage=True)),
+        ("09:59:59", _state("10:30:00", "10:00:00", outage=True)),
+        ("10:00:00", _state("10:30:00", "11:00:00", outage=False)),
+        ("10:29:59", _state("10:30:00", "11:00:00", outage=False)),
+        ("10:30:00", _state(None, "11:00:00", outage=True)),
+        ("10:59:59", _state(None, "11:00:00", outage=True)),
+        ("11:00:00", _state("14:00:00", "15:00:00", outage=False)),
+        ("14:00:00", _state(None, "15:00:00", outage=True)),
+        ("15:00:00", _state(None, None, outage=False)),
+        ("23:59:59", _state(None, None, outage=False)),
+    ],
+)
+def test_timeline_state_around_period_edges(at: str, expected: PowerState) -> None:
+    """Outages start at and restore at the exact edges of their periods."""
+    timeline = StateTimeline(PERIODS, _at("04:00:00"), HORIZON)
+
+    assert timeline.state_at(_at(at)) == expected
+    assert PERIODS.state_at(_at(at), HORIZON) == expected
+
+
+@pytest.mark.parametrize(
+    ("after", "expected"),
+    [
+        ("04:00:00", "05:00:00"),
+        ("05:00:00", "08:00:00"),
+        ("07:30:00", "08:00:00"),
+        ("08:00:00", "10:00:00"),
+        ("10:00:00", "10:30:00"),
+        ("10:30:00", "11:00:00"),
+        ("11:00:00", "14:00:00"),
+        ("14:00:00", "15:00:00"),
+        ("15:00:00", None),
+    ],
+)
+def test_timeline_next_change(after: str, expected: str | None) -> None:
+    """Changes happen where the state does, not at every point considered."""
+    timeline = StateTimeline(PERIODS, _at("04:00:00"), HORIZON)
+
+    assert timeline.next_change(_at(after)) == (
+        None if expected is None else _at(expected)
+    )
+
+
+def test_timeline_matches_index_every_minute() -> None:
+    """The precomputed timeline agrees with a lookup in the index."""
+    start = _at("00:00:00")
+    timeline = StateTimeline(PERIODS, start, HORIZON)
+
+    for minute in range(24 * 60):
+        at = start + timedelta(minutes=minute, seconds=minute % 60)
+        assert timeline.state_at(at) == PERIODS.state_at(at, HORIZON), at
+
+
+def test_timeline_of_adjacent_periods_has_one_outage() -> None:
+    """Periods touching each other on the page restore power only once."""
+    periods = EnergyUAApiClient._merge_periods(
+        [
+            Period.from_datetimes(_at("10:00:00"), _at("12:00:00")),
+            Period.from_datetimes(_at("08:00:00"), _at("10:00:00")),
+        ]
+    )
+    timeline = StateTimeline(periods, _at("07:00:00"), HORIZON)
+
+    assert timeline.state_at(_at("09:59:59")) == _state(None, "12:00:00", outage=True)
+    assert timeline.state_at(_at("10:00:00")) == _state(None, "12:00:00", outage=True)
+    assert timeline.next_change(_at("08:00:00")) == _at("12:00:00")
+
+
+def test_timeline_without_periods() -> None:
+    """An empty schedule has a single state without outages."""
+    timeline = StateTimeline(PeriodIndex(), _at("04:00:00"), HORIZON)
+
+    assert len(timeline) == 1
+    assert timeline.state_at(_at("12:00:00")) == _state(None, None, outage=False)
+    assert timeline.next_change(_at("04:00:00")) is None
+
+
+def test_diff_of_same_schedule_is_empty() -> None:
+    """A schedule compared with an equal one has no changes."""
+    diff = diff_periods(PERIODS, _index(*PERIODS_BOUNDS), _at("00:00:00"))
+
+    assert not diff
+    assert diff == PeriodsDiff()
+
+
+@pytest.mark.parametrize(
+    ("old", "new", "added", "removed", "shifted"),
+    [
+        pytest.param(
+            [("08:00:00", "10:00:00")],
+            [("08:00:00", "10:00:00"), ("14:00:00", "15:00:00")],
+            [("14:00:00", "15:00:00")],
+            [],
+            [],
+            id="added",
+        ),
+        pytest.param(
+            [("08:00:00", "10:00:00"), ("14:00:00", "15:00:00")],
+            [("14:00:00", "15:00:00")],
+            [],
+            [("08:00:00", "10:00:00")],
+            [],
+            id="removed",
+        ),
+        pytest.param(
+            [("08:00:00", "10:00:00"), ("14:00:00", "15:00:00")],
+            [("08:30:00", "10:30:00"), ("14:00:00", "15:00:00")],
+            [],
+            [],
+            [(("08:00:00", "10:00:00"), ("08:30:00", "10:30:00"))],
+            id="shifted",
+        ),
+        pytest.param(
+            [("08:00:00", "10:00:00"), ("14:00:00", "15:00:00")],
+            [("06:00:00", "07:00:00"), ("09:00:00", "11:00:00")],
+            [("06:00:00", "07:00:00")],
+            [("14:00:00", "15:00:00")],
+            [(("08:00:00", "10:00:00"), ("09:00:00", "11:00:00"))],
+            id="mixed",
+        ),
+    ],
+)
+def test_diff_periods(
+    old: list[tuple[str, str]],
+    new: list[tuple[str, str]],
+    added: list[tuple[str, str]],
+    removed: list[tuple[str, str]],
+    shifted: list[tuple[tuple[str, str], tuple[str, str]]],
+) -> None:
+    """Periods are matched in order and classified by how they changed."""
+    diff = diff_periods(_index(*old), _index(*new), _at("00:00:00"))
+
+    assert diff.added == tuple(_index(*added))
+    assert diff.removed == tuple(_index(*removed))
+    assert diff.shifted == tuple(
+        (_index(before)[0], _index(after)[0]) for before, after in shifted
+    )
+    assert diff
+
+
+def test_diff_ignores_periods_ended_before_since() -> None:
+    """Outages that ended before the cutoff are not reported as removed."""
+    old = _index(
+        ("01:00:00", "02:00:00"),
+        ("03:00:00", "04:00:00"),
+        ("05:00:00", "06:00:00"),
+    )
+    new = _index(("05:00:00", "06:00:00"))
+
+    assert not diff_periods(old, new, _at("04:00:00"))
+    assert diff_periods(old, new, _at("03:59:59")).removed == (old[1],)
+
+
+def test_diff_as_dict() -> None:
+    """The diff serializes to ISO formatted times for event data."""
+    diff = diff_periods(
+        _index(("08:00:00", "10:00:00"), ("14:00:00", "15:00:00")),
+        _index(("06:00:00", "07:00:00"), ("09:00:00", "11:00:00")),
+        _at("00:00:00"),
+    )
+
+    assert diff.as_dict() == {
+        "added": [
+            {"start": "2026-10-18T06:00:00+03:00", "end": "2026-10-18T07:00:00+03:00"}
+        ],
+        "removed": [
+            {"start": "2026-10-18T14:00:00+03:00", "end": "2026-10-18T15:00:00+03:00"}
+        ],
+        "shifted": [
+            {
+                "old": {
+                    "start": "2026-10-18T08:00:00+03:00",
+                    "end": "2026-10-18T10:00:00+03:00",
+                },
+                "new": {
+                    "start": "2026-10-18T09:00:00+03:00",
+                    "end": "2026-10-18T11:00:00+03:00",
+                },
+            }
+        ],
+    }
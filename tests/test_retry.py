@@ -0,0 +1,182 @@
+"""Tests of retries, the circuit breaker and revalidation of the client."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from custom_components.energyua import api, breaker
+from custom_components.energyua.api import (
+    EnergyUAApiClient,
+    EnergyUAApiClientCircuitOpenError,
+    EnergyUAApiClientCommunicationError,
+    EnergyUAApiClientTransientError,
+)
+from custom_components.energyua.breaker import EnergyUACircuitBreaker
+
+from .conftest import GROUP_PAGE, FakeSite, group_page, make_client
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+PAGE = group_page([("08:00", "10:00")])
+
+
+class Clock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry immediately instead of waiting."""
+    monkeypatch.setattr(api, "RETRY_BACKOFF", 0)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """Control the time the circuit breaker sees."""
+    fake = Clock()
+    monkeypatch.setattr(breaker, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+async def guarded_client(site: FakeSite) -> AsyncIterator[EnergyUAApiClient]:
+    """Create a client whose breaker opens after two failed fetches."""
+    api_client = make_client(
+        site,
+        circuit_breaker=EnergyUACircuitBreaker(
+            threshold=2, cooldown=timedelta(minutes=5)
+        ),
+    )
+    yield api_client
+    await api_client.async_close()
+
+
+def failing_then_ok(failures: int, status: int) -> web.RequestHandler:
+    """Answer with an error status a number of times, then with the page."""
+    remaining = [failures]
+
+    async def handler(_request: web.Request) -> web.StreamResponse:
+        if remaining[0]:
+            remaining[0] -= 1
+            return web.Response(status=status)
+        return web.Response(text=PAGE, content_type="text/html")
+
+    return handler
+
+
+async def test_retries_server_errors(site: FakeSite, client: EnergyUAApiClient) -> None:
+    """A 5xx answer is retried until the page is served."""
+    site.route(GROUP_PAGE, failing_then_ok(api.FETCH_ATTEMPTS - 1, 503))
+
+    assert await client.fetch_periods()
+    assert site.count(GROUP_PAGE) == api.FETCH_ATTEMPTS
+    assert len(client.periods) == 1
+
+
+async def test_gives_up_after_all_attempts(
+    site: FakeSite, client: EnergyUAApiClient
+) -> None:
+    """The last transient error is raised once every attempt failed."""
+    site.route(GROUP_PAGE, failing_then_ok(api.FETCH_ATTEMPTS, 500))
+
+    with pytest.raises(EnergyUAApiClientTransientError):
+        await client.fetch_periods()
+    assert site.count(GROUP_PAGE) == api.FETCH_ATTEMPTS
+
+
+async def test_retries_timeouts(
+    site: FakeSite, client: EnergyUAApiClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A request that times out is retried."""
+    monkeypatch.setattr(api, "REQUEST_TIMEOUT", aiohttp.ClientTimeout(total=0.05))
+    calls = 0
+
+    async def slow_once(_request: web.Request) -> web.StreamResponse:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1)
+        return web.Response(text=PAGE, content_type="text/html")
+
+    site.route(GROUP_PAGE, slow_once)
+
+    assert await client.fetch_periods()
+    assert calls == 2
+
+
+async def test_does_not_retry_client_errors(
+    site: FakeSite, client: EnergyUAApiClient
+) -> None:
+    """A 4xx answer fails right away."""
+    site.route(GROUP_PAGE, failing_then_ok(1, 404))
+
+    with pytest.raises(EnergyUAApiClientCommunicationError):
+        await client.fetch_periods()
+    assert site.count(GROUP_PAGE) == 1
+
+
+async def test_breaker_opens_and_half_opens(
+    site: FakeSite, guarded_client: EnergyUAApiClient, clock: Clock
+) -> None:
+    """The breaker opens at the threshold and lets one trial through later."""
+    site.route(GROUP_PAGE, failing_then_ok(3 * api.FETCH_ATTEMPTS, 500))
+
+    for _ in range(2):
+        with pytest.raises(EnergyUAApiClientTransientError):
+            await guarded_client.fetch_periods()
+    assert site.count(GROUP_PAGE) == 2 * api.FETCH_ATTEMPTS
+
+    clock.now += 60
+    with pytest.raises(EnergyUAApiClientCircuitOpenError):
+        await guarded_client.fetch_periods()
+    assert site.count(GROUP_PAGE) == 2 * api.FETCH_ATTEMPTS
+
+    clock.now += 300
+    with pytest.raises(EnergyUAApiClientTransientError):
+        await guarded_client.fetch_periods()
+    assert site.count(GROUP_PAGE) == 3 * api.FETCH_ATTEMPTS
+
+    with pytest.raises(EnergyUAApiClientCircuitOpenError):
+        await guarded_client.fetch_periods()
+
+    clock.now += 300
+    assert await guarded_client.fetch_periods()
+    assert site.count(GROUP_PAGE) == 3 * api.FETCH_ATTEMPTS + 1
+
+    site.route(GROUP_PAGE, failing_then_ok(api.FETCH_ATTEMPTS, 500))
+    with pytest.raises(EnergyUAApiClientTransientError):
+        await guarded_client.fetch_periods()
+    assert await guarded_client.fetch_periods() is False
+
+
+async def test_not_modified_keeps_periods(
+    site: FakeSite, client: EnergyUAApiClient
+) -> None:
+    """A 304 answer to a revalidation keeps the periods parsed before."""
+    site.page(GROUP_PAGE, PAGE, etag='"v1"')
+
+    assert await client.fetch_periods()
+    periods = client.periods
+
+    assert await client.fetch_periods() is False
+    assert client.periods is periods
+    assert not client.last_diff
+    assert [request.headers.get("If-None-Match") for request in site.requests] == [
+        None,
+        '"v1"',
+    ]
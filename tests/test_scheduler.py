@@ -0,0 +1,159 @@
+"""Tests of the shared transition scheduler."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.energyua import scheduler as scheduler_module
+from custom_components.energyua.scheduler import async_get_transition_scheduler
+
+from .conftest import mock_site, setup_entry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+    from datetime import datetime
+
+    import pytest
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+
+class Recorder:
+    """Record which keys ran and when."""
+
+    def __init__(self) -> None:
+        """Initialize without runs."""
+        self.runs: list[tuple[Hashable, datetime]] = []
+
+    def action(self, key: Hashable) -> Callable[[datetime], None]:
+        """Get an action recording a run of the key."""
+        return lambda now: self.runs.append((key, now))
+
+
+async def fire(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, at: datetime
+) -> None:
+    """Move the clock to a time and run the timers due by then."""
+    freezer.move_to(at)
+    async_fire_time_changed(hass, at)
+    await hass.async_block_till_done()
+
+
+async def test_due_updates_run_on_one_wakeup(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Updates due at the same instant share a single timer and wake-up."""
+    scheduler = async_get_transition_scheduler(hass)
+    recorder = Recorder()
+    start = dt_util.utcnow()
+    due = start + timedelta(minutes=5)
+    later = start + timedelta(minutes=10)
+
+    with patch.object(
+        scheduler_module,
+        "async_track_point_in_utc_time",
+        wraps=scheduler_module.async_track_point_in_utc_time,
+    ) as track:
+        for key in ("a", "b", "c"):
+            scheduler.async_schedule(key, due, recorder.action(key))
+        scheduler.async_schedule("d", later, recorder.action("d"))
+        assert track.call_count == 1
+
+        await fire(hass, freezer, due)
+
+    assert sorted(key for key, _ in recorder.runs) == ["a", "b", "c"]
+    assert len({now for _, now in recorder.runs}) == 1
+    assert len(scheduler) == 1
+    assert track.call_count == 2
+
+    await fire(hass, freezer, later)
+    assert [key for key, _ in recorder.runs[3:]] == ["d"]
+    assert len(scheduler) == 0
+
+
+async def test_reschedule_and_cancel_skip_old_entries(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Replaced and cancelled updates never run and are compacted away."""
+    scheduler = async_get_transition_scheduler(hass)
+    recorder = Recorder()
+    start = dt_util.utcnow()
+
+    for minutes in range(200, 0, -1):
+        scheduler.async_schedule(
+            "moved", start + timedelta(minutes=minutes), recorder.action("moved")
+        )
+    for i in range(50):
+        scheduler.async_schedule(
+            i, start + timedelta(hours=5, minutes=i), recorder.action(i)
+        )
+    for i in range(49):
+        scheduler.async_cancel(i)
+
+    assert len(scheduler) == 2
+    assert len(scheduler._heap) <= 2 * len(scheduler) + 16
+
+    await fire(hass, freezer, start + timedelta(hours=6))
+
+    assert [key for key, _ in recorder.runs] == ["moved", 49]
+    assert len(scheduler) == 0
+    assert scheduler._unsub_wakeup is None
+
+
+async def test_failing_update_does_not_stop_the_timer(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """An update raising is logged, and the others and later ones still run."""
+    scheduler = async_get_transition_scheduler(hass)
+    recorder = Recorder()
+    start = dt_util.utcnow()
+    due = start + timedelta(minutes=5)
+
+    def fail(_now: datetime) -> None:
+        msg = "broken update"
+        raise RuntimeError(msg)
+
+    scheduler.async_schedule("failing", due, fail)
+    scheduler.async_schedule("same time", due, recorder.action("same time"))
+    scheduler.async_schedule(
+        "later", due + timedelta(minutes=5), recorder.action("later")
+    )
+
+    await fire(hass, freezer, due)
+    assert "Error running scheduled update" in caplog.text
+    assert [key for key, _ in recorder.runs] == ["same time"]
+    assert scheduler._unsub_wakeup is not None
+
+    await fire(hass, freezer, due + timedelta(minutes=5))
+    assert [key for key, _ in recorder.runs] == ["same time", "later"]
+
+
+async def test_unload_clears_entry_keys(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Unloading an entry cancels its state and countdown updates."""
+    freezer.move_to("2026-10-18 09:00:00+03:00")
+    mock_site(aioclient_mock, [("10:00", "12:00")])
+    entry = await setup_entry(hass)
+    scheduler = async_get_transition_scheduler(hass)
+    assert {key for key in scheduler._due if key[0] == entry.entry_id} == {
+        (entry.entry_id, "state"),
+        (entry.entry_id, "countdown"),
+    }
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    assert len(scheduler) == 0
+    assert scheduler._unsub_wakeup is None
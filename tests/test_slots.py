@@ -0,0 +1,126 @@
+"""Tests of the outage slot bitmaps."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from custom_components.energyua.api import UKRAINE_TZ
+from custom_components.energyua.periods import Period, PeriodIndex
+from custom_components.energyua.slots import SlotMap, outage_seconds
+
+SLOT = 900
+SIZE = 96
+START = datetime(2026, 10, 18, tzinfo=UKRAINE_TZ)
+
+
+def _ts(hours: float, start: datetime = START) -> int:
+    return int((start + timedelta(hours=hours)).timestamp())
+
+
+def _periods(*bounds: tuple[float, float], start: datetime = START) -> PeriodIndex:
+    return PeriodIndex(
+        Period(_ts(begin, start), _ts(end, start), UKRAINE_TZ) for begin, end in bounds
+    )
+
+
+def _map(*bounds: tuple[float, float]) -> SlotMap:
+    return SlotMap.from_periods(_periods(*bounds), _ts(0), SLOT, SIZE)
+
+
+def test_from_periods_marks_overlapping_slots() -> None:
+    """Slots partly covered by an outage are marked, periods outside are not."""
+    slots = SlotMap.from_periods(
+        _periods((-2, -1), (1.1, 1.5), (23.5, 25)), _ts(0), SLOT, SIZE
+    )
+
+    assert slots.bits == (0b11 << 4) | (0b11 << 94)
+    assert slots.count() == 4
+
+
+def test_union_intersection_and_difference() -> None:
+    """Set operations combine the outages of two groups slot by slot."""
+    first = _map((10, 12))
+    second = _map((11, 13))
+
+    assert (first | second).to_periods(UKRAINE_TZ) == _periods((10, 13))
+    assert (first & second).to_periods(UKRAINE_TZ) == _periods((11, 12))
+    assert (first - second).to_periods(UKRAINE_TZ) == _periods((10, 11))
+    assert (~first).to_periods(UKRAINE_TZ) == _periods((0, 10), (12, 24))
+    assert not first & _map((14, 15))
+
+
+def test_maps_of_different_windows_do_not_combine() -> None:
+    """Combining maps of different windows is an error."""
+    later = SlotMap.from_periods(_periods((10, 12)), _ts(1), SLOT, SIZE)
+
+    with pytest.raises(ValueError, match="different windows"):
+        _ = _map((10, 12)) | later
+    assert _map((10, 12)) != later
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        [],
+        [(0, 24)],
+        [(0, 0.25)],
+        [(23.75, 24)],
+        [(8, 10), (10.25, 11), (14, 15.5)],
+    ],
+)
+def test_to_periods_round_trips(bounds: list[tuple[float, float]]) -> None:
+    """Slot-aligned periods come back unchanged, including at window edges."""
+    periods = _periods(*bounds)
+
+    assert (
+        SlotMap.from_periods(periods, _ts(0), SLOT, SIZE).to_periods(UKRAINE_TZ)
+        == periods
+    )
+
+
+def test_to_periods_merges_touching_runs() -> None:
+    """Outages touching each other become one period."""
+    assert _map((8, 10), (10, 11)).to_periods(UKRAINE_TZ) == _periods((8, 11))
+
+
+def test_window_across_daylight_saving_change() -> None:
+    """Slots count real seconds, so a 25 hour day keeps its last outages."""
+    midnight = datetime(2026, 10, 25, tzinfo=UKRAINE_TZ)
+    day = int(datetime(2026, 10, 26, tzinfo=UKRAINE_TZ).timestamp()) - int(
+        midnight.timestamp()
+    )
+    assert day == 25 * 3600
+
+    periods = PeriodIndex(
+        Period.from_datetimes(
+            datetime(2026, 10, 25, hour, tzinfo=UKRAINE_TZ),
+            datetime(2026, 10, 25, hour + 1, tzinfo=UKRAINE_TZ),
+        )
+        for hour in (2, 22)
+    )
+    slots = SlotMap.from_periods(periods, int(midnight.timestamp()), SLOT, day // SLOT)
+    combined = slots.to_periods(UKRAINE_TZ)
+
+    assert combined == periods
+    assert [period.end.isoformat() for period in combined] == [
+        "2026-10-25T03:00:00+03:00",
+        "2026-10-25T23:00:00+02:00",
+    ]
+
+
+def test_outage_seconds_split_at_slot_boundaries() -> None:
+    """Outages crossing slots are split between them, in whole seconds."""
+    periods = [
+        Period.from_datetimes(
+            START + timedelta(hours=1, minutes=40),
+            START + timedelta(hours=4, minutes=5, seconds=30),
+        ),
+        Period.from_datetimes(
+            START + timedelta(hours=5, minutes=50), START + timedelta(hours=7)
+        ),
+    ]
+
+    assert outage_seconds(periods, _ts(0), 3600, 6) == [0, 1200, 3600, 3600, 330, 600]
+    assert outage_seconds(periods, _ts(2), 3600, 2) == [3600, 3600]
@@ -0,0 +1,207 @@
+"""Tests of the import of outage minutes into long-term statistics."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.const import UnitOfTime
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.energyua import coordinator as coordinator_module
+from custom_components.energyua.api import UKRAINE_TZ
+from custom_components.energyua.const import (
+    CONF_OUTAGE_STATISTICS,
+    DOMAIN,
+    STATISTICS_IMPORT_DELAY,
+)
+from custom_components.energyua.scheduler import async_get_transition_scheduler
+
+from .conftest import mock_site, setup_entry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+STATISTIC_ID = f"{DOMAIN}:lviv_1_1_outages"
+TODAY = [("01:30", "02:15"), ("10:00", "12:00")]
+
+
+class Recorder:
+    """Stand-in for the recorder reading and adding statistics."""
+
+    def __init__(self) -> None:
+        """Initialize a recorder without statistics."""
+        self.last: dict[str, list[dict[str, Any]]] = {}
+        self.get_last_statistics = MagicMock(side_effect=lambda *_: self.last)
+        self.add_statistics = MagicMock()
+        self.instance = MagicMock()
+        self.instance.async_add_executor_job = AsyncMock(side_effect=self._run)
+        self.blocked: asyncio.Event | None = None
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.blocked is not None:
+            await self.blocked.wait()
+        return func(*args)
+
+    def imported(self, call: int = -1) -> list[tuple[str, float, float]]:
+        """Get the (local hour, minutes, sum) rows of an import."""
+        _, metadata, statistics = self.add_statistics.call_args_list[call].args
+        assert metadata["statistic_id"] == STATISTIC_ID
+        return [
+            (
+                row["start"].astimezone(UKRAINE_TZ).strftime("%H:%M"),
+                row["state"],
+                row["sum"],
+            )
+            for row in statistics
+        ]
+
+
+@pytest.fixture
+def recorder(hass: HomeAssistant) -> Iterator[Recorder]:
+    """Mock the recorder instance and the statistics functions."""
+    hass.config.components.add("recorder")
+    fake = Recorder()
+    with (
+        patch.object(coordinator_module, "get_instance", return_value=fake.instance),
+        patch.object(
+            coordinator_module, "get_last_statistics", fake.get_last_statistics
+        ),
+        patch.object(
+            coordinator_module, "async_add_external_statistics", fake.add_statistics
+        ),
+    ):
+        yield fake
+
+
+async def setup_statistics(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> MockConfigEntry:
+    """Set up an entry importing statistics and run its first import."""
+    freezer.move_to("2026-10-18 13:20:00+03:00")
+    mock_site(aioclient_mock, TODAY)
+    entry = await setup_entry(hass, **{CONF_OUTAGE_STATISTICS: True})
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_first_import_backfills_from_first_outage(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+    recorder: Recorder,
+) -> None:
+    """The first import covers every complete hour since the first outage."""
+    entry = await setup_statistics(hass, aioclient_mock, freezer)
+
+    assert recorder.get_last_statistics.call_args.args[1:] == (
+        1,
+        STATISTIC_ID,
+        True,
+        {"sum"},
+    )
+    metadata = recorder.add_statistics.call_args.args[1]
+    assert metadata["has_sum"]
+    assert not metadata["has_mean"]
+    assert metadata["source"] == DOMAIN
+    assert metadata["unit_of_measurement"] == UnitOfTime.MINUTES
+    assert recorder.imported() == [
+        ("01:00", 30, 30),
+        ("02:00", 15, 45),
+        *((f"{hour:02d}:00", 0, 45) for hour in range(3, 10)),
+        ("10:00", 60, 105),
+        ("11:00", 60, 165),
+        ("12:00", 0, 165),
+    ]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_import_continues_the_recorded_sum(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+    recorder: Recorder,
+) -> None:
+    """Imports start after the last recorded hour and carry its sum forward."""
+    last_hour = datetime(2026, 10, 18, 10, tzinfo=UKRAINE_TZ)
+    recorder.last = {
+        STATISTIC_ID: [{"start": last_hour.timestamp(), "sum": 500.0}],
+    }
+    entry = await setup_statistics(hass, aioclient_mock, freezer)
+
+    assert recorder.imported() == [("11:00", 60, 560), ("12:00", 0, 560)]
+
+    freezer.move_to(
+        datetime(2026, 10, 18, 14, tzinfo=UKRAINE_TZ) + STATISTICS_IMPORT_DELAY
+    )
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert recorder.get_last_statistics.call_count == 1
+    assert recorder.imported() == [("13:00", 0, 560)]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_import_is_not_rescheduled_when_cancelled(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+    recorder: Recorder,
+) -> None:
+    """Unloading during an import cancels it without scheduling the next."""
+    recorder.blocked = asyncio.Event()
+    freezer.move_to("2026-10-18 13:20:00+03:00")
+    mock_site(aioclient_mock, TODAY)
+    entry = await setup_entry(hass, **{CONF_OUTAGE_STATISTICS: True})
+    scheduler = async_get_transition_scheduler(hass)
+    key = (entry.entry_id, "statistics")
+
+    async_fire_time_changed(hass)
+    await asyncio.sleep(0)
+    assert recorder.instance.async_add_executor_job.await_count == 1
+    assert key not in scheduler._due
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert key not in scheduler._due
+    recorder.add_statistics.assert_not_called()
+
+
+async def test_failed_import_is_retried_next_hour(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+    recorder: Recorder,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """An import that fails is logged and the next one is still scheduled."""
+    recorder.get_last_statistics.side_effect = RuntimeError("database is locked")
+    entry = await setup_statistics(hass, aioclient_mock, freezer)
+
+    assert "Error importing outage statistics" in caplog.text
+    recorder.add_statistics.assert_not_called()
+    scheduler = async_get_transition_scheduler(hass)
+    assert (
+        scheduler._due[(entry.entry_id, "statistics")][0]
+        == (
+            datetime(2026, 10, 18, 14, tzinfo=UKRAINE_TZ) + STATISTICS_IMPORT_DELAY
+        ).timestamp()
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)